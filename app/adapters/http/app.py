@@ -1,18 +1,40 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 import uuid
 
 from app.adapters.http.routes import router as api_router
+from app.adapters.http.deps import close_job_store, get_job_compactor, get_model_preloader, get_executors
 from app.core.logging import setup_logging
 
 from app.adapters.http.middleware.auth import AuthMiddleware
 from app.adapters.http.middleware.rate_limit import RateLimitMiddleware
 from app.adapters.http.middleware.payload_guard import PayloadGuardMiddleware
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Loads in the background; /ready stays 503 until required models are warm
+    preloader = get_model_preloader()
+    preloader.start()
+    compactor = get_job_compactor()
+    if compactor is not None:
+        compactor.start()
+    yield
+    preloader.stop()
+    # Let queued and background (async job) work finish instead of dropping it
+    for executor in get_executors().values():
+        executor.shutdown(wait=True)
+    if compactor is not None:
+        compactor.stop()
+    # Jobs finished while draining must reach the database
+    close_job_store()
+
 def create_app() -> FastAPI:
     setup_logging()
     app = FastAPI(
         title="Inference Engine",
         version="0.1.0",
+        lifespan=lifespan,
     )
     
     @app.middleware("http")
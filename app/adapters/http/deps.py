@@ -1,22 +1,77 @@
+import atexit
 from functools import lru_cache
 
 from app.domain.registry import ModelRegistry
 from app.services import PredictionService, AsyncInferenceService
 from app.execution import InferenceExecutor
 from app.services.routing_service import RoutingService
-from app.config.routing import ROUTES
-from app.execution.execution_policy import ExecutionPolicy
-from app.config.execution import EXECUTION_POLICY, DEFAULT_EXECUTOR
+from app.config.routing import ROUTES, LOAD_TRACKING, SHADOW
+from app.execution.execution_policy import ExecutionPolicy, pool_names
+from app.config.execution import EXECUTORS, EXECUTION_POLICY, DEFAULT_EXECUTOR, BATCHING_POLICY
+from app.execution.process_executor import ProcessInferenceExecutor
+from app.execution.batching import BatchingPolicy
+from app.config.jobs import JOB_STORE
+from app.config.serialization import SERIALIZATION
+from app.config.models import MODEL_PRELOAD, MODEL_MEMORY, MODEL_LOADING
+from app.config.caching import RESULT_CACHE, SINGLE_FLIGHT
+from app.services.result_cache import ResultCache
+from app.services.single_flight import SingleFlight
+from app.services.load_tracker import LoadTracker
+from app.services.shadow_traffic import ShadowMirror
+from app.core.codecs import get_codec
 from app.infra.jobs.sqlite_job_store import SQLiteJobStore
+from app.infra.jobs.write_behind_job_store import WriteBehindJobStore
+from app.infra.jobs.in_memory_job_store import InMemoryJobStore
+from app.infra.jobs.compaction import JobCompactor
+from app.infra.jobs.blob_store import BlobStore
+from app.domain.jobs import JobStore
 from app.services.job_service import JobService
+from app.services.model_preloader import ModelPreloader
+from app.services.model_reloader import ModelReloader
+from app.core.lifecycle import Readiness
 
-_job_store = SQLiteJobStore()
-_job_service = JobService(_job_store)
+# Per-process resources are created on first use, never at import, so a
+# pre-fork parent (app/adapters/http/server.py) can import this module without opening
+# database handles or starting threads its workers would inherit
+
+# Once-per-deployment background work (job compaction) runs in this process;
+# the pre-fork server leaves it to a single worker
+_run_singletons = True
+
+# Set in pre-forked workers, whose registries are separate copies of the
+# parent's: runtime reloads are refused there (see ModelReloader)
+_forked = False
+
+@lru_cache
+def get_sqlite_job_store() -> SQLiteJobStore:
+    return SQLiteJobStore(
+        JOB_STORE["db_path"],
+        blob_store=BlobStore(**JOB_STORE["blobs"]) if JOB_STORE.get("blobs") is not None else None,
+        codec=get_codec(SERIALIZATION["job_store"]),
+        **JOB_STORE.get("sqlite", {}),
+    )
+
+@lru_cache
+def get_job_store() -> JobStore:
+    store = get_sqlite_job_store()
+    if JOB_STORE.get("write_behind") is not None:
+        store = WriteBehindJobStore(store, **JOB_STORE["write_behind"])
+        # Don't drop the last flush interval on a clean shutdown
+        atexit.register(store.close)
+    return store
 
 @lru_cache
 def get_registry() -> ModelRegistry:
     # One Registry per process
-    return ModelRegistry()
+    models = MODEL_MEMORY.get("models", {})
+    return ModelRegistry(
+        memory_budget_bytes=MODEL_MEMORY.get("budget_bytes"),
+        footprints={key: spec["bytes"] for key, spec in models.items() if "bytes" in spec},
+        default_footprint_bytes=MODEL_MEMORY.get("default_bytes", 0),
+        pinned=[key for key, spec in models.items() if spec.get("pinned", False)],
+        load_retry_backoff_s=MODEL_LOADING.get("retry_backoff_s", 1.0),
+        load_retry_max_backoff_s=MODEL_LOADING.get("retry_max_backoff_s", 60.0),
+    )
 
 @lru_cache
 def get_executor() -> InferenceExecutor:
@@ -28,35 +83,192 @@ def get_prediction_service() -> PredictionService:
     routing_service=get_routing_service()
     execution_policy = get_execution_policy()
     job_service = get_job_service()
-    return PredictionService(registry, executor, routing_service, execution_policy, job_service)
+    batching_policy = get_batching_policy()
+    return PredictionService(
+        registry,
+        executor,
+        routing_service,
+        execution_policy,
+        job_service,
+        batching_policy,
+        result_cache=get_result_cache(),
+        cache_hits_create_jobs=RESULT_CACHE.get("create_jobs_on_hit", False),
+        single_flight=get_single_flight(),
+        load_tracker=get_load_tracker(),
+        shadow_mirror=get_shadow_mirror(),
+    )
+
+@lru_cache
+def get_single_flight() -> SingleFlight | None:
+    # Shared by every PredictionService so duplicates meet across requests
+    if not SINGLE_FLIGHT.get("enabled", False):
+        return None
+    return SingleFlight(models=SINGLE_FLIGHT.get("models", ()))
+
+@lru_cache
+def get_result_cache() -> ResultCache | None:
+    if not RESULT_CACHE.get("models"):
+        return None
+    cache = ResultCache(
+        policy=RESULT_CACHE["models"],
+        max_bytes=RESULT_CACHE["max_bytes"],
+        max_entry_bytes=RESULT_CACHE.get("max_entry_bytes"),
+    )
+    # A rebuilt pipeline may answer differently than the one that filled the cache
+    get_registry().add_load_listener(cache.invalidate)
+    return cache
 
 @lru_cache
 def get_async_service() -> AsyncInferenceService:
     return AsyncInferenceService(get_prediction_service())
 
+@lru_cache
+def get_load_tracker() -> LoadTracker:
+    return LoadTracker(**LOAD_TRACKING)
+
 @lru_cache
 def get_routing_service() -> RoutingService:
-    return RoutingService(ROUTES)
+    return RoutingService(
+        ROUTES,
+        execution_policy=get_execution_policy(),
+        load_tracker=get_load_tracker(),
+    )
 
 @lru_cache
-def get_cpu_executor():
-    return InferenceExecutor(device="cpu", max_workers=8)
+def get_shadow_mirror() -> ShadowMirror | None:
+    if not any(route["strategy"] == "shadow" for route in ROUTES.values()):
+        return None
+    return ShadowMirror(
+        get_registry(),
+        get_execution_policy(),
+        executor=get_executors()[SHADOW["executor"]],
+        timeout_s=SHADOW.get("timeout_s"),
+        report_samples=SHADOW.get("report_samples", 512),
+    )
 
 @lru_cache
-def get_gpu_executor():
-    return InferenceExecutor(device="gpu", max_workers=2)
+def get_executors() -> dict:
+    executors = {}
+    for name, config in EXECUTORS.items():
+        limits = {
+            "max_queue_depth": config.get("max_queue_depth"),
+            "max_queue_wait_s": config.get("max_queue_wait_s"),
+        }
+        if config.get("kind", "thread") == "process":
+            # Workers build the pipelines mapped to them once, at startup
+            preload = [
+                tuple(key.split(":", 1))
+                for key, target in EXECUTION_POLICY.items()
+                if name in pool_names(target)
+            ]
+            executors[name] = ProcessInferenceExecutor(
+                device=name,
+                max_workers=config["max_workers"],
+                preload=preload,
+                shm_min_bytes=config.get("shm_min_bytes"),
+                **limits,
+            )
+        else:
+            executors[name] = InferenceExecutor(device=name, max_workers=config["max_workers"], **limits)
+    return executors
 
 @lru_cache
 def get_execution_policy():
-    executors = {
-        "cpu": get_cpu_executor(),
-        "gpu": get_gpu_executor(),
-    }
     return ExecutionPolicy(
-        executors=executors,
+        executors=get_executors(),
         policy=EXECUTION_POLICY,
         default=DEFAULT_EXECUTOR,
     )
+
+@lru_cache
+def get_batching_policy() -> BatchingPolicy:
+    return BatchingPolicy(
+        execution_policy=get_execution_policy(),
+        policy=BATCHING_POLICY,
+    )
     
+@lru_cache
 def get_job_service() -> JobService:
-    return _job_service
\ No newline at end of file
+    return JobService(
+        get_job_store(),
+        ephemeral_store=(
+            InMemoryJobStore(**JOB_STORE["ephemeral"])
+            if JOB_STORE.get("ephemeral") is not None
+            else None
+        ),
+        persist_sync=JOB_STORE.get("persist_sync", ()),
+    )
+
+@lru_cache
+def get_job_compactor() -> JobCompactor | None:
+    if JOB_STORE.get("retention") is None or not _run_singletons:
+        return None
+    return JobCompactor(get_sqlite_job_store(), **JOB_STORE["retention"])
+
+@lru_cache
+def get_readiness() -> Readiness:
+    return Readiness()
+
+@lru_cache
+def get_model_preloader(in_process_only: bool = False) -> ModelPreloader:
+    return ModelPreloader(
+        get_registry(),
+        get_execution_policy(),
+        models=MODEL_PRELOAD.get("models", {}),
+        readiness=get_readiness(),
+        max_parallel=MODEL_PRELOAD.get("max_parallel", 4),
+        in_process_only=in_process_only,
+    )
+
+@lru_cache
+def get_model_reloader() -> ModelReloader:
+    return ModelReloader(
+        get_registry(),
+        get_execution_policy(),
+        warmup={key: spec.get("warmup", []) for key, spec in MODEL_PRELOAD.get("models", {}).items()},
+        enabled=not _forked,
+    )
+
+def close_job_store() -> None:
+    """
+    Write out buffered job updates and close the database; part of shutdown,
+    since pre-fork workers exit without running atexit handlers
+    """
+    if not get_job_store.cache_info().currsize:
+        return  # never opened in this process
+    store = get_job_store()
+    if isinstance(store, WriteBehindJobStore):
+        store.close()
+    get_sqlite_job_store().close()
+
+def reset_after_fork(run_singletons: bool = True) -> None:
+    """
+    In a forked worker: drop per-process resources inherited from the parent
+    (DB connections, executor threads, flusher threads) so they are created
+    afresh on first use. The model registry is kept: its loaded pipelines are
+    shared with the parent copy-on-write.
+    run_singletons: whether this worker runs once-per-deployment background work
+    """
+    global _run_singletons, _forked
+    _run_singletons = run_singletons
+    _forked = True
+    for getter in (
+        get_sqlite_job_store,
+        get_job_store,
+        get_job_service,
+        get_job_compactor,
+        get_executor,
+        get_executors,
+        get_execution_policy,
+        get_batching_policy,
+        get_result_cache,
+        get_single_flight,
+        get_load_tracker,
+        get_routing_service,
+        get_shadow_mirror,
+        get_async_service,
+        get_readiness,
+        get_model_preloader,
+        get_model_reloader,
+    ):
+        getter.cache_clear()
@@ -6,8 +6,8 @@ from app.security.auth import authenticate
 
 class AuthMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
-        # Public endpoints
-        if request.url.path in {"/health"}:
+        # Public endpoints (probed by orchestrators / load balancers)
+        if request.url.path in {"/health", "/ready"}:
             return await call_next(request)
         
         api_key = request.headers.get("X-API-Key")
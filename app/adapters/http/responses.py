@@ -0,0 +1,20 @@
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+from app.config.serialization import SERIALIZATION
+from app.core.codecs import get_codec
+
+_codec = get_codec(SERIALIZATION["http"])
+if _codec.binary:
+    raise ValueError(f"HTTP responses need a JSON codec, got '{_codec.name}'")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Encodes model output directly with the configured codec.
+    Returned from a route, it skips response_model validation of Any results.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return _codec.encode(content)
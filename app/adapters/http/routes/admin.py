@@ -0,0 +1,52 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Request, HTTPException, status
+
+from app.adapters.http.deps import get_model_reloader
+from app.adapters.http.schemas import ReloadModelRequest
+from app.domain.registry import ModelNotFoundError
+from app.services.model_reloader import ModelReloader, ReloadInProgressError, ReloadUnsupportedError
+from app.security.permissions import require_scope
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+def _require_admin(http_request: Request) -> None:
+    try:
+        require_scope(http_request.state.identity, "admin")
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+
+@router.post("/models/{model}/{version}/reload", status_code=status.HTTP_202_ACCEPTED)
+def reload_model(
+    model: str,
+    version: str,
+    http_request: Request,
+    request: Optional[ReloadModelRequest] = None,
+    reloader: ModelReloader = Depends(get_model_reloader),
+):
+    """
+    Build and warm (model, version) in the background, then swap it in;
+    requests keep being served by the current pipeline meanwhile
+    """
+    _require_admin(http_request)
+    try:
+        return reloader.reload(model, version, target=request.target if request else None)
+    except ModelNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ReloadInProgressError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ReloadUnsupportedError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+
+@router.get("/models/{model}/{version}/reload")
+def reload_status(
+    model: str,
+    version: str,
+    http_request: Request,
+    reloader: ModelReloader = Depends(get_model_reloader),
+):
+    _require_admin(http_request)
+    current = reloader.status(model, version)
+    if current is None:
+        raise HTTPException(status_code=404, detail="No reload started for this model")
+    return current
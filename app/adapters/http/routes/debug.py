@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, Request, HTTPException
 
-from app.adapters.http.deps import get_prediction_service
+from app.adapters.http.deps import get_prediction_service, get_shadow_mirror
 from app.services import PredictionService
+from app.services.shadow_traffic import ShadowMirror
 from app.security.permissions import require_scope
 
 router = APIRouter()
@@ -15,9 +16,26 @@ def loaded_models(
         require_scope(http_request.state.identity, "admin")
     except PermissionError as e:
         raise HTTPException(status_code=403, detail=str(e))
-    registry = service._registry
-    loaded = [
-        {"name": name, "version": version}
-        for (name, version) in registry._pipelines.keys()
-    ]
-    return {"loaded_models": loaded}
\ No newline at end of file
+    return {"loaded_models": service._registry.loaded()}
+
+@router.get("/debug/models/imports")
+def model_imports(
+    http_request: Request,
+    service: PredictionService = Depends(get_prediction_service),
+):
+    try:
+        require_scope(http_request.state.identity, "admin")
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    return {"definitions": service._registry.import_report()}
+
+@router.get("/debug/shadow")
+def shadow_report(
+    http_request: Request,
+    shadow_mirror: ShadowMirror | None = Depends(get_shadow_mirror),
+):
+    try:
+        require_scope(http_request.state.identity, "admin")
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    return {"comparisons": shadow_mirror.report() if shadow_mirror is not None else []}
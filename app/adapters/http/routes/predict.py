@@ -1,8 +1,11 @@
+import math
+
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 
 from app.adapters.http.schemas import PredictRequest, PredictResponse
-from app.services import PredictionError, PredictionService, InferenceExecutionError
+from app.services import PredictionError, PredictionService, InferenceExecutionError, ServiceOverloadedError
 from app.adapters.http.deps import get_prediction_service
+from app.adapters.http.responses import FastJSONResponse
 from app.security.permissions import require_scope
 
 router = APIRouter()
@@ -12,14 +15,14 @@ router = APIRouter()
     response_model=PredictResponse,
     status_code=status.HTTP_200_OK,
 )
-def predict(
+async def predict(
     request: PredictRequest,
     http_request: Request,
     service: PredictionService = Depends(get_prediction_service),
 ):
     require_scope(http_request.state.identity, "predict")
     try:
-        result = service.predict(
+        result = await service.predict_async(
             model_name=request.model,
             version = request.version,
             payload=request.data,
@@ -28,8 +31,16 @@ def predict(
             max_attempts=request.max_attempts,
             max_runtime_s=request.max_runtime_s,
             max_total_runtime_s=request.max_total_runtime_s,
+            bypass_cache=request.bypass_cache,
+        )
+        # response_model documents the shape; model output isn't re-validated
+        return FastJSONResponse({"result": result})
+    except ServiceOverloadedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(math.ceil(e.retry_after_s))},
         )
-        return PredictResponse(result=result)
     except InferenceExecutionError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,3 +1,5 @@
+import math
+
 from fastapi import APIRouter, Depends, Request, HTTPException
 from uuid import UUID
 
@@ -5,6 +7,7 @@ from app.adapters.http.schemas import PredictAsyncRequest, PredictAsyncResponse,
 from app.adapters.http.deps import get_async_service
 from app.security.permissions import require_scope
 from app.domain.jobs.job_state import JobStatus
+from app.services import ServiceOverloadedError
 
 router = APIRouter()
 
@@ -15,14 +18,21 @@ def submit_async(
     service = Depends(get_async_service),
 ):
     require_scope(http_request.state.identity, "predict")
-    job_id = service.submit(
-        model = request.model,
-        version = request.version,
-        payload = request.data,
-        max_attempts=request.max_attempts,
-        max_runtime_s=request.max_runtime_s,
-        max_total_runtime_s=request.max_total_runtime_s,
-    )
+    try:
+        job_id = service.submit(
+            model = request.model,
+            version = request.version,
+            payload = request.data,
+            max_attempts=request.max_attempts,
+            max_runtime_s=request.max_runtime_s,
+            max_total_runtime_s=request.max_total_runtime_s,
+        )
+    except ServiceOverloadedError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(math.ceil(e.retry_after_s))},
+        )
     
     return PredictAsyncResponse(job_id=str(job_id))
 
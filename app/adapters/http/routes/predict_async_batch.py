@@ -1,8 +1,11 @@
+import math
+
 from fastapi import APIRouter, Depends, Request, HTTPException
 
 from app.adapters.http.schemas import PredictAsyncBatchRequest, PredictAsyncResponse, PredictAsyncStatusResponse
 from app.adapters.http.deps import get_async_service
 from app.security.permissions import require_scope
+from app.services import ServiceOverloadedError
 
 router = APIRouter()
 
@@ -13,13 +16,20 @@ def submit_async_batch(
     service = Depends(get_async_service),
 ):
     require_scope(http_request.state.identity, "predict")
-    job_id = service.submit_batch(
-        model = request.model,
-        version = request.version,
-        payloads = request.items,
-        max_attempts=request.max_attempts,
-        max_runtime_s=request.max_runtime_s,
-        max_total_runtime_s=request.max_total_runtime_s,
-    )
+    try:
+        job_id = service.submit_batch(
+            model = request.model,
+            version = request.version,
+            payloads = request.items,
+            max_attempts=request.max_attempts,
+            max_runtime_s=request.max_runtime_s,
+            max_total_runtime_s=request.max_total_runtime_s,
+        )
+    except ServiceOverloadedError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(math.ceil(e.retry_after_s))},
+        )
     
     return PredictAsyncResponse(job_id = str(job_id))
\ No newline at end of file
@@ -1,21 +1,24 @@
+import math
+
 from fastapi import APIRouter, Depends, HTTPException, Request
 
 from app.adapters.http.schemas import PredictBatchResponse, PredictBatchRequest
 from app.adapters.http.deps import get_prediction_service
-from app.services.prediction_service import PredictionError, PredictionService, InferenceExecutionError
+from app.adapters.http.responses import FastJSONResponse
+from app.services.prediction_service import PredictionError, PredictionService, InferenceExecutionError, ServiceOverloadedError
 from app.security.permissions import require_scope
 
 router = APIRouter()
 
 @router.post("/predict/batch", response_model=PredictBatchResponse)
-def predict_batch(
+async def predict_batch(
     request: PredictBatchRequest,
     http_request: Request,
     service: PredictionService = Depends(get_prediction_service),
 ):
     try:
         require_scope(http_request.state.identity, "predict")
-        results = service.predict_batch(
+        results = await service.predict_batch_async(
             model_name=request.model,
             version=request.version,
             payloads=request.items,
@@ -23,10 +26,17 @@ def predict_batch(
             max_attempts=request.max_attempts,
             max_runtime_s=request.max_runtime_s,
             max_total_runtime_s=request.max_total_runtime_s,
+            bypass_cache=request.bypass_cache,
         )
         
-        return PredictBatchResponse(results=results)
+        return FastJSONResponse({"results": results})
     
+    except ServiceOverloadedError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(math.ceil(e.retry_after_s))},
+        )
     except InferenceExecutionError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except PredictionError as e:
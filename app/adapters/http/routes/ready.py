@@ -1,7 +1,14 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from starlette.responses import JSONResponse
+
+from app.adapters.http.deps import get_readiness
+from app.core.lifecycle import Readiness
 
 router = APIRouter()
 
 @router.get("/ready")
-def ready():
-    return {"status": "ready"}
\ No newline at end of file
+def ready(readiness: Readiness = Depends(get_readiness)):
+    if not readiness.ready:
+        # Load balancers stop routing here until required models are loaded and warm
+        return JSONResponse({"status": "not_ready", **readiness.status()}, status_code=503)
+    return {"status": "ready"}
@@ -1,4 +1,4 @@
-from .request import PredictRequest, PredictBatchRequest, PredictAsyncRequest, PredictAsyncBatchRequest
+from .request import PredictRequest, PredictBatchRequest, PredictAsyncRequest, PredictAsyncBatchRequest, ReloadModelRequest
 from .response import PredictResponse, PredictBatchResponse, PredictAsyncResponse, PredictAsyncStatusResponse
 
-__all__ = ['PredictRequest', 'PredictResponse', 'PredictBatchRequest', 'PredictBatchResponse', 'PredictAsyncRequest', 'PredictAsyncResponse', 'PredictAsyncStatusResponse', 'PredictAsyncBatchRequest']
\ No newline at end of file
+__all__ = ['PredictRequest', 'PredictResponse', 'PredictBatchRequest', 'PredictBatchResponse', 'PredictAsyncRequest', 'PredictAsyncResponse', 'PredictAsyncStatusResponse', 'PredictAsyncBatchRequest', 'ReloadModelRequest']
\ No newline at end of file
@@ -11,6 +11,9 @@ class PredictRequest(BaseModel):
     max_runtime_s: Optional[float] = None          # per-attempt budget
     max_total_runtime_s: Optional[float] = None    # across attempts
     
+    # Skip the result cache lookup (a fresh result still refreshes it)
+    bypass_cache: bool = False
+    
 class PredictBatchRequest(BaseModel):
     model: str
     version: Optional[str] = None
@@ -20,6 +23,8 @@ class PredictBatchRequest(BaseModel):
     max_runtime_s: Optional[float] = None
     max_total_runtime_s: Optional[float] = None
     
+    bypass_cache: bool = False
+    
 class PredictAsyncRequest(BaseModel):
     model: str
     version: Optional[str] = None
@@ -36,4 +41,9 @@ class PredictAsyncBatchRequest(BaseModel):
     
     max_attempts: Optional[int] = None
     max_runtime_s: Optional[float] = None
-    max_total_runtime_s: Optional[float] = None
\ No newline at end of file
+    max_total_runtime_s: Optional[float] = None
+
+class ReloadModelRequest(BaseModel):
+    # "module[:builder]" to register a new version or replace the definition;
+    # omitted: rebuild from the current definition (e.g. to pick up a new artifact)
+    target: Optional[str] = None
\ No newline at end of file
@@ -0,0 +1,197 @@
+import argparse
+import logging
+import os
+import signal
+import socket
+import time
+from typing import Dict
+
+import uvicorn
+
+from app.adapters.http import deps
+from app.adapters.http.app import app
+from app.config.server import SERVER
+from app.core.logging import setup_logging
+
+logger = logging.getLogger(__name__)
+
+
+class PreforkServer:
+    """
+    Binds the listening socket, forks `workers` uvicorn workers that accept
+    on it, and restarts workers that exit until asked to stop.
+
+    Per-process resources (DB connections, executors, background threads)
+    are recreated in each worker; the parent's loaded registry is shared.
+    Once-per-deployment background work runs in the worker of slot 0 only.
+    Models can't be reloaded or registered through the admin API here (each
+    worker would change only its own registry); restart the server instead.
+    """
+
+    def __init__(
+        self,
+        app,
+        host: str,
+        port: int,
+        workers: int,
+        backlog: int = 2048,
+        graceful_timeout_s: float = 30.0,
+        min_uptime_s: float = 10.0,
+        restart_backoff_s: float = 1.0,
+        restart_max_backoff_s: float = 30.0,
+    ):
+        self._app = app
+        self._host = host
+        self._port = port
+        self._workers = workers
+        self._backlog = backlog
+        self._graceful_timeout_s = graceful_timeout_s
+        self._min_uptime_s = min_uptime_s
+        self._restart_backoff_s = restart_backoff_s
+        self._restart_max_backoff_s = restart_max_backoff_s
+
+        self._sock: socket.socket | None = None
+        self._pids: Dict[int, int] = {}          # pid -> slot
+        self._started_at: Dict[int, float] = {}  # slot -> start time
+        self._crashes: Dict[int, int] = {}       # slot -> consecutive early exits
+        self._respawn_at: Dict[int, float] = {}  # slot -> when to start it again
+        self._stopping = False
+
+    def run(self) -> None:
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind((self._host, self._port))
+        self._sock.listen(self._backlog)
+        self._sock.set_inheritable(True)
+        logger.info("server_listening", extra={"host": self._host, "port": self._port, "workers": self._workers})
+
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        for slot in range(self._workers):
+            self._spawn(slot)
+        try:
+            self._supervise()
+        finally:
+            self._shutdown()
+            self._sock.close()
+
+    def _stop(self, signum, frame) -> None:
+        self._stopping = True
+
+    def _spawn(self, slot: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            self._serve(slot)  # never returns
+        self._pids[pid] = slot
+        self._started_at[slot] = time.monotonic()
+        logger.info("worker_started", extra={"pid": pid, "slot": slot})
+
+    def _serve(self, slot: int) -> None:
+        # Child: signal handling belongs to uvicorn now
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        code = 0
+        try:
+            deps.reset_after_fork(run_singletons=slot == 0)
+            config = uvicorn.Config(
+                self._app,
+                log_config=None,
+                timeout_graceful_shutdown=self._graceful_timeout_s,
+            )
+            uvicorn.Server(config).run(sockets=[self._sock])
+        except BaseException:
+            logger.exception("worker_failed", extra={"pid": os.getpid()})
+            code = 1
+        finally:
+            # Skip the parent's atexit handlers and cleanup; the app's
+            # lifespan has already flushed and closed this worker's job store
+            os._exit(code)
+
+    def _supervise(self) -> None:
+        while not self._stopping:
+            self._reap()
+            now = time.monotonic()
+            for slot, when in list(self._respawn_at.items()):
+                if when <= now:
+                    del self._respawn_at[slot]
+                    self._spawn(slot)
+            time.sleep(0.2)
+
+    def _reap(self) -> None:
+        while self._pids:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            slot = self._pids.pop(pid, None)
+            if slot is None or self._stopping:
+                continue
+            uptime = time.monotonic() - self._started_at[slot]
+            # Crash loops back off; a worker that ran for a while restarts at once
+            self._crashes[slot] = self._crashes.get(slot, 0) + 1 if uptime < self._min_uptime_s else 0
+            delay = 0.0
+            if self._crashes[slot]:
+                delay = min(
+                    self._restart_backoff_s * 2 ** (self._crashes[slot] - 1),
+                    self._restart_max_backoff_s,
+                )
+            logger.warning(
+                "worker_exited",
+                extra={"pid": pid, "slot": slot, "status": status, "uptime_s": uptime, "restart_in_s": delay},
+            )
+            self._respawn_at[slot] = time.monotonic() + delay
+
+    def _shutdown(self) -> None:
+        for pid in self._pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        # uvicorn drains in-flight requests within graceful_timeout_s; allow a little extra
+        deadline = time.monotonic() + self._graceful_timeout_s + 5
+        while self._pids and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.1)
+        for pid in self._pids:
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        self._pids.clear()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Run the inference engine with pre-forked workers")
+    parser.add_argument("--host", default=SERVER["host"])
+    parser.add_argument("--port", type=int, default=SERVER["port"])
+    parser.add_argument("--workers", type=int, default=SERVER["workers"])
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    start = time.time()
+    # Load and warm in-process models before forking so every worker inherits
+    # them copy-on-write; run() joins its threads, which workers must not inherit
+    deps.get_model_preloader(in_process_only=True).run()
+    for executor in deps.get_executors().values():
+        executor.shutdown(wait=True)
+    deps.reset_after_fork()
+    logger.info("registry_preloaded", extra={"latency_ms": (time.time() - start) * 1000})
+
+    PreforkServer(
+        app,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        backlog=SERVER.get("backlog", 2048),
+        graceful_timeout_s=SERVER.get("graceful_timeout_s", 30.0),
+        min_uptime_s=SERVER.get("min_uptime_s", 10.0),
+        restart_backoff_s=SERVER.get("restart_backoff_s", 1.0),
+        restart_max_backoff_s=SERVER.get("restart_max_backoff_s", 30.0),
+    ).run()
+
+
+if __name__ == "__main__":
+    main()
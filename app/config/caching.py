@@ -0,0 +1,25 @@
+RESULT_CACHE = {
+    # Total encoded size of cached results; least recently used entries go first
+    "max_bytes": 64 * 1024 * 1024,
+    # Results larger than this are never cached (default: max_bytes / 16)
+    "max_entry_bytes": None,
+    # Record a succeeded job for requests answered from the cache
+    "create_jobs_on_hit": False,
+    # model:version → result caching (opt-in, deterministic models only)
+    # Entries expire ttl_s after being stored and are dropped when the model is reloaded
+    "models": {
+        "echo:v1": {"ttl_s": 60},
+        # "classifier:v2": {"ttl_s": 300},
+    },
+}
+
+SINGLE_FLIGHT = {
+    # Concurrent identical requests (same model, version and payload) wait for
+    # the first one's execution and share its result or error, cached or not
+    # Each waiter still gives up after its own timeout (max_total_runtime_s, else timeout_s)
+    "enabled": False,
+    # model:version → coalesced (opt-in: only these pay for hashing the payload)
+    "models": [
+        # "echo:v1",
+    ],
+}
@@ -1,8 +1,42 @@
+EXECUTORS = {
+    # name → executor kind and size
+    # "thread": workers share the API process (I/O bound or GIL-releasing models)
+    # "process": one pipeline copy per worker process (GIL-holding Python code)
+    # max_queue_depth / max_queue_wait_s: admission control, rejected work → 503 + Retry-After
+    "cpu": {"kind": "thread", "max_workers": 8, "max_queue_depth": 64, "max_queue_wait_s": 2.0},
+    "gpu": {"kind": "thread", "max_workers": 2, "max_queue_depth": 16, "max_queue_wait_s": 2.0},
+    # Shadow traffic: low priority, a full queue drops mirrored requests
+    # Shadow versions run here, not on their model's executor; use "kind": "process"
+    # to keep shadowed isolated models out of the server process
+    "shadow": {"kind": "thread", "max_workers": 1, "max_queue_depth": 8, "max_queue_wait_s": 1.0},
+    # shm_min_bytes: buffer payloads/results at least this large go through shared memory
+    "cpu_process": {
+        "kind": "process",
+        "max_workers": 4,
+        "shm_min_bytes": 64 * 1024,
+        "max_queue_depth": 32,
+        "max_queue_wait_s": 2.0,
+    },
+}
+
 EXECUTION_POLICY = {
-    # model:version → executor
+    # model:version → executor, or a group of pools in order of affinity:
+    #   {"pools": ["gpu", "cpu"], "spill_queue_depth": 4}
+    # work spills from the first pool to the least queued other one once the
+    # first has spill_queue_depth executions waiting (or is saturated).
+    # Pools in one group must be of the same kind.
     "echo:v1": "gpu",
     "echo:v2": "cpu",        # later: gpu
     # "classifier:v2": "gpu",
+    # "reranker:v1": {"pools": ["gpu", "cpu"], "spill_queue_depth": 4},
+    # "tokenizer:v1": "cpu_process",
 }
 
 DEFAULT_EXECUTOR = "cpu"
+
+BATCHING_POLICY = {
+    # model:version → micro-batching for sync /predict (opt-in)
+    # Flush when max_batch_size requests are queued or the oldest has waited max_wait_ms
+    "echo:v2": {"max_batch_size": 16, "max_wait_ms": 5},
+    # "classifier:v2": {"max_batch_size": 64, "max_wait_ms": 10},
+}
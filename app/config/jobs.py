@@ -0,0 +1,36 @@
+JOB_STORE = {
+    "db_path": "app/instance/jobs.db",
+    # One connection per thread; WAL lets readers run alongside the writer
+    # synchronous=normal: in WAL mode only a power loss can drop the last commits
+    "sqlite": {"journal_mode": "wal", "synchronous": "normal", "busy_timeout_ms": 5000},
+    # Payloads/results whose JSON is at least min_bytes are stored once per content
+    # under root and loaded only when read; unreferenced blobs are swept by retention
+    # after grace_s. None → always inline
+    "blobs": {"root": "app/instance/blobs", "min_bytes": 64 * 1024, "grace_s": 3600},
+    # Buffer job state transitions in memory and write them in grouped transactions
+    # Flush every flush_interval_ms or once max_batch_size jobs are dirty
+    # None → write-through (one commit per transition)
+    "write_behind": {"flush_interval_ms": 5, "max_batch_size": 256},
+    # Sync /predict jobs return their result inline, so by default they only
+    # live in memory: at most max_jobs, each for ttl_s after its last update
+    # None → persist sync jobs like async ones
+    "ephemeral": {"max_jobs": 10_000, "ttl_s": 300},
+    # model:version whose sync jobs are persisted anyway
+    "persist_sync": [
+        # "classifier:v2",
+    ],
+    # Finished jobs are deleted once older than max_age_s ("kind:status", kind = sync | async,
+    # "*" = any finished status, a specific status wins); no rule → kept forever
+    # Deletes run every interval_s in chunks of chunk_size rows, then up to
+    # vacuum_pages free pages are returned to the file system (databases created
+    # before incremental vacuum: python -m app.infra.jobs.migrate --incremental-vacuum)
+    "retention": {
+        "interval_s": 60,
+        "chunk_size": 500,
+        "vacuum_pages": 1000,
+        "max_age_s": {
+            "sync:*": 60 * 60,
+            "async:*": 7 * 24 * 60 * 60,
+        },
+    },
+}
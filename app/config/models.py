@@ -0,0 +1,45 @@
+MODEL_PRELOAD = {
+    # Models loaded at startup, in parallel, before the first request needs them
+    "max_parallel": 4,
+    # model:version → preload options
+    # required: /ready reports not-ready until the model is loaded and warmed
+    # warmup: inputs run once through the pipeline after loading (first-call costs)
+    "models": {
+        "echo:v1": {"required": True, "warmup": [{"x": 0}]},
+        "echo:v2": {"required": True, "warmup": [{"x": 0}]},
+        # "classifier:v2": {"required": False, "warmup": []},
+    },
+}
+
+MODEL_MEMORY = {
+    # Loaded pipelines in the API process are unloaded least recently used
+    # first once their footprints add up to more than this (None = no limit)
+    "budget_bytes": None,
+    # Footprint of models that neither declare one below nor estimate their own
+    "default_bytes": 256 * 1024 * 1024,
+    # model:version → bytes: declared footprint, pinned: never unloaded
+    "models": {
+        "echo:v1": {"bytes": 1024 * 1024, "pinned": True},
+        "echo:v2": {"bytes": 1024 * 1024},
+    },
+}
+
+MODEL_LOADING = {
+    # After a failed load, callers get 503 + Retry-After until the next attempt;
+    # the wait doubles with every consecutive failure, up to the max
+    "retry_backoff_s": 1.0,
+    "retry_max_backoff_s": 60.0,
+}
+
+MODEL_DEFINITIONS = {
+    # model:version → "module" or "module:builder" (default builder: build_pipeline)
+    # Modules are imported when the model is first loaded, so frameworks of
+    # models this instance never serves are never imported
+    "manifest": {
+        "echo:v1": "app.domain.definitions.echo_v1",
+        "echo:v2": "app.domain.definitions.echo_v2",
+    },
+    # Installed packages can also register definitions as entry points in
+    # this group, named "model:version"; the manifest wins on conflicts
+    "entry_point_group": "inference_engine.models",
+}
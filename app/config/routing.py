@@ -15,9 +15,47 @@ ROUTES = {
         },
     },
 
+    # example load-aware: pick among equivalent versions by live load
+    # "least_loaded" scores queue depth + inflight, "latency_aware" also rolling p95
+    # weights override the strategy's defaults; traffic only moves when another
+    # version scores better by max(hysteresis * current score, min_switch_margin).
+    # Versions whose executor queue is full are skipped.
+    "embedder": {
+        "strategy": "least_loaded",
+        "versions": ["v1", "v2"],
+        "weights": {"queue_depth": 1.0, "inflight": 1.0, "p95_ms": 0.0},
+        "hysteresis": 0.2,
+        "min_switch_margin": 1.0,
+    },
+
+    # example shadow: all traffic served by primary; shadow_percent of routed
+    # requests are also replayed against shadow in the background to compare
+    # results and latency before canarying it (see SHADOW, /debug/shadow)
+    "ranker": {
+        "strategy": "shadow",
+        "primary": "v1",
+        "shadow": "v2",
+        "shadow_percent": 10,
+    },
+
     # example static
     "stable_model": {
         "strategy": "static",
         "version": "v3",
     },
 }
+
+LOAD_TRACKING = {
+    # Rolling window for the per-version p95 used by load-aware routes
+    "window_s": 30.0,
+    "max_samples": 512,
+}
+
+SHADOW = {
+    # Shadow runs go through this executor only (see EXECUTORS); keep it small
+    # so mirrored work is shed first under load
+    "executor": "shadow",
+    "timeout_s": 10.0,
+    # Recent comparisons kept per (model, primary, shadow) for the report
+    "report_samples": 512,
+}
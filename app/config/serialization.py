@@ -0,0 +1,8 @@
+SERIALIZATION = {
+    # Job payload/result encoding in the job store: json | orjson | msgpack
+    # auto → orjson if installed, else json; orjson/msgpack are optional packages
+    # Rows written with one JSON codec stay readable with the other
+    "job_store": "auto",
+    # Encoder for /predict and /predict/batch response bodies: json | orjson | auto
+    "http": "auto",
+}
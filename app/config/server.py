@@ -0,0 +1,17 @@
+SERVER = {
+    # Pre-fork server (python -m app.adapters.http.server): the parent loads and
+    # warms the registry once, then forks workers sharing one listening socket.
+    # The admin reload/register endpoint answers 501 in this mode: a change would
+    # reach only one worker, so restart the server to pick up new definitions
+    "host": "0.0.0.0",
+    "port": 8000,
+    "workers": 4,
+    "backlog": 2048,
+    # On SIGTERM/SIGINT workers get this long to finish in-flight requests
+    "graceful_timeout_s": 30.0,
+    # A worker that dies within min_uptime_s of starting is restarted after a
+    # backoff doubling from restart_backoff_s up to restart_max_backoff_s
+    "min_uptime_s": 10.0,
+    "restart_backoff_s": 1.0,
+    "restart_max_backoff_s": 30.0,
+}
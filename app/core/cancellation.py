@@ -0,0 +1,51 @@
+import threading
+from typing import Callable, List
+
+
+class ExecutionCancelledError(Exception):
+    pass
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation signal shared by a caller and the work it started.
+    Work checks it at safe points (e.g. between pipeline stages);
+    executors may register callbacks to stop work they can't reach.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+        self.reason: str | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str | None = None) -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Run callback on cancel (immediately if already cancelled)
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            message = "Execution cancelled"
+            if self.reason:
+                message += f": {self.reason}"
+            raise ExecutionCancelledError(message)
@@ -0,0 +1,105 @@
+import json
+from typing import Any, Dict, Type
+
+
+class CodecUnavailableError(RuntimeError):
+    pass
+
+
+class Codec:
+    """
+    Serializes JSON-like values to bytes and back.
+    Text codecs produce UTF-8 JSON and can read each other's output.
+    """
+    name: str = ""
+    binary: bool = False
+    media_type: str = "application/json"
+
+    def encode(self, value: Any) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, data: bytes | str | memoryview) -> Any:
+        raise NotImplementedError
+
+
+class JsonCodec(Codec):
+    name = "json"
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value).encode()
+
+    def decode(self, data: bytes | str | memoryview) -> Any:
+        # json can't parse a buffer
+        return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+class OrjsonCodec(Codec):
+    """
+    orjson: several times faster than json, also serializes NumPy arrays.
+    Non-str dict keys are written as strings, as json does.
+    """
+    name = "orjson"
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError as e:
+            raise CodecUnavailableError("Codec 'orjson' needs the orjson package") from e
+        self._orjson = orjson
+        self._options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def encode(self, value: Any) -> bytes:
+        return self._orjson.dumps(value, option=self._options)
+
+    def decode(self, data: bytes | str | memoryview) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgpackCodec(Codec):
+    """
+    MessagePack: compact binary encoding, for storage only
+    """
+    name = "msgpack"
+    binary = True
+    media_type = "application/msgpack"
+
+    def __init__(self):
+        try:
+            import msgpack
+        except ImportError as e:
+            raise CodecUnavailableError("Codec 'msgpack' needs the msgpack package") from e
+        self._msgpack = msgpack
+
+    def encode(self, value: Any) -> bytes:
+        return self._msgpack.packb(value, use_bin_type=True)
+
+    def decode(self, data: bytes | str | memoryview) -> Any:
+        # Model results may have int keys
+        return self._msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+_CODECS: Dict[str, Type[Codec]] = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgpackCodec.name: MsgpackCodec,
+}
+
+_instances: Dict[str, Codec] = {}
+
+
+def get_codec(name: str) -> Codec:
+    """
+    Codec by name; "auto" = fastest installed JSON codec
+    """
+    if name == "auto":
+        try:
+            return get_codec(OrjsonCodec.name)
+        except CodecUnavailableError:
+            return get_codec(JsonCodec.name)
+
+    codec = _instances.get(name)
+    if codec is None:
+        if name not in _CODECS:
+            raise ValueError(f"Unknown codec '{name}'")
+        codec = _instances[name] = _CODECS[name]()
+    return codec
@@ -0,0 +1,30 @@
+import hashlib
+import json
+from typing import Any
+
+
+def _canonical_default(value: Any) -> Any:
+    # Buffers (bytes, memoryview, NumPy arrays): hash layout and raw content
+    try:
+        view = memoryview(value)
+    except TypeError:
+        raise TypeError(f"Cannot hash payload value of type {type(value).__name__}") from None
+    dtype = str(getattr(value, "dtype", view.format))
+    return {"__buffer__": [dtype, list(view.shape), hashlib.sha256(view.tobytes()).hexdigest()]}
+
+
+def canonical_hash(value: Any) -> str:
+    """
+    Stable sha256 of a JSON-like value: equal payloads hash equal
+    regardless of dict key order.
+    Raises TypeError for values that have no canonical form.
+    """
+    text = json.dumps(
+        value,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        allow_nan=True,
+        default=_canonical_default,
+    )
+    return hashlib.sha256(text.encode()).hexdigest()
@@ -0,0 +1,38 @@
+import threading
+from typing import Dict, Set
+
+
+class Readiness:
+    """
+    Startup conditions that must hold before the instance takes traffic
+    (e.g. required models loaded and warmed). /ready reports on it.
+    """
+
+    def __init__(self):
+        self._pending: Set[str] = set()
+        self._failed: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def require(self, name: str) -> None:
+        with self._lock:
+            self._pending.add(name)
+
+    def mark_ready(self, name: str) -> None:
+        with self._lock:
+            self._pending.discard(name)
+            self._failed.pop(name, None)
+
+    def mark_failed(self, name: str, reason: str) -> None:
+        # Stays not-ready: a pod that can't serve a required model shouldn't get traffic
+        with self._lock:
+            self._pending.discard(name)
+            self._failed[name] = reason
+
+    @property
+    def ready(self) -> bool:
+        with self._lock:
+            return not self._pending and not self._failed
+
+    def status(self) -> dict:
+        with self._lock:
+            return {"pending": sorted(self._pending), "failed": dict(self._failed)}
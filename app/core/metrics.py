@@ -54,4 +54,394 @@ EXECUTOR_TIMEOUTS = Counter(
     "Total executor timeouts",
     ["device"],
     registry=REGISTRY,
-)
\ No newline at end of file
+)
+
+#Micro-batching
+
+MICRO_BATCH_SIZE = Histogram(
+    "micro_batch_size",
+    "Number of requests coalesced into one micro-batch",
+    ["model", "version"],
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+    registry=REGISTRY,
+)
+
+MICRO_BATCH_WAIT = Histogram(
+    "micro_batch_wait_seconds",
+    "Time a request waited for its micro-batch to be flushed",
+    ["model", "version"],
+    buckets=(0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1),
+    registry=REGISTRY,
+)
+
+
+#Shared memory transport
+
+SHARED_MEMORY_BYTES = Gauge(
+    "shared_memory_pool_bytes",
+    "Bytes of shared memory currently allocated by the API process",
+    registry=REGISTRY,
+)
+
+SHARED_MEMORY_TRANSFERS = Counter(
+    "shared_memory_transfers_total",
+    "Buffers passed to worker processes through shared memory",
+    ["direction"],
+    registry=REGISTRY,
+)
+
+
+#Admission control
+
+EXECUTOR_QUEUE_DEPTH = Gauge(
+    "executor_queue_depth",
+    "Admitted executions waiting for a worker",
+    ["device"],
+    registry=REGISTRY,
+)
+
+EXECUTOR_QUEUE_WAIT = Histogram(
+    "executor_queue_wait_seconds",
+    "Time executions spent queued before a worker picked them up",
+    ["device"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5),
+    registry=REGISTRY,
+)
+
+EXECUTOR_REJECTIONS = Counter(
+    "executor_rejections_total",
+    "Executions rejected by admission control",
+    ["device", "reason"],  # queue_full | queue_wait
+    registry=REGISTRY,
+)
+
+
+#Cancellation
+
+EXECUTOR_CANCELLED = Counter(
+    "executor_cancelled_total",
+    "Executions cancelled after a timeout or job cancel",
+    ["device", "state"],  # queued | running
+    registry=REGISTRY,
+)
+
+EXECUTOR_WORKER_RESTARTS = Counter(
+    "executor_worker_restarts_total",
+    "Worker process pools replaced to stop cancelled work",
+    ["device"],
+    registry=REGISTRY,
+)
+
+
+#Job persistence
+
+JOB_STORE_FLUSH_SIZE = Histogram(
+    "job_store_flush_size",
+    "Buffered jobs written per write-behind flush",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512),
+    registry=REGISTRY,
+)
+
+JOB_STORE_FLUSH_LATENCY = Histogram(
+    "job_store_flush_seconds",
+    "Duration of one write-behind flush transaction",
+    buckets=(0.0005, 0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+    registry=REGISTRY,
+)
+
+JOB_STORE_FLUSH_ERRORS = Counter(
+    "job_store_flush_errors_total",
+    "Write-behind flushes that failed and were retried",
+    registry=REGISTRY,
+)
+
+JOB_STORE_UNWRITABLE = Counter(
+    "job_store_unwritable_jobs_total",
+    "Buffered job states the backing store could not encode, by outcome (marked_failed, dropped)",
+    ["outcome"],
+    registry=REGISTRY,
+)
+
+JOB_STORE_DIRTY = Gauge(
+    "job_store_dirty_jobs",
+    "Jobs with state changes not yet written to the backing store",
+    registry=REGISTRY,
+)
+
+EPHEMERAL_JOBS = Gauge(
+    "ephemeral_jobs",
+    "Sync jobs currently held by the in-memory job store",
+    registry=REGISTRY,
+)
+
+EPHEMERAL_JOB_EVICTIONS = Counter(
+    "ephemeral_job_evictions_total",
+    "Jobs dropped from the in-memory job store",
+    ["reason"],  # capacity | ttl
+    registry=REGISTRY,
+)
+
+JOB_STORE_DELETED = Counter(
+    "job_store_deleted_total",
+    "Jobs deleted by retention",
+    ["kind", "status"],
+    registry=REGISTRY,
+)
+
+JOB_STORE_COMPACTION_LATENCY = Histogram(
+    "job_store_compaction_seconds",
+    "Duration of one retention and vacuum pass",
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30),
+    registry=REGISTRY,
+)
+
+JOB_STORE_SIZE = Gauge(
+    "job_store_size_bytes",
+    "Size of the job database file",
+    registry=REGISTRY,
+)
+
+JOB_BLOBS_WRITTEN = Counter(
+    "job_blobs_written_total",
+    "Large payloads/results written out of row (deduplicated writes excluded)",
+    registry=REGISTRY,
+)
+
+JOB_BLOB_LOADS = Counter(
+    "job_blob_loads_total",
+    "Out-of-row payloads/results loaded on access",
+    registry=REGISTRY,
+)
+
+JOB_BLOBS_SWEPT = Counter(
+    "job_blobs_swept_total",
+    "Unreferenced blobs deleted by retention",
+    registry=REGISTRY,
+)
+
+
+#Result cache
+
+RESULT_CACHE_REQUESTS = Counter(
+    "result_cache_requests_total",
+    "Result cache lookups",
+    ["model", "version", "outcome"],  # hit | miss | bypass
+    registry=REGISTRY,
+)
+
+RESULT_CACHE_EVICTIONS = Counter(
+    "result_cache_evictions_total",
+    "Entries dropped from the result cache",
+    ["reason"],  # capacity | ttl | invalidated
+    registry=REGISTRY,
+)
+
+RESULT_CACHE_BYTES = Gauge(
+    "result_cache_bytes",
+    "Estimated size of all cached results",
+    registry=REGISTRY,
+)
+
+#Single flight
+
+SINGLE_FLIGHT_COALESCED = Counter(
+    "single_flight_coalesced_total",
+    "Requests answered by an identical in-flight execution instead of running their own",
+    ["model", "version"],
+    registry=REGISTRY,
+)
+
+SINGLE_FLIGHT_INFLIGHT = Gauge(
+    "single_flight_inflight",
+    "Distinct requests currently executing under single flight",
+    registry=REGISTRY,
+)
+
+#Model loading
+
+MODEL_LOAD_LATENCY = Histogram(
+    "model_load_seconds",
+    "Time to build a pipeline (model.load() included)",
+    ["model", "version"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2, 5, 10, 30, 60, 120),
+    registry=REGISTRY,
+)
+
+MODEL_WARMUP_LATENCY = Histogram(
+    "model_warmup_seconds",
+    "Time to run a model's warmup inputs after loading",
+    ["model", "version"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2, 5, 10, 30, 60),
+    registry=REGISTRY,
+)
+
+MODEL_READY = Gauge(
+    "model_ready",
+    "1 once a preloaded model is loaded and warmed, 0 before or if it failed",
+    ["model", "version"],
+    registry=REGISTRY,
+)
+
+MODELS_LOADED = Gauge(
+    "models_loaded",
+    "Pipelines currently loaded in the API process",
+    registry=REGISTRY,
+)
+
+MODELS_RESIDENT_BYTES = Gauge(
+    "models_resident_bytes",
+    "Summed memory footprint of the loaded pipelines",
+    registry=REGISTRY,
+)
+
+MODEL_EVICTIONS = Counter(
+    "model_evictions_total",
+    "Pipelines unloaded from the registry",
+    ["model", "version", "reason"],  # budget | manual | swapped
+    registry=REGISTRY,
+)
+
+MODEL_LOAD_FAILURES = Counter(
+    "model_load_failures_total",
+    "Pipeline builds that raised; retried after a backoff",
+    ["model", "version"],
+    registry=REGISTRY,
+)
+
+MODEL_LOAD_WAITS = Counter(
+    "model_load_waits_total",
+    "Callers that waited for another caller's load instead of loading themselves",
+    ["model", "version"],
+    registry=REGISTRY,
+)
+
+MODEL_IMPORT_LATENCY = Histogram(
+    "model_definition_import_seconds",
+    "Time to import a model definition's module (and the frameworks it pulls in)",
+    ["model", "version"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.5, 1, 2, 5, 10, 30),
+    registry=REGISTRY,
+)
+
+#Hot reload
+
+MODEL_RELOADS = Counter(
+    "model_reloads_total",
+    "Admin-triggered model reloads / registrations",
+    ["model", "version", "outcome"],  # swapped | failed
+    registry=REGISTRY,
+)
+
+MODEL_RELOAD_LATENCY = Histogram(
+    "model_reload_seconds",
+    "Time to build and warm a replacement pipeline before it is swapped in",
+    ["model", "version"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2, 5, 10, 30, 60, 120, 300),
+    registry=REGISTRY,
+)
+
+MODEL_DRAIN_LATENCY = Histogram(
+    "model_drain_seconds",
+    "Time from swapping a pipeline out until its last in-flight request finished",
+    ["model", "version"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.5, 1, 2, 5, 10, 30, 60),
+    registry=REGISTRY,
+)
+
+#Model artifacts
+
+ARTIFACTS_MAPPED = Gauge(
+    "model_artifacts_mapped",
+    "Artifact files currently memory-mapped by this process",
+    registry=REGISTRY,
+)
+
+ARTIFACT_MAPPED_BYTES = Gauge(
+    "model_artifact_mapped_bytes",
+    "Size of the memory-mapped artifacts (shared page cache, not private memory)",
+    registry=REGISTRY,
+)
+
+ARTIFACT_MAP_LATENCY = Histogram(
+    "model_artifact_map_seconds",
+    "Time to open and map an artifact file (pages are read lazily afterwards)",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1),
+    registry=REGISTRY,
+)
+
+#Load-aware routing
+
+ROUTE_SWITCHES = Counter(
+    "route_switches_total",
+    "Load-aware routing moving a model's traffic to another version",
+    ["model", "from_version", "to_version"],
+    registry=REGISTRY,
+)
+
+ROUTE_SATURATED_SKIPS = Counter(
+    "route_saturated_skips_total",
+    "Routing decisions that passed over a version because its executor was saturated",
+    ["model", "version"],
+    registry=REGISTRY,
+)
+
+ROUTE_LOAD_SCORE = Gauge(
+    "route_load_score",
+    "Last computed load score per version (lower is preferred)",
+    ["model", "version"],
+    registry=REGISTRY,
+)
+
+#Shadow traffic
+
+SHADOW_REQUESTS = Counter(
+    "shadow_requests_total",
+    "Mirrored requests run against a shadow version, by comparison with the primary result",
+    ["model", "version", "outcome"],  # match | mismatch | incomparable | error
+    registry=REGISTRY,
+)
+
+SHADOW_LATENCY = Histogram(
+    "shadow_latency_seconds",
+    "Shadow version execution time (shadow executor queueing excluded)",
+    ["model", "version"],
+    buckets=(0.005, 0.01, 0.02, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10),
+    registry=REGISTRY,
+)
+
+SHADOW_DROPPED = Counter(
+    "shadow_dropped_total",
+    "Sampled requests not mirrored because executors were saturated",
+    ["model", "version", "reason"],  # saturated | busy | queue_full | queue_wait
+    registry=REGISTRY,
+)
+
+#Executor pools
+
+EXECUTOR_BUSY_WORKERS = Gauge(
+    "executor_busy_workers",
+    "Workers currently running an execution",
+    ["device"],
+    registry=REGISTRY,
+)
+
+EXECUTOR_UTILIZATION = Gauge(
+    "executor_utilization_ratio",
+    "Busy workers / pool size right now",
+    ["device"],
+    registry=REGISTRY,
+)
+
+EXECUTOR_BUSY_SECONDS = Counter(
+    "executor_busy_seconds_total",
+    "Worker time spent running executions; rate() / pool size = utilization",
+    ["device"],
+    registry=REGISTRY,
+)
+
+EXECUTOR_SPILLS = Counter(
+    "executor_spills_total",
+    "Executions an executor group sent to a pool other than its preferred one",
+    ["group", "from_device", "to_device"],
+    registry=REGISTRY,
+)
@@ -1,4 +1,3 @@
-from .echo_v1 import build_pipeline as build_v1
-from .echo_v2 import build_pipeline as build_v2
-
-__all__ = ['build_v1', 'build_v2']
\ No newline at end of file
+# Definitions are imported lazily by the registry's DefinitionCatalog (see
+# MODEL_DEFINITIONS in app/config/models.py); nothing is imported here
+__all__ = []
\ No newline at end of file
@@ -5,12 +5,15 @@ from app.domain.pipelines import InferencePipeline
 MODEL_NAME = "echo"
 MODEL_VERSION = "v2"
 
+# name -> path or file:// URI; mapped read-only by model.map_artifact() in load()
+ARTIFACTS = {}
+
 def build_pipeline() -> InferencePipeline:
     """
     Construct and return a fully loaded inference pipeline
     """
     
-    model = EchoModel()
+    model = EchoModel(artifacts=ARTIFACTS)
     model.load()
     
     return InferencePipeline(
@@ -1,5 +1,5 @@
-from .job import Job
+from .job import Deferred, Job
 from .job_state import JobStatus
 from .job_store import JobStore
 
-__all__ = ['Job', 'JobStatus', 'JobStore']
\ No newline at end of file
+__all__ = ['Deferred', 'Job', 'JobStatus', 'JobStore']
\ No newline at end of file
@@ -1,16 +1,60 @@
+import copy
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from uuid import UUID
 
 from app.domain.jobs.job_state import JobStatus
 
+_NO_DEFAULT = object()
+
+
+class Deferred:
+    """
+    Placeholder for a value that is only loaded when first read
+    (e.g. a large payload a store keeps out of row).
+    ref identifies the stored value so the store can write it back unloaded.
+    """
+    def __init__(self, loader: Callable[[], Any], ref: str):
+        self._loader = loader
+        self.ref = ref
+
+    def load(self) -> Any:
+        return self._loader()
+
+
+class _DeferredField:
+    """
+    Dataclass field that resolves a Deferred on first access and keeps the value
+    """
+    def __init__(self, default: Any = _NO_DEFAULT):
+        self._default = default
+
+    def __set_name__(self, owner, name: str) -> None:
+        self._name = name
+
+    def __get__(self, obj, owner=None) -> Any:
+        if obj is None:
+            # Read by @dataclass as the field default; AttributeError = no default
+            if self._default is _NO_DEFAULT:
+                raise AttributeError(self._name)
+            return self._default
+        value = obj.__dict__[self._name]
+        if isinstance(value, Deferred):
+            value = value.load()
+            obj.__dict__[self._name] = value
+        return value
+
+    def __set__(self, obj, value: Any) -> None:
+        obj.__dict__[self._name] = value
+
+
 @dataclass
 class Job:
     id: UUID
     model_name: str
     model_version: str
-    payload: Any
+    payload: Any = _DeferredField()
     
     status: JobStatus
     device: str
@@ -19,7 +63,7 @@ class Job:
     started_at: Optional[datetime] = None
     finished_at: Optional[datetime] = None
     
-    result: Optional[Any] = None 
+    result: Optional[Any] = _DeferredField(None)
     error_types: Optional[str] = None
     error_message: Optional[str] = None
     
@@ -30,4 +74,22 @@ class Job:
     
     max_runtime_s: float | None = None
     max_total_runtime_s: float | None = None
-    cancellable: bool = True
\ No newline at end of file
+    cancellable: bool = True
+    # Result went back inline (sync /predict); drives retention
+    sync: bool = False
+    
+    def raw(self, name: str) -> Any:
+        """
+        Field value without loading it (may be a Deferred)
+        """
+        return self.__dict__[name]
+    
+    def evolve(self, **changes) -> "Job":
+        """
+        Copy with changes applied; unlike dataclasses.replace,
+        deferred fields are carried over without being loaded
+        """
+        job = copy.copy(self)
+        for name, value in changes.items():
+            setattr(job, name, value)
+        return job
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 from datetime import datetime
 
 from app.domain.jobs.job import Job
@@ -29,4 +29,12 @@ class JobStore(ABC):
     
     @abstractmethod
     def update_retry_metadata(self, job_id: UUID, attempt_count: int, latest_attempt_at: datetime, last_retry_reason: Optional[str]) -> None:
-        ...
\ No newline at end of file
+        ...
+    
+    @abstractmethod
+    def save_many(self, jobs: Iterable[Job]) -> None:
+        """
+        Insert or update whole jobs in one transaction;
+        a finished job is never moved back to an unfinished state
+        """
+        ...
@@ -1,4 +1,5 @@
+from .artifacts import MappedArtifact, map_artifact
 from .base import BaseModel
 from .echo_model import EchoModel
 
-__all__ = ['BaseModel', 'EchoModel']
\ No newline at end of file
+__all__ = ['BaseModel', 'EchoModel', 'MappedArtifact', 'map_artifact']
\ No newline at end of file
@@ -0,0 +1,97 @@
+import mmap
+import os
+import threading
+import time
+from typing import Any, Dict, Tuple
+from urllib.parse import urlparse
+
+from app.core.metrics import ARTIFACTS_MAPPED, ARTIFACT_MAPPED_BYTES, ARTIFACT_MAP_LATENCY
+
+
+class MappedArtifact:
+    """
+    Read-only memory map of a model artifact file.
+
+    Pages are read from disk on first access and live in the OS page cache,
+    so every process mapping the same file (workers, forks) shares one copy.
+    Views handed out are read-only; copy them before modifying.
+    """
+
+    def __init__(self, path: str, file_key: Tuple, mapped: mmap.mmap):
+        self.path = path
+        self.size = len(mapped)
+        self._file_key = file_key
+        self._mmap = mapped
+
+    @property
+    def buffer(self) -> memoryview:
+        return memoryview(self._mmap)
+
+    def array(self, dtype: Any, shape: Tuple[int, ...] | None = None, offset: int = 0, count: int = -1) -> Any:
+        """
+        NumPy view over the mapped bytes (no copy)
+        """
+        import numpy
+
+        view = numpy.frombuffer(self._mmap, dtype=dtype, count=count, offset=offset)
+        return view.reshape(shape) if shape is not None else view
+
+    def close(self) -> None:
+        _release(self)
+
+
+# file identity -> (artifact, users); models sharing a file in one process share the map
+_mapped: Dict[Tuple, Tuple[MappedArtifact, int]] = {}
+_lock = threading.Lock()
+
+
+def _path(uri: str) -> str:
+    parsed = urlparse(uri)
+    if parsed.scheme in ("", "file"):
+        return os.path.realpath(parsed.path if parsed.scheme else uri)
+    raise ValueError(f"Unsupported artifact URI '{uri}' (expected a path or file:// URI)")
+
+
+def map_artifact(uri: str) -> MappedArtifact:
+    """
+    Map the artifact at uri (a path or file:// URI) read-only.
+    A file replaced on disk (new inode / mtime / size) is mapped anew.
+    """
+    path = _path(uri)
+    stat = os.stat(path)
+    file_key = (path, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    with _lock:
+        entry = _mapped.get(file_key)
+        if entry is not None:
+            _mapped[file_key] = (entry[0], entry[1] + 1)
+            return entry[0]
+
+        if not stat.st_size:
+            raise ValueError(f"Artifact '{uri}' is empty")
+        start = time.time()
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        artifact = MappedArtifact(path, file_key, mapped)
+        _mapped[file_key] = (artifact, 1)
+        ARTIFACT_MAP_LATENCY.observe(time.time() - start)
+        ARTIFACTS_MAPPED.set(len(_mapped))
+        ARTIFACT_MAPPED_BYTES.inc(artifact.size)
+        return artifact
+
+
+def _release(artifact: MappedArtifact) -> None:
+    with _lock:
+        entry = _mapped.get(artifact._file_key)
+        if entry is None or entry[0] is not artifact:
+            return
+        if entry[1] > 1:
+            _mapped[artifact._file_key] = (artifact, entry[1] - 1)
+            return
+        del _mapped[artifact._file_key]
+        ARTIFACTS_MAPPED.set(len(_mapped))
+        ARTIFACT_MAPPED_BYTES.dec(artifact.size)
+    try:
+        artifact._mmap.close()
+    except BufferError:
+        pass  # Views are still alive; the map is closed once they are collected
@@ -1,10 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from typing import Any, Dict, Iterable
+
+from app.domain.models.artifacts import MappedArtifact, map_artifact
 
 class BaseModel(ABC):
     """
     Pure inference model abstraction
     """
+    # Class-level defaults: subclasses may skip BaseModel.__init__
+    artifacts: Dict[str, str] = {}
+    _mapped: Dict[str, MappedArtifact] | None = None
+
+    def __init__(self, artifacts: Dict[str, str] | None = None):
+        # name -> path or file:// URI, declared by the model definition
+        self.artifacts = dict(artifacts or {})
+        self._mapped: Dict[str, MappedArtifact] = {}
+    
     @abstractmethod
     def load(self) -> None:
         """
@@ -13,6 +24,35 @@ class BaseModel(ABC):
         """
         raise NotImplementedError
     
+    def map_artifact(self, name: str) -> MappedArtifact:
+        """
+        Read-only memory map of a declared artifact, for use in load()
+        Weights read through it stay in the page cache, shared by all worker processes
+        """
+        if self._mapped is None:
+            self._mapped = {}
+        if name not in self._mapped:
+            self._mapped[name] = map_artifact(self.artifacts[name])
+        return self._mapped[name]
+    
+    def unload(self) -> None:
+        """
+        Release what load() acquired
+        Called when the registry drops the model; unmaps artifacts by default
+        """
+        if not self._mapped:
+            return
+        for artifact in self._mapped.values():
+            artifact.close()
+        self._mapped.clear()
+    
+    def memory_bytes(self) -> int | None:
+        """
+        Estimated resident size of the loaded model in bytes
+        None if unknown (the registry then uses the configured default)
+        """
+        return None
+    
     @abstractmethod
     def predict(self, x: Any) -> Any:
         """
@@ -22,7 +62,7 @@ class BaseModel(ABC):
     
     def predict_batch(self, xs: Iterable[Any]) -> list[Any]:
         """
-        Batch Inference 
-        Naive implementation for now
+        Batch Inference
+        Per-item fallback; override to run the whole batch in one call
         """
         return [self.predict(x) for x in xs]
\ No newline at end of file
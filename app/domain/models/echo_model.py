@@ -1,4 +1,4 @@
-from typing import Any 
+from typing import Any, Iterable
 
 from app.domain.models import BaseModel
 
@@ -12,4 +12,7 @@ class EchoModel(BaseModel):
     def predict(self, x: Any) -> Any:
         return {
             "echo": x
-        }
\ No newline at end of file
+        }
+    
+    def predict_batch(self, xs: Iterable[Any]) -> list[Any]:
+        return [{"echo": x} for x in xs]
\ No newline at end of file
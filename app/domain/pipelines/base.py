@@ -1,5 +1,6 @@
 from typing import Any 
 
+from app.core.cancellation import CancellationToken
 from app.domain.models import BaseModel
 from app.domain.processing import BasePreprocessor, BasePostprocessor
 
@@ -19,17 +20,40 @@ class InferencePipeline:
         self.model = model
         self.postprocessor = postprocessor
     
-    def run(self, raw_input: Any) -> Any:
+    def run(self, raw_input: Any, cancel_token: CancellationToken | None = None) -> Any:
         """
         Execute full inference pipeline
+        Stops between stages once cancel_token is cancelled
         """
         model_input = self.preprocessor.transform(raw_input)
+        self._checkpoint(cancel_token)
         model_output = self.model.predict(model_input)
+        self._checkpoint(cancel_token)
         return self.postprocessor.transform(model_output)
     
-    def run_batch(self, raw_inputs):
+    def run_batch(self, raw_inputs: list[Any], cancel_token: CancellationToken | None = None) -> list[Any]:
         """
-        Default batch behavior: fallback to sequential run
-        Models may override for optimized batching
+        Execute full inference pipeline on a batch
+        Each stage receives the whole batch; stages without a
+        vectorized implementation fall back to their per-item loop
         """
-        return [self.run(raw_input) for raw_input in raw_inputs]
\ No newline at end of file
+        raw_inputs = list(raw_inputs)
+        model_inputs = self._check_batch("preprocessor", self.preprocessor.transform_batch(raw_inputs), len(raw_inputs))
+        self._checkpoint(cancel_token)
+        model_outputs = self._check_batch("model", self.model.predict_batch(model_inputs), len(raw_inputs))
+        self._checkpoint(cancel_token)
+        return self._check_batch("postprocessor", self.postprocessor.transform_batch(model_outputs), len(raw_inputs))
+    
+    @staticmethod
+    def _checkpoint(cancel_token: CancellationToken | None) -> None:
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+    
+    @staticmethod
+    def _check_batch(stage: str, outputs: Any, expected: int) -> list[Any]:
+        outputs = list(outputs)
+        if len(outputs) != expected:
+            raise ValueError(
+                f"Batch {stage} returned {len(outputs)} items for {expected} inputs"
+            )
+        return outputs
\ No newline at end of file
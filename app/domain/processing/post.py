@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any 
+from typing import Any, Iterable
 
 class BasePostprocessor(ABC):
     """
@@ -9,6 +9,13 @@ class BasePostprocessor(ABC):
     def transform(self, model_output: Any) -> Any:
         raise NotImplementedError
     
+    def transform_batch(self, model_outputs: Iterable[Any]) -> list[Any]:
+        """
+        Batch transform
+        Per-item fallback; override for vectorized postprocessing
+        """
+        return [self.transform(model_output) for model_output in model_outputs]
+    
 class IdentityPostprocessor(BasePostprocessor):
     """
     No operation post processor
@@ -17,4 +24,7 @@ class IdentityPostprocessor(BasePostprocessor):
     
     def transform(self, model_output: Any) -> Any:
         return model_output 
+    
+    def transform_batch(self, model_outputs: Iterable[Any]) -> list[Any]:
+        return list(model_outputs)
 
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any 
+from typing import Any, Iterable
 
 class BasePreprocessor(ABC):
     """
@@ -10,6 +10,13 @@ class BasePreprocessor(ABC):
     def transform(self, raw_input: Any) -> Any:
         raise NotImplementedError
     
+    def transform_batch(self, raw_inputs: Iterable[Any]) -> list[Any]:
+        """
+        Batch transform
+        Per-item fallback; override for vectorized preprocessing
+        """
+        return [self.transform(raw_input) for raw_input in raw_inputs]
+    
 
 class IdentityPreprocessor(BasePreprocessor):
     """
@@ -18,4 +25,7 @@ class IdentityPreprocessor(BasePreprocessor):
     """
     
     def transform(self, raw_input: Any) -> Any:
-        return raw_input
\ No newline at end of file
+        return raw_input
+    
+    def transform_batch(self, raw_inputs: Iterable[Any]) -> list[Any]:
+        return list(raw_inputs)
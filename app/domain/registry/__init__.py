@@ -1,3 +1,4 @@
-from .registry import ModelRegistry, ModelNotFoundError
+from .registry import ModelRegistry, ModelNotFoundError, ModelLoadError
+from .catalog import DefinitionCatalog
 
-__all__ = ['ModelRegistry', 'ModelNotFoundError']
\ No newline at end of file
+__all__ = ['ModelRegistry', 'ModelNotFoundError', 'ModelLoadError', 'DefinitionCatalog']
\ No newline at end of file
@@ -0,0 +1,137 @@
+import importlib
+import logging
+import sys
+import threading
+import time
+from collections.abc import Mapping
+from importlib.metadata import entry_points
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from app.core.metrics import MODEL_IMPORT_LATENCY
+from app.domain.pipelines import InferencePipeline
+
+logger = logging.getLogger(__name__)
+
+Builder = Callable[[], InferencePipeline]
+
+DEFAULT_BUILDER = "build_pipeline"
+
+
+class DefinitionCatalog(Mapping):
+    """
+    (model_name, version) -> pipeline builder, where each builder's module
+    is imported the first time it is looked up, not when the catalog is built.
+
+    Sources, later ones winning:
+      - installed packages' entry points in entry_point_group,
+        named "model:version", e.g. `"classifier:v2" = "pkg.models.classifier_v2"`
+      - manifest: {"model:version": "module" or "module:builder"}
+    The builder attribute defaults to build_pipeline.
+    """
+
+    def __init__(self, manifest: Dict[str, str], entry_point_group: str | None = None):
+        self._targets: Dict[Tuple[str, str], str] = {}
+        if entry_point_group is not None:
+            for ep in entry_points(group=entry_point_group):
+                self._targets[self._key(ep.name)] = ep.value
+        for name, target in manifest.items():
+            self._targets[self._key(name)] = target
+
+        self._builders: Dict[Tuple[str, str], Builder] = {}
+        self._imports: Dict[Tuple[str, str], dict] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name: str) -> Tuple[str, str]:
+        model_name, _, version = name.partition(":")
+        if not model_name or not version:
+            raise ValueError(f"Model definition '{name}' must be named 'model:version'")
+        return model_name, version
+
+    def __getitem__(self, key: Tuple[str, str]) -> Builder:
+        builder = self._builders.get(key)
+        if builder is not None:
+            return builder
+        target = self._targets[key]  # KeyError for unknown models, like a dict
+
+        with self._lock:
+            if key not in self._builders:
+                self._builders[key] = self._import(key, target)
+            return self._builders[key]
+
+    def __setitem__(self, key: Tuple[str, str], builder: Builder) -> None:
+        # Register an already imported builder
+        with self._lock:
+            self._targets[key] = f"{builder.__module__}:{builder.__qualname__}"
+            self._builders[key] = builder
+
+    def resolve(self, key: Tuple[str, str], target: str) -> Builder:
+        """
+        Import target's builder for key without registering it
+        """
+        with self._lock:
+            return self._import(key, target)
+
+    def register(self, key: Tuple[str, str], target: str, builder: Builder | None = None) -> None:
+        """
+        Add or replace a definition; imported on next lookup unless builder is given
+        """
+        with self._lock:
+            self._targets[key] = target
+            if builder is not None:
+                self._builders[key] = builder
+            else:
+                self._builders.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        # Membership must not import the definition
+        return key in self._targets
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        return iter(list(self._targets))
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def _import(self, key: Tuple[str, str], target: str) -> Builder:
+        # Caller holds self._lock
+        module_name, _, attr = target.partition(":")
+        modules_before = len(sys.modules)
+        start = time.time()
+        module = importlib.import_module(module_name)
+        builder = getattr(module, attr or DEFAULT_BUILDER)
+        elapsed = time.time() - start
+
+        MODEL_IMPORT_LATENCY.labels(*key).observe(elapsed)
+        self._imports[key] = {
+            "import_s": elapsed,
+            # Approximate: other threads may import at the same time
+            "new_modules": len(sys.modules) - modules_before,
+        }
+        logger.info(
+            "model_definition_imported",
+            extra={
+                "model": key[0],
+                "version": key[1],
+                "target": target,
+                "import_ms": elapsed * 1000,
+                "new_modules": self._imports[key]["new_modules"],
+            },
+        )
+        return builder
+
+    def import_report(self) -> List[dict]:
+        """
+        Every known definition, whether its module was imported yet and what that cost
+        """
+        with self._lock:
+            return [
+                {
+                    "name": name,
+                    "version": version,
+                    "target": target,
+                    "imported": (name, version) in self._builders,
+                    **self._imports.get((name, version), {}),
+                }
+                for (name, version), target in self._targets.items()
+            ]
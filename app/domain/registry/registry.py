@@ -1,37 +1,384 @@
-from typing import Dict, Tuple, List
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, Tuple, List
 
+from app.core.metrics import (
+    MODEL_LOAD_LATENCY,
+    MODEL_LOAD_FAILURES,
+    MODEL_LOAD_WAITS,
+    MODEL_EVICTIONS,
+    MODEL_DRAIN_LATENCY,
+    MODELS_LOADED,
+    MODELS_RESIDENT_BYTES,
+)
+from app.config.models import MODEL_DEFINITIONS
 from app.domain.pipelines import InferencePipeline
-from app.domain.definitions import echo_v1, echo_v2
+from app.domain.registry.catalog import DefinitionCatalog
+
+logger = logging.getLogger(__name__)
 
 class ModelNotFoundError(Exception):
     pass
 
+class ModelLoadError(Exception):
+    """
+    Building the pipeline failed; the next load is attempted after retry_after_s
+    """
+    def __init__(self, message: str, retry_after_s: float):
+        super().__init__(message)
+        self.retry_after_s = retry_after_s
+
 class ModelRegistry:
     """
     Resolves (model_name, version) -> InferencePipeline
     with lazy loading and in-memory caching
+
+    Definitions default to the configured catalog, whose modules are only
+    imported when their model is first loaded.
+
+    Each pipeline is built by one caller while concurrent callers wait for it.
+    After a failed load, callers fail fast until an exponential backoff passes.
+
+    With a memory budget, least recently used pipelines are unloaded once
+    the loaded footprints exceed it. Pinned and leased pipelines are never
+    unloaded; use lease() around work that runs a pipeline.
+
+    swap() replaces a loaded pipeline atomically: new leases get the new one,
+    the old one is unloaded once the leases taken before the swap are released.
     """
-    
-    def __init__(self):
-        self._pipelines: Dict[Tuple[str, str], InferencePipeline] = {}
-        self._definitions = {
-            (echo_v1.MODEL_NAME, echo_v1.MODEL_VERSION): echo_v1.build_pipeline,
-            (echo_v2.MODEL_NAME, echo_v2.MODEL_VERSION): echo_v2.build_pipeline
-        }
-    
+
+    def __init__(
+        self,
+        definitions: DefinitionCatalog | None = None,
+        memory_budget_bytes: int | None = None,
+        footprints: Dict[str, int] | None = None,
+        default_footprint_bytes: int = 0,
+        pinned: Iterable[str] = (),
+        load_retry_backoff_s: float = 1.0,
+        load_retry_max_backoff_s: float = 60.0,
+    ):
+        # Least recently used first
+        self._pipelines: "OrderedDict[Tuple[str, str], InferencePipeline]" = OrderedDict()
+        self._definitions = definitions if definitions is not None else DefinitionCatalog(
+            MODEL_DEFINITIONS["manifest"],
+            entry_point_group=MODEL_DEFINITIONS.get("entry_point_group"),
+        )
+        self._load_listeners: List[Callable[[str, str], None]] = []
+
+        self._memory_budget_bytes = memory_budget_bytes
+        self._footprints = footprints or {}  # "model:version" -> declared bytes
+        self._default_footprint_bytes = default_footprint_bytes
+        self._pinned = set(pinned)
+        self._sizes: Dict[Tuple[str, str], int] = {}
+        # id(pipeline) -> active leases; per instance, so swapped-out ones drain
+        self._leases: Dict[int, int] = {}
+        # id(pipeline) -> (key, pipeline, size, swapped out at) for replaced, still leased pipelines
+        self._draining: Dict[int, Tuple[Tuple[str, str], InferencePipeline, int, float]] = {}
+        self._resident_bytes = 0
+
+        self._load_retry_backoff_s = load_retry_backoff_s
+        self._load_retry_max_backoff_s = load_retry_max_backoff_s
+        self._loading: Dict[Tuple[str, str], Future] = {}
+        # key -> (consecutive failures, next attempt at, last error message)
+        self._load_failures: Dict[Tuple[str, str], Tuple[int, float, str]] = {}
+        self._lock = threading.Lock()
+
     def get(self, model_name: str, version: str) -> InferencePipeline:
+        """
+        Pipeline for (model_name, version), loading it if needed.
+        Without a lease it may be unloaded at any time after this returns.
+        """
+        key = (model_name, version)
+        with self._lock:
+            pipeline = self._pipelines.get(key)
+            if pipeline is not None:
+                self._pipelines.move_to_end(key)
+                return pipeline
+
+        self.ensure_exists(model_name, version)
+
+        with self._lock:
+            # Loaded while we checked, or a load is already running: share it
+            pipeline = self._pipelines.get(key)
+            if pipeline is not None:
+                return pipeline
+            loading = self._loading.get(key)
+            if loading is None:
+                self._raise_if_backing_off(key)
+                loading = self._loading[key] = Future()
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            MODEL_LOAD_WAITS.labels(model_name, version).inc()
+            return loading.result()
+
+        try:
+            pipeline = self._build(key)
+        except Exception as e:
+            error = self._load_failed(key, e)
+            loading.set_exception(error)
+            raise error from e
+        except BaseException as e:
+            with self._lock:
+                del self._loading[key]
+            loading.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._loading[key]
+            self._load_failures.pop(key, None)
+            if key in self._pipelines:
+                # swap() installed one meanwhile; it wins
+                loading.set_result(self._pipelines[key])
+                return self._pipelines[key]
+            self._pipelines[key] = pipeline
+            self._sizes[key] = self._footprint(key, pipeline)
+            self._resident_bytes += self._sizes[key]
+            evicted = self._evict_over_budget(keep=key)
+        loading.set_result(pipeline)
+        self._unload_all(evicted, "budget")
+
+        self.notify_loaded(model_name, version)
+        return pipeline
+
+    def _build(self, key: Tuple[str, str], target: str | None = None) -> InferencePipeline:
+        builder = self._definitions.resolve(key, target) if target is not None else self._definitions[key]
+        start = time.time()
+        pipeline = builder()
+        MODEL_LOAD_LATENCY.labels(*key).observe(time.time() - start)
+        return pipeline
+
+    def build(self, model_name: str, version: str, target: str | None = None) -> InferencePipeline:
+        """
+        Build a fresh pipeline without installing it (see swap()).
+        target ("module[:builder]") overrides the registered definition.
+        """
+        if target is None:
+            self.ensure_exists(model_name, version)
+        return self._build((model_name, version), target)
+
+    def register(self, model_name: str, version: str, target: str) -> None:
+        """
+        Add or replace the definition of (model_name, version); nothing is loaded
+        """
+        self._definitions.register((model_name, version), target)
+
+    def swap(self, model_name: str, version: str, pipeline: InferencePipeline, target: str | None = None) -> None:
+        """
+        Install pipeline for (model_name, version), replacing the loaded one
+        if any. The old pipeline is unloaded once its in-flight leases drain.
+        With target, later (re)loads build from that definition too.
+        """
         key = (model_name, version)
-        if key in self._pipelines:
-            return self._pipelines[key]
-        
-        if key not in self._definitions:
+        size = self._footprint(key, pipeline)
+        retired = []
+        with self._lock:
+            old = self._pipelines.get(key)
+            if old is not None:
+                old_size = self._sizes[key]
+                if self._leases.get(id(old)):
+                    # Still counted against the budget until it has drained
+                    self._draining[id(old)] = (key, old, old_size, time.monotonic())
+                else:
+                    self._resident_bytes -= old_size
+                    retired.append((key, old))
+            self._pipelines[key] = pipeline
+            self._pipelines.move_to_end(key)
+            self._sizes[key] = size
+            self._resident_bytes += size
+            self._load_failures.pop(key, None)
+            evicted = self._evict_over_budget(keep=key)
+        if target is not None:
+            self._definitions.register(key, target)
+        self._unload_all(retired, "swapped")
+        self._unload_all(evicted, "budget")
+
+        self.notify_loaded(model_name, version)
+
+    def _raise_if_backing_off(self, key: Tuple[str, str]) -> None:
+        # Caller holds self._lock
+        failure = self._load_failures.get(key)
+        if failure is not None and failure[1] > time.monotonic():
+            raise ModelLoadError(
+                f"Model '{key[0]}' with version '{key[1]}' failed to load: {failure[2]}",
+                retry_after_s=failure[1] - time.monotonic(),
+            )
+
+    def _load_failed(self, key: Tuple[str, str], e: Exception) -> ModelLoadError:
+        MODEL_LOAD_FAILURES.labels(*key).inc()
+        logger.exception("model_load_failed", extra={"model": key[0], "version": key[1]})
+        with self._lock:
+            del self._loading[key]
+            failures = self._load_failures.get(key, (0, 0.0, ""))[0] + 1
+            backoff_s = min(
+                self._load_retry_backoff_s * 2 ** (failures - 1),
+                self._load_retry_max_backoff_s,
+            )
+            message = f"{type(e).__name__}: {e}"
+            self._load_failures[key] = (failures, time.monotonic() + backoff_s, message)
+        return ModelLoadError(
+            f"Model '{key[0]}' with version '{key[1]}' failed to load: {message}",
+            retry_after_s=backoff_s,
+        )
+
+    @contextmanager
+    def lease(self, model_name: str, version: str) -> Iterator[InferencePipeline]:
+        """
+        Use a pipeline without it being unloaded underneath
+        """
+        pipeline = self._acquire(model_name, version)
+        try:
+            yield pipeline
+        finally:
+            self._release(pipeline)
+
+    def _acquire(self, model_name: str, version: str) -> InferencePipeline:
+        key = (model_name, version)
+        while True:
+            pipeline = self.get(model_name, version)
+            with self._lock:
+                # Unloaded between get() and here: load it again
+                if self._pipelines.get(key) is pipeline:
+                    self._leases[id(pipeline)] = self._leases.get(id(pipeline), 0) + 1
+                    return pipeline
+
+    def _release(self, pipeline: InferencePipeline) -> None:
+        drained = []
+        with self._lock:
+            self._leases[id(pipeline)] -= 1
+            if not self._leases[id(pipeline)]:
+                del self._leases[id(pipeline)]
+                entry = self._draining.pop(id(pipeline), None)
+                if entry is not None:
+                    # Last request on a swapped-out pipeline finished
+                    key, _, size, swapped_at = entry
+                    self._resident_bytes -= size
+                    MODEL_DRAIN_LATENCY.labels(*key).observe(time.monotonic() - swapped_at)
+                    drained.append((key, pipeline))
+            # Pipelines skipped while leased may be unloadable now
+            evicted = self._evict_over_budget()
+        self._unload_all(drained, "swapped")
+        self._unload_all(evicted, "budget")
+
+    def unload(self, model_name: str, version: str) -> bool:
+        """
+        Unload a pipeline now, pinned or not.
+        Returns False if it isn't loaded or is in use.
+        """
+        key = (model_name, version)
+        with self._lock:
+            if key not in self._pipelines or self._leases.get(id(self._pipelines[key])):
+                return False
+            evicted = [(key, self._remove(key))]
+        self._unload_all(evicted, "manual")
+        return True
+
+    def loaded(self) -> List[dict]:
+        """
+        Loaded pipelines, least recently used first, then swapped-out ones still draining
+        """
+        with self._lock:
+            current = [
+                {
+                    "name": name,
+                    "version": version,
+                    "bytes": self._sizes[(name, version)],
+                    "pinned": f"{name}:{version}" in self._pinned,
+                    "leases": self._leases.get(id(pipeline), 0),
+                    "draining": False,
+                }
+                for (name, version), pipeline in self._pipelines.items()
+            ]
+            draining = [
+                {
+                    "name": name,
+                    "version": version,
+                    "bytes": size,
+                    "pinned": False,
+                    "leases": self._leases.get(pipeline_id, 0),
+                    "draining": True,
+                }
+                for pipeline_id, ((name, version), _, size, _) in self._draining.items()
+            ]
+        return current + draining
+
+    def _footprint(self, key: Tuple[str, str], pipeline: InferencePipeline) -> int:
+        # Declared in config > estimated by the model > default
+        declared = self._footprints.get(f"{key[0]}:{key[1]}")
+        if declared is not None:
+            return declared
+        estimated = pipeline.model.memory_bytes()
+        if estimated is not None:
+            return estimated
+        return self._default_footprint_bytes
+
+    def _evict_over_budget(self, keep: Tuple[str, str] | None = None) -> List[Tuple[Tuple[str, str], InferencePipeline]]:
+        # Caller holds self._lock; the caller unloads what's returned outside it
+        evicted = []
+        if self._memory_budget_bytes is not None:
+            for key in list(self._pipelines):
+                if self._resident_bytes <= self._memory_budget_bytes:
+                    break
+                if key == keep or f"{key[0]}:{key[1]}" in self._pinned or self._leases.get(id(self._pipelines[key])):
+                    continue
+                evicted.append((key, self._remove(key)))
+        MODELS_LOADED.set(len(self._pipelines))
+        MODELS_RESIDENT_BYTES.set(self._resident_bytes)
+        return evicted
+
+    def _remove(self, key: Tuple[str, str]) -> InferencePipeline:
+        # Caller holds self._lock
+        pipeline = self._pipelines.pop(key)
+        self._resident_bytes -= self._sizes.pop(key)
+        MODELS_LOADED.set(len(self._pipelines))
+        MODELS_RESIDENT_BYTES.set(self._resident_bytes)
+        return pipeline
+
+    def _unload_all(self, evicted: List[Tuple[Tuple[str, str], InferencePipeline]], reason: str) -> None:
+        for (model_name, version), pipeline in evicted:
+            MODEL_EVICTIONS.labels(model_name, version, reason).inc()
+            try:
+                pipeline.model.unload()
+            except Exception:
+                logger.exception("model_unload_failed", extra={"model": model_name, "version": version})
+            logger.info("model_unloaded", extra={"model": model_name, "version": version, "reason": reason})
+
+    def add_load_listener(self, listener: Callable[[str, str], None]) -> None:
+        """
+        Call listener(model_name, version) whenever a pipeline is (re)built,
+        e.g. to drop results computed by a previous instance
+        """
+        self._load_listeners.append(listener)
+
+    def notify_loaded(self, model_name: str, version: str) -> None:
+        """
+        Run the load listeners; also for pipelines rebuilt outside this
+        registry, e.g. in process workers
+        """
+        for listener in self._load_listeners:
+            listener(model_name, version)
+
+    def ensure_exists(self, model_name: str, version: str) -> None:
+        """
+        Raise ModelNotFoundError for unknown (model_name, version)
+        without loading anything
+        """
+        if (model_name, version) not in self._definitions:
             raise ModelNotFoundError(
                 f"Model '{model_name}' with version '{version}' not found."
             )
-        
-        pipeline = self._definitions[key]()
-        self._pipelines[key] = pipeline
-        return pipeline
+
+    def import_report(self) -> List[dict]:
+        """
+        Per definition: whether its module was imported and how long that took
+        """
+        return self._definitions.import_report()
     
     def list_models(self) -> List[Tuple[str, str]]:
         """
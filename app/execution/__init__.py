@@ -1,4 +1,6 @@
 from .executor import ExecutionTimeoutError, ExecutorSaturatedError, InferenceExecutor
 from .execution_policy import ExecutionPolicy
+from .executor_group import ExecutorGroup
+from .batching import MicroBatcher, BatchingPolicy
 
-__all__ = ['ExecutionTimeoutError', 'ExecutorSaturatedError', 'InferenceExecutor', 'ExecutionPolicy']
\ No newline at end of file
+__all__ = ['ExecutionTimeoutError', 'ExecutorSaturatedError', 'InferenceExecutor', 'ExecutionPolicy', 'ExecutorGroup', 'MicroBatcher', 'BatchingPolicy']
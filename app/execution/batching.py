@@ -0,0 +1,204 @@
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import CancelledError as FuturesCancelled, Future, TimeoutError as FuturesTimeout
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.cancellation import CancellationToken, ExecutionCancelledError
+from app.core.metrics import EXECUTOR_TIMEOUTS, MICRO_BATCH_SIZE, MICRO_BATCH_WAIT
+from app.execution.executor import ExecutionTimeoutError, ExecutorSaturatedError, InferenceExecutor
+from app.execution.execution_policy import ExecutionPolicy
+
+
+class MicroBatcher:
+    """
+    Collects concurrent single-item requests for one (model, version)
+    and runs them through the pipeline's batch path in one go.
+
+    A batch is flushed when it reaches max_batch_size items or when the
+    oldest item has waited max_wait_ms, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        version: str,
+        run_batch: Callable[[list], list],
+        executor: InferenceExecutor,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+    ):
+        self.model_name = model_name
+        self.version = version
+        self._run_batch = run_batch
+        self._executor = executor
+        self._max_batch_size = max_batch_size
+        self._max_wait_s = max_wait_ms / 1000.0
+        self._queue: "queue.Queue[Tuple[Any, Future, float]]" = queue.Queue()
+
+        self._thread = threading.Thread(
+            target=self._collect_loop,
+            name=f"microbatch-{model_name}:{version}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def submit(
+        self,
+        payload: Any,
+        timeout_s: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Any:
+        """
+        Enqueue a single payload and block until its result is ready.
+        Mirrors InferenceExecutor.submit timeout and cancellation semantics.
+        """
+        future = self._enqueue(payload, cancel_token)
+        try:
+            result = future.result(timeout=timeout_s)
+        except FuturesTimeout as e:
+            future.cancel()
+            raise self._timed_out() from e
+        except FuturesCancelled as e:
+            raise self._cancelled(cancel_token) from e
+        if cancel_token is not None:
+            # Cancelled while its batch ran: the result is dropped
+            cancel_token.raise_if_cancelled()
+        return result
+
+    async def submit_async(
+        self,
+        payload: Any,
+        timeout_s: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Any:
+        """
+        Same as submit, but waits on the event loop instead of blocking a thread
+        """
+        waiter = asyncio.wrap_future(self._enqueue(payload, cancel_token))
+        try:
+            done, _ = await asyncio.wait({waiter}, timeout=timeout_s)
+        except asyncio.CancelledError:
+            waiter.cancel()
+            raise
+        if not done:
+            waiter.cancel()
+            raise self._timed_out()
+        if waiter.cancelled():
+            raise self._cancelled(cancel_token)
+        result = waiter.result()
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        return result
+
+    def _enqueue(self, payload: Any, cancel_token: Optional[CancellationToken]) -> Future:
+        future: Future = Future()
+        self._queue.put((payload, future, time.time()))
+        if cancel_token is not None:
+            # Still queued -> dropped at flush time; already running -> the batch
+            # completes (cancel() is a no-op) and submit drops this item's result
+            cancel_token.add_callback(future.cancel)
+        return future
+
+    def _cancelled(self, cancel_token: Optional[CancellationToken]) -> ExecutionCancelledError:
+        message = "Execution cancelled"
+        if cancel_token is not None and cancel_token.reason:
+            message += f": {cancel_token.reason}"
+        return ExecutionCancelledError(message)
+
+    def _timed_out(self) -> ExecutionTimeoutError:
+        EXECUTOR_TIMEOUTS.labels(self._executor.device).inc()
+        return ExecutionTimeoutError("Inference execution timed out")
+
+    def _collect_loop(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.time() + self._max_wait_s
+
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            # Skip callers that already gave up
+            batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            now = time.time()
+            for _, _, enqueued_at in batch:
+                MICRO_BATCH_WAIT.labels(self.model_name, self.version).observe(now - enqueued_at)
+            MICRO_BATCH_SIZE.labels(self.model_name, self.version).observe(len(batch))
+
+            try:
+                # Also rejected later if the batch outwaits max_queue_wait_s
+                self._executor.submit_background(self._run, batch, on_reject=partial(self._reject, batch))
+            except ExecutorSaturatedError as e:
+                self._reject(batch, e)
+
+    def _reject(self, batch: list, error: ExecutorSaturatedError) -> None:
+        for _, future, _ in batch:
+            future.set_exception(error)
+
+    def _run(self, batch: list) -> None:
+        try:
+            results = self._run_batch([payload for payload, _, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Batch returned {len(results)} results for {len(batch)} inputs"
+                )
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+                return
+            # One bad input must not fail its neighbours: isolate per item
+            for item in batch:
+                self._run([item])
+            return
+
+        for (_, future, _), result in zip(batch, results):
+            future.set_result(result)
+
+
+class BatchingPolicy:
+    """
+    Resolves (model, version) -> MicroBatcher for models that opted in.
+    Batchers are created lazily and run on the model's own executor.
+    """
+
+    def __init__(self, execution_policy: ExecutionPolicy, policy: dict):
+        self._execution_policy = execution_policy
+        self._policy = policy
+        self._batchers: Dict[Tuple[str, str], MicroBatcher] = {}
+        self._lock = threading.Lock()
+
+    def resolve(
+        self,
+        model: str,
+        version: str,
+        run_batch: Callable[[list], list],
+    ) -> Optional[MicroBatcher]:
+        config = self._policy.get(f"{model}:{version}")
+        if not config:
+            return None
+
+        key = (model, version)
+        with self._lock:
+            batcher = self._batchers.get(key)
+            if batcher is None:
+                batcher = MicroBatcher(
+                    model_name=model,
+                    version=version,
+                    run_batch=run_batch,
+                    executor=self._execution_policy.resolve(model, version),
+                    max_batch_size=config.get("max_batch_size", 16),
+                    max_wait_ms=config.get("max_wait_ms", 5.0),
+                )
+                self._batchers[key] = batcher
+            return batcher
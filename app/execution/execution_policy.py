@@ -1,13 +1,44 @@
+from app.execution.executor_group import ExecutorGroup
+
+
+def pool_names(target) -> list:
+    """
+    Executor names a policy entry may run on, preferred first
+    """
+    return list(target["pools"]) if isinstance(target, dict) else [target]
+
+
 class ExecutionPolicy:
     def __init__(self, executors: dict, policy: dict, default: str):
         self._executors = executors
         self._policy = policy
         self._default = default
+
+        # model:version -> group, for entries with several pools;
+        # entries with the same pools and threshold share one group
+        self._groups = {}
+        shared = {}
+        for key, target in policy.items():
+            if not isinstance(target, dict):
+                continue
+            names = tuple(pool_names(target))
+            spill = target.get("spill_queue_depth", 1)
+            if (names, spill) not in shared:
+                try:
+                    pools = [executors[name] for name in names]
+                except KeyError as e:
+                    raise RuntimeError(f"Unknown executor {e} for '{key}'") from None
+                shared[(names, spill)] = ExecutorGroup("+".join(names), pools, spill_queue_depth=spill)
+            self._groups[key] = shared[(names, spill)]
+
     def resolve(self, model: str, version: str):
         key=f"{model}:{version}"
+        group = self._groups.get(key)
+        if group is not None:
+            return group
         target = self._policy.get(key, self._default)
         
         try:
             return self._executors[target]
         except:
-            raise RuntimeError(f"Unknown executor '{target}'")
\ No newline at end of file
+            raise RuntimeError(f"Unknown executor '{target}'")
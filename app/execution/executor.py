@@ -1,8 +1,28 @@
+import asyncio
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
-from typing import Any, Optional
+from concurrent.futures import (
+    CancelledError as FuturesCancelled,
+    Future,
+    ThreadPoolExecutor,
+    TimeoutError as FuturesTimeout,
+)
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Optional
 
-from app.core.metrics import EXECUTOR_INFLIGHT, EXECUTOR_TIMEOUTS
+from app.core.cancellation import CancellationToken, ExecutionCancelledError
+from app.core.metrics import (
+    EXECUTOR_INFLIGHT,
+    EXECUTOR_TIMEOUTS,
+    EXECUTOR_QUEUE_DEPTH,
+    EXECUTOR_QUEUE_WAIT,
+    EXECUTOR_REJECTIONS,
+    EXECUTOR_CANCELLED,
+    EXECUTOR_BUSY_WORKERS,
+    EXECUTOR_BUSY_SECONDS,
+    EXECUTOR_UTILIZATION,
+)
 
 
 class ExecutionTimeoutError(Exception):
@@ -10,50 +30,284 @@ class ExecutionTimeoutError(Exception):
 
 
 class ExecutorSaturatedError(Exception):
-    pass
+    def __init__(self, message: str, retry_after_s: float = 1.0):
+        super().__init__(message, retry_after_s)
+        self.retry_after_s = retry_after_s
+
+    def __str__(self) -> str:
+        return self.args[0]
+
+
+def _report_rejection(on_reject: Callable[[ExecutorSaturatedError], None], future: Future) -> None:
+    if not future.cancelled() and isinstance(future.exception(), ExecutorSaturatedError):
+        on_reject(future.exception())
 
 
 class InferenceExecutor:
+    # Thread workers share the caller's pipelines and job store
+    isolated = False
+
     def __init__(
         self,
         device: str,
         max_workers: int = 4,
         default_timeout_s: Optional[float] = None,
+        max_queue_depth: Optional[int] = None,
+        max_queue_wait_s: Optional[float] = None,
+        retry_after_s: float = 1.0,
     ):
         self.device = device 
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._max_workers = max_workers
         self._default_timeout_s = default_timeout_s
+        
+        # Admission control (None = unbounded)
+        self._max_queue_depth = max_queue_depth
+        self._max_queue_wait_s = max_queue_wait_s
+        self._retry_after_s = retry_after_s
+        self._lock = threading.Lock()
+        self._pending = 0   # admitted, not finished
+        self._running = 0   # picked up by a worker
+    
+    @property
+    def queue_depth(self) -> int:
+        """
+        Admitted work still waiting for a worker
+        """
+        return self._pending - self._running
 
-    def submit(self, fn, *args, timeout_s: Optional[float] = None) -> Any:
-        start = time.time()
-        EXECUTOR_INFLIGHT.labels(self.device).inc()
+    @property
+    def busy_workers(self) -> int:
+        return self._running
+
+    @property
+    def saturated(self) -> bool:
+        """
+        New work would be rejected for a full queue
+        """
+        return self._max_queue_depth is not None and self.queue_depth >= self._max_queue_depth
+
+    def _check_capacity(self) -> None:
+        if self.saturated:
+            EXECUTOR_REJECTIONS.labels(self.device, "queue_full").inc()
+            raise ExecutorSaturatedError(
+                f"Executor '{self.device}' is saturated",
+                retry_after_s=self._retry_after_s,
+            )
+
+    def _record_load(self) -> None:
+        # Caller holds self._lock
+        busy = self.busy_workers
+        EXECUTOR_QUEUE_DEPTH.labels(self.device).set(self.queue_depth)
+        EXECUTOR_BUSY_WORKERS.labels(self.device).set(busy)
+        EXECUTOR_UTILIZATION.labels(self.device).set(busy / self._max_workers)
+
+    def _admit(self) -> None:
+        with self._lock:
+            self._check_capacity()
+            self._pending += 1
+            self._record_load()
+
+    def _finish(self, _future: Future | None = None) -> None:
+        with self._lock:
+            self._pending -= 1
+            self._record_load()
+
+    def _check_queue_wait(self, waited_s: float) -> None:
+        EXECUTOR_QUEUE_WAIT.labels(self.device).observe(waited_s)
+        if self._max_queue_wait_s is not None and waited_s > self._max_queue_wait_s:
+            # Caller has most likely given up already; don't spend a worker on it
+            EXECUTOR_REJECTIONS.labels(self.device, "queue_wait").inc()
+            raise ExecutorSaturatedError(
+                f"Executor '{self.device}' queue wait exceeded {self._max_queue_wait_s}s",
+                retry_after_s=self._retry_after_s,
+            )
+
+    def _run_queued(self, enqueued_at: float, fn, *args) -> Any:
+        with self._lock:
+            self._running += 1
+            self._record_load()
+        started_at = time.time()
+        try:
+            self._check_queue_wait(started_at - enqueued_at)
+            return fn(*args)
+        finally:
+            EXECUTOR_BUSY_SECONDS.labels(self.device).inc(time.time() - started_at)
+            with self._lock:
+                self._running -= 1
+                self._record_load()
+
+    def _submit_thread(self, fn, *args) -> Future:
+        self._admit()
+        try:
+            future = self._executor.submit(self._run_queued, time.time(), fn, *args)
+        except BaseException:
+            self._finish()
+            raise
+        future.add_done_callback(self._finish)
+        return future
+
+    def _submit_future(self, fn, *args) -> Future:
+        return self._submit_thread(fn, *args)
+
+    def submit(
+        self,
+        fn,
+        *args,
+        timeout_s: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Any:
+        """
+        Run fn(*args) on a worker and wait for the result.
+        On timeout cancel_token is cancelled so fn can stop early;
+        fn is expected to check the same token.
+        """
+        return self._wait_for(
+            partial(self._submit_future, fn, *args),
+            timeout_s=timeout_s,
+            cancel_token=cancel_token,
+        )
 
+    async def submit_async(
+        self,
+        fn,
+        *args,
+        timeout_s: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Any:
+        """
+        Same as submit, but waits on the event loop instead of blocking a thread
+        """
+        return await self._wait_for_async(
+            partial(self._submit_future, fn, *args),
+            timeout_s=timeout_s,
+            cancel_token=cancel_token,
+        )
+
+    def _wait_for(
+        self,
+        start_fn: Callable[[], Future],
+        timeout_s: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Any:
+        """
+        Start work via start_fn and block on its future with
+        inflight tracking, timeout and cancellation handling
+        """
+        token = cancel_token or CancellationToken()
+        with self._tracked_wait(token):
+            future = self._start(start_fn, token)
+            return future.result(timeout=self._timeout(timeout_s))
+
+    async def _wait_for_async(
+        self,
+        start_fn: Callable[[], Future],
+        timeout_s: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Any:
+        """
+        _wait_for for coroutines: the future is awaited, no thread is parked on it
+        """
+        token = cancel_token or CancellationToken()
+        with self._tracked_wait(token):
+            future = self._start(start_fn, token)
+            waiter = asyncio.wrap_future(future)
+            try:
+                # wait() leaves the future alone on timeout; the token does the cancelling
+                done, _ = await asyncio.wait({waiter}, timeout=self._timeout(timeout_s))
+            except asyncio.CancelledError:
+                # Client went away
+                token.cancel("caller cancelled")
+                waiter.cancel()
+                raise
+            if not done:
+                token.cancel("timeout")
+                waiter.cancel()
+                raise FuturesTimeout()
+            if waiter.cancelled():
+                raise FuturesCancelled()
+            return waiter.result()
+
+    def _timeout(self, timeout_s: Optional[float]) -> Optional[float]:
+        return timeout_s if timeout_s is not None else self._default_timeout_s
+
+    def _start(self, start_fn: Callable[[], Future], token: CancellationToken) -> Future:
+        future = start_fn()
+        token.add_callback(partial(self._cancel_future, future))
+        return future
+
+    @contextmanager
+    def _tracked_wait(self, token: CancellationToken):
+        EXECUTOR_INFLIGHT.labels(self.device).inc()
         try:
-            future = self._executor.submit(fn, *args)
-            timeout = timeout_s if timeout_s is not None else self._default_timeout_s
-            return future.result(timeout=timeout)
+            yield
 
         except FuturesTimeout as e:
             EXECUTOR_TIMEOUTS.labels(self.device).inc()
+            token.cancel("timeout")
             raise ExecutionTimeoutError("Inference execution timed out") from e
 
+        except FuturesCancelled as e:
+            raise ExecutionCancelledError(f"Execution cancelled: {token.reason}") from e
+
+        except Exception as e:
+            # Work torn down by a cancel (e.g. killed worker) surfaces as a cancel
+            if token.cancelled:
+                raise ExecutionCancelledError(f"Execution cancelled: {token.reason}") from e
+            raise
+
         finally:
             EXECUTOR_INFLIGHT.labels(self.device).dec()
+
+    def _cancel_future(self, future: Future) -> None:
+        """
+        Drop queued work; running work stops at its next cancellation check
+        """
+        if future.done():
+            return
+        state = "queued" if future.cancel() else "running"
+        EXECUTOR_CANCELLED.labels(self.device, state).inc()
     
-    def submit_batch(self, fn, timeout_s: Optional[float] = None):
+    def submit_batch(
+        self,
+        fn,
+        timeout_s: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ):
         """
         Execute batch inference (zero-arg callable).
         Batch semantics belong to the pipeline, not the executor.
         """
-        return self.submit(fn, timeout_s=timeout_s)
+        return self.submit(fn, timeout_s=timeout_s, cancel_token=cancel_token)
+
+    async def submit_batch_async(
+        self,
+        fn,
+        timeout_s: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ):
+        return await self.submit_async(fn, timeout_s=timeout_s, cancel_token=cancel_token)
 
     
-    def submit_background(self, fn, *args) -> None:
+    def submit_background(
+        self,
+        fn,
+        *args,
+        on_reject: Optional[Callable[[ExecutorSaturatedError], None]] = None,
+    ) -> None:
         """
         Fire and Forget execution
         Used for async inference jobs
+        Raises ExecutorSaturatedError when the queue is full; work dropped
+        later (waited longer than max_queue_wait_s) is reported to on_reject,
+        on the worker thread, since nobody reads its result
         """
         try:
-            self._executor.submit(fn, *args)
+            future = self._submit_thread(fn, *args)
         except RuntimeError:
-            pass #executor shutting down or unavailable
\ No newline at end of file
+            return #executor shutting down or unavailable
+        if on_reject is not None:
+            future.add_done_callback(partial(_report_rejection, on_reject))
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,151 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.core.cancellation import CancellationToken
+from app.core.metrics import EXECUTOR_SPILLS
+from app.execution.executor import ExecutorSaturatedError, InferenceExecutor
+
+
+class ExecutorGroup:
+    """
+    Several executor pools a model may run on, in order of affinity.
+
+    Work goes to the first (preferred) pool until its queue reaches
+    spill_queue_depth or it is saturated; then each submission spills to
+    the least queued other pool, if that one is less loaded. Pools decide
+    at admission time, so a pool with idle workers takes over (steals) the
+    overflow of a busy one instead of letting it queue.
+
+    Exposes the executor interface, so callers can't tell a group from a
+    single pool. All pools must be of one kind (thread or process).
+    """
+
+    def __init__(self, name: str, pools: List[InferenceExecutor], spill_queue_depth: int = 1):
+        if not pools:
+            raise ValueError(f"Executor group '{name}' has no pools")
+        if len({pool.isolated for pool in pools}) > 1:
+            raise ValueError(f"Executor group '{name}' mixes thread and process pools")
+        self.device = name
+        self.isolated = pools[0].isolated
+        self._pools = pools
+        self._spill_queue_depth = spill_queue_depth
+
+    @property
+    def queue_depth(self) -> int:
+        # What new work would queue behind, given spill-over
+        return self._pick().queue_depth
+
+    @property
+    def saturated(self) -> bool:
+        return all(pool.saturated for pool in self._pools)
+
+    @property
+    def pools(self) -> List[InferenceExecutor]:
+        return list(self._pools)
+
+    def _pick(self) -> InferenceExecutor:
+        preferred = self._pools[0]
+        if not preferred.saturated and preferred.queue_depth < self._spill_queue_depth:
+            return preferred
+        candidates = [pool for pool in self._pools[1:] if not pool.saturated]
+        if not candidates:
+            return preferred  # Nowhere better; admission control decides
+        fallback = min(candidates, key=lambda pool: pool.queue_depth)
+        if preferred.saturated or fallback.queue_depth < preferred.queue_depth:
+            return fallback
+        return preferred
+
+    def _dispatch(self) -> InferenceExecutor:
+        pool = self._pick()
+        if pool is not self._pools[0]:
+            EXECUTOR_SPILLS.labels(self.device, self._pools[0].device, pool.device).inc()
+        return pool
+
+    def submit(
+        self,
+        fn,
+        *args,
+        timeout_s: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Any:
+        return self._dispatch().submit(fn, *args, timeout_s=timeout_s, cancel_token=cancel_token)
+
+    async def submit_async(
+        self,
+        fn,
+        *args,
+        timeout_s: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Any:
+        return await self._dispatch().submit_async(fn, *args, timeout_s=timeout_s, cancel_token=cancel_token)
+
+    def submit_batch(
+        self,
+        fn,
+        timeout_s: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ):
+        return self._dispatch().submit_batch(fn, timeout_s=timeout_s, cancel_token=cancel_token)
+
+    async def submit_batch_async(
+        self,
+        fn,
+        timeout_s: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ):
+        return await self._dispatch().submit_batch_async(fn, timeout_s=timeout_s, cancel_token=cancel_token)
+
+    def submit_background(
+        self,
+        fn,
+        *args,
+        on_reject: Optional[Callable[[ExecutorSaturatedError], None]] = None,
+    ) -> None:
+        self._dispatch().submit_background(fn, *args, on_reject=on_reject)
+
+    def submit_pipeline(
+        self,
+        model_name: str,
+        version: str,
+        method: str,
+        payload: Any,
+        timeout_s: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Any:
+        return self._dispatch().submit_pipeline(
+            model_name, version, method, payload,
+            timeout_s=timeout_s, cancel_token=cancel_token,
+        )
+
+    async def submit_pipeline_async(
+        self,
+        model_name: str,
+        version: str,
+        method: str,
+        payload: Any,
+        timeout_s: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Any:
+        return await self._dispatch().submit_pipeline_async(
+            model_name, version, method, payload,
+            timeout_s=timeout_s, cancel_token=cancel_token,
+        )
+
+    def warm(
+        self,
+        models: Iterable[Tuple[str, str]] = (),
+        warmup: Iterable[Tuple[str, str, Any]] = (),
+    ) -> None:
+        # Spill-over can land on any pool, so every pool is warmed
+        models, warmup = list(models), list(warmup)
+        for pool in self._pools:
+            pool.warm(models=models, warmup=warmup)
+
+    def recycle(
+        self,
+        definitions: Optional[Dict[str, str]] = None,
+        warmup: Iterable[Tuple[str, str, Any]] = (),
+    ) -> None:
+        # Every pool may serve the model, so every pool picks up the new version
+        warmup = list(warmup)
+        for pool in self._pools:
+            pool.recycle(definitions=definitions, warmup=warmup)
@@ -0,0 +1,435 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from multiprocessing.context import SpawnContext
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from app.core.metrics import (
+    EXECUTOR_QUEUE_WAIT,
+    EXECUTOR_BUSY_SECONDS,
+    EXECUTOR_REJECTIONS,
+    EXECUTOR_CANCELLED,
+    EXECUTOR_WORKER_RESTARTS,
+)
+from app.core.cancellation import CancellationToken
+from app.domain.registry import ModelRegistry
+from app.execution.executor import ExecutorSaturatedError, InferenceExecutor
+from app.execution.shared_memory import SharedMemoryTransport, WorkerBuffers
+
+logger = logging.getLogger(__name__)
+
+# Per-worker-process state, built once by the pool initializer
+_worker_registry: ModelRegistry | None = None
+_worker_buffers: WorkerBuffers | None = None
+
+
+def _init_worker(preload: list[Tuple[str, str]], shm_min_bytes: int | None, definitions: Dict[str, str]) -> None:
+    global _worker_registry, _worker_buffers
+    _worker_registry = ModelRegistry()
+    # Definitions registered at runtime (hot reload), on top of the configured ones
+    for key, target in definitions.items():
+        model_name, version = key.split(":", 1)
+        _worker_registry.register(model_name, version, target)
+    if shm_min_bytes is not None:
+        _worker_buffers = WorkerBuffers(min_bytes=shm_min_bytes)
+    for model_name, version in preload:
+        _worker_registry.get(model_name, version)
+
+
+def _warm_worker(models: list[Tuple[str, str]], warmup: list[Tuple[str, str, Any]]) -> None:
+    for model_name, version in models:
+        _worker_registry.get(model_name, version)
+    for model_name, version, payload in warmup:
+        _worker_registry.get(model_name, version).run(payload)
+
+
+class _WorkerContext(SpawnContext):
+    """
+    spawn context that remembers the worker processes a pool starts,
+    so a retired pool's workers can be killed
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.processes: list = []
+
+    def Process(self, *args, **kwargs):
+        process = super().Process(*args, **kwargs)
+        self.processes.append(process)
+        return process
+
+
+def _run_pipeline(
+    model_name: str,
+    version: str,
+    method: str,
+    payload: Any,
+    enqueued_at: float,
+    max_queue_wait_s: float | None,
+) -> Tuple[float, Any]:
+    """
+    Returns (queue wait, result) so the API process can record the wait
+    """
+    waited = time.time() - enqueued_at
+    if max_queue_wait_s is not None and waited > max_queue_wait_s:
+        raise ExecutorSaturatedError(f"queue wait exceeded {max_queue_wait_s}s")
+
+    pipeline = _worker_registry.get(model_name, version)
+    if _worker_buffers is None:
+        return waited, getattr(pipeline, method)(payload)
+    result = getattr(pipeline, method)(_worker_buffers.open(payload))
+    return waited, _worker_buffers.pack_result(result)
+
+
+class ProcessInferenceExecutor(InferenceExecutor):
+    """
+    Runs pipelines in a pool of worker processes so GIL-holding
+    pre/model/post code can use every core.
+
+    Each worker builds its own pipelines from the registry definitions;
+    only (model, version, payload) crosses the process boundary.
+    Background submissions are orchestrated on a small thread pool in
+    this process, exactly like the thread executor.
+
+    With shm_min_bytes set, buffer payloads and results of at least that
+    size travel through shared memory instead of being pickled.
+
+    Running work can't check a cancellation token across the process
+    boundary, so cancelling it starts and warms a fresh pool, swaps it in
+    and kills the old pool's workers once its other in-flight work has
+    drained. At most max_retiring_pools old pools are alive at a time;
+    past that, cancelled work runs to completion on its worker and the
+    executor reports itself saturated once every worker is taken up that way.
+
+    Pool calls are never made under _pool_lock and future callbacks never
+    take it: a pool's manager thread runs callbacks while holding the
+    pool's own lock, so the two must not nest in opposite orders.
+    """
+    isolated = True
+
+    def __init__(
+        self,
+        device: str,
+        max_workers: int = 4,
+        default_timeout_s: Optional[float] = None,
+        preload: Iterable[Tuple[str, str]] = (),
+        background_workers: int = 4,
+        shm_min_bytes: Optional[int] = None,
+        max_queue_depth: Optional[int] = None,
+        max_queue_wait_s: Optional[float] = None,
+        retry_after_s: float = 1.0,
+        retire_grace_s: float = 30.0,
+        max_retiring_pools: int = 1,
+    ):
+        super().__init__(
+            device=device,
+            max_workers=background_workers,
+            default_timeout_s=default_timeout_s,
+            max_queue_depth=max_queue_depth,
+            max_queue_wait_s=max_queue_wait_s,
+            retry_after_s=retry_after_s,
+        )
+        self._max_workers = max_workers
+        self._preload = list(preload)
+        self._shm_min_bytes = shm_min_bytes
+        self._transport = (
+            SharedMemoryTransport(min_bytes=shm_min_bytes)
+            if shm_min_bytes is not None
+            else None
+        )
+        self._retire_grace_s = retire_grace_s
+        self._max_retiring_pools = max_retiring_pools
+        self._definitions: Dict[str, str] = {}
+
+        # Guards pool swaps only (_pool, _replacing, _retiring)
+        self._pool_lock = threading.Lock()
+        self._replacing = False
+        self._retiring = 0
+        # Updated from future callbacks without a lock (single dict/set
+        # operations are atomic under the GIL); read through copies
+        self._pool_of: Dict[Future, ProcessPoolExecutor] = {}
+        self._inner_of: Dict[Future, Future] = {}
+        self._abandoned: set = set()  # cancelled work left running on its worker
+        self._workers: Dict[ProcessPoolExecutor, _WorkerContext] = {}
+        self._pool = self._new_pool()
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        # spawn: workers must not inherit the parent's threads and locks
+        context = _WorkerContext()
+        pool = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self._preload, self._shm_min_bytes, dict(self._definitions)),
+        )
+        self._workers[pool] = context
+        return pool
+
+    @property
+    def queue_depth(self) -> int:
+        # Worker start times are not visible here; anything beyond one per worker is queued
+        return max(0, self._pending - self._max_workers)
+
+    @property
+    def busy_workers(self) -> int:
+        return min(self._pending, self._max_workers)
+
+    @property
+    def saturated(self) -> bool:
+        # Every worker is stuck on abandoned work and no fresh pool may be started
+        return super().saturated or len(self._abandoned) >= self._max_workers
+
+    def _submit_future(self, fn, *args) -> Future:
+        # fn and args must be picklable
+        self._admit()
+        try:
+            while True:
+                pool = self._pool
+                try:
+                    future = pool.submit(fn, *args)
+                    break
+                except RuntimeError:
+                    if pool is self._pool:
+                        raise
+                    # Pool was swapped out and shut down meanwhile: use the new one
+        except BaseException:
+            self._finish()
+            raise
+        self._pool_of[future] = pool
+        future.add_done_callback(self._on_worker_done)
+        return future
+
+    def _on_worker_done(self, future: Future) -> None:
+        self._pool_of.pop(future, None)
+        self._finish(future)
+
+    def _cancel_future(self, future: Future) -> None:
+        inner = self._inner_of.get(future, future)
+        if inner.done():
+            return
+        if inner.cancel():
+            EXECUTOR_CANCELLED.labels(self.device, "queued").inc()
+            return
+        EXECUTOR_CANCELLED.labels(self.device, "running").inc()
+        self._replace_pool(inner)
+
+    def _replace_pool(self, stuck: Future) -> None:
+        old = self._pool_of.get(stuck)
+        with self._pool_lock:
+            if old is not self._pool or self._replacing:
+                return  # finished meanwhile, or its pool is already being replaced
+            at_capacity = self._retiring >= self._max_retiring_pools
+            if not at_capacity:
+                self._replacing = True
+
+        if at_capacity:
+            # Don't stack up another pool; the worker frees up when the work ends
+            self._abandoned.add(stuck)
+            stuck.add_done_callback(self._abandoned.discard)
+            return
+
+        EXECUTOR_WORKER_RESTARTS.labels(self.device).inc()
+        threading.Thread(
+            target=self._swap_in_fresh_pool,
+            args=(old, stuck),
+            name=f"replace-pool-{self.device}",
+            daemon=True,
+        ).start()
+
+    def _swap_in_fresh_pool(self, old: ProcessPoolExecutor, stuck: Future) -> None:
+        # The old pool keeps serving on its other workers until the new one is warm,
+        # so retries don't land on a worker that still has to load the model
+        pool = self._new_pool()
+        try:
+            self._warm_pool(pool, [], [])
+        except BaseException:
+            logger.exception("process_pool_replace_failed", extra={"device": self.device})
+            self._discard_pool(pool)
+            with self._pool_lock:
+                self._replacing = False
+            return
+
+        with self._pool_lock:
+            self._pool = pool
+            self._replacing = False
+            self._retiring += 1
+        others = [f for f, p in self._pool_of.copy().items() if p is old and f is not stuck]
+        self._retire_pool(old, others)
+
+    def _warm_pool(
+        self,
+        pool: ProcessPoolExecutor,
+        models: Iterable[Tuple[str, str]],
+        warmup: Iterable[Tuple[str, str, Any]],
+    ) -> None:
+        # One task per worker, so every worker is spawned and has built its pipelines
+        models, warmup = list(models), list(warmup)
+        warming = [pool.submit(_warm_worker, models, warmup) for _ in range(self._max_workers)]
+        for future in warming:
+            future.result()
+
+    def warm(
+        self,
+        models: Iterable[Tuple[str, str]] = (),
+        warmup: Iterable[Tuple[str, str, Any]] = (),
+    ) -> None:
+        """
+        Start every worker of the current pool and have each build models
+        and run the warmup samples, so first requests don't pay for either
+        """
+        self._warm_pool(self._pool, models, warmup)
+
+    def recycle(
+        self,
+        definitions: Optional[Dict[str, str]] = None,
+        warmup: Iterable[Tuple[str, str, Any]] = (),
+    ) -> None:
+        """
+        Replace the workers with fresh ones, e.g. to pick up a reloaded model.
+        The new workers are started and warmed before they take traffic;
+        the old ones finish their in-flight work (up to retire_grace_s) first.
+        definitions ("model:version" -> "module[:builder]") apply to new workers.
+        """
+        with self._pool_lock:
+            self._definitions.update(definitions or {})
+        pool = self._new_pool()
+        try:
+            self._warm_pool(pool, [], warmup)
+        except BaseException:
+            self._discard_pool(pool)
+            raise
+
+        with self._pool_lock:
+            old = self._pool
+            self._pool = pool
+            self._retiring += 1
+        others = [f for f, p in self._pool_of.copy().items() if p is old]
+
+        EXECUTOR_WORKER_RESTARTS.labels(self.device).inc()
+        threading.Thread(
+            target=self._retire_pool,
+            args=(old, others),
+            name=f"retire-pool-{self.device}",
+            daemon=True,
+        ).start()
+
+    def _retire_pool(self, pool: ProcessPoolExecutor, others: list) -> None:
+        # Let unrelated in-flight work finish, then kill whatever is still running
+        try:
+            wait(others, timeout=self._retire_grace_s)
+            self._discard_pool(pool)
+        finally:
+            with self._pool_lock:
+                self._retiring -= 1
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        for process in self._workers.pop(pool).processes:
+            if process.is_alive():
+                process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def submit_pipeline(
+        self,
+        model_name: str,
+        version: str,
+        method: str,
+        payload: Any,
+        timeout_s: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Any:
+        """
+        Run pipeline.<method>(payload) inside a worker process
+        """
+        return self._wait_for(
+            partial(self._submit_pipeline_future, model_name, version, method, payload),
+            timeout_s=timeout_s,
+            cancel_token=cancel_token,
+        )
+
+    async def submit_pipeline_async(
+        self,
+        model_name: str,
+        version: str,
+        method: str,
+        payload: Any,
+        timeout_s: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Any:
+        return await self._wait_for_async(
+            partial(self._submit_pipeline_future, model_name, version, method, payload),
+            timeout_s=timeout_s,
+            cancel_token=cancel_token,
+        )
+
+    def _submit_pipeline_future(self, model_name: str, version: str, method: str, payload: Any) -> Future:
+        leases: list = []
+        if self._transport is not None:
+            payload, leases = self._transport.pack(payload)
+        enqueued_at = time.time()
+        try:
+            inner = self._submit_future(
+                _run_pipeline, model_name, version, method, payload,
+                enqueued_at, self._max_queue_wait_s,
+            )
+        except BaseException:
+            if leases:
+                self._transport.release(leases)
+            raise
+
+        outer: Future = Future()
+        outer.set_running_or_notify_cancel()
+        self._inner_of[outer] = inner
+
+        def on_done(f: Future) -> None:
+            # Runs when the worker finishes, even if the caller already timed out,
+            # so leased blocks are reused and result blocks are always freed.
+            # May run on the pool's manager thread: must not take _pool_lock
+            self._inner_of.pop(outer, None)
+            if leases:
+                self._transport.release(leases)
+            try:
+                waited, result = f.result()
+                EXECUTOR_QUEUE_WAIT.labels(self.device).observe(waited)
+                EXECUTOR_BUSY_SECONDS.labels(self.device).inc(max(0.0, time.time() - enqueued_at - waited))
+                if self._transport is not None:
+                    result = self._transport.unpack_result(result)
+                outer.set_result(result)
+            except ExecutorSaturatedError as e:
+                EXECUTOR_REJECTIONS.labels(self.device, "queue_wait").inc()
+                outer.set_exception(ExecutorSaturatedError(
+                    f"Executor '{self.device}' {e}",
+                    retry_after_s=self._retry_after_s,
+                ))
+            except BaseException as e:
+                outer.set_exception(e)
+
+        inner.add_done_callback(on_done)
+        return outer
+
+    def submit_background(
+        self,
+        fn,
+        *args,
+        on_reject: Optional[Callable[[ExecutorSaturatedError], None]] = None,
+    ) -> None:
+        """
+        Fire and Forget orchestration on the local thread pool.
+        Pipeline work it submits is admitted separately, so only
+        check capacity here instead of counting it twice.
+        Nothing is dropped after admission, so on_reject is never called.
+        """
+        with self._lock:
+            self._check_capacity()
+        try:
+            self._executor.submit(fn, *args)
+        except RuntimeError:
+            pass #executor shutting down or unavailable
+
+    def shutdown(self, wait: bool = True) -> None:
+        super().shutdown(wait=wait)
+        pool = self._pool
+        pool.shutdown(wait=wait)
+        if self._transport is not None:
+            self._transport.close()
@@ -0,0 +1,245 @@
+import threading
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.metrics import SHARED_MEMORY_BYTES, SHARED_MEMORY_TRANSFERS
+
+
+@dataclass(frozen=True)
+class SharedBuffer:
+    """
+    Picklable handle to a buffer payload placed in shared memory.
+    Only this handle crosses the process boundary, not the data.
+    """
+    name: str
+    nbytes: int
+    format: str
+    shape: Tuple[int, ...]
+    dtype: Optional[str] = None     # set for NumPy arrays
+
+
+def _is_ndarray(value: Any) -> bool:
+    return type(value).__module__ == "numpy" and type(value).__name__ == "ndarray"
+
+
+def _as_buffer(value: Any) -> Optional[memoryview]:
+    """
+    Return a C-contiguous memoryview for buffer-protocol values, else None
+    """
+    if isinstance(value, (str, int, float, bool, dict)) or value is None:
+        return None
+    try:
+        view = memoryview(value)
+    except TypeError:
+        return None
+    if not view.c_contiguous:
+        return None
+    return view
+
+
+class SharedMemoryPool:
+    """
+    Pool of reusable shared-memory blocks in power-of-two size classes.
+    Blocks are leased for one request and returned once the worker is
+    done with them, including after a caller-side timeout.
+    """
+
+    def __init__(self, max_free_blocks: int = 32):
+        self._max_free_blocks = max_free_blocks
+        self._free: Dict[int, List[shared_memory.SharedMemory]] = {}
+        self._free_count = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @staticmethod
+    def _size_class(nbytes: int) -> int:
+        size = 4096
+        while size < nbytes:
+            size *= 2
+        return size
+
+    def lease(self, nbytes: int) -> shared_memory.SharedMemory:
+        size = self._size_class(nbytes)
+        with self._lock:
+            blocks = self._free.get(size)
+            if blocks:
+                self._free_count -= 1
+                return blocks.pop()
+        block = shared_memory.SharedMemory(create=True, size=size)
+        SHARED_MEMORY_BYTES.inc(block.size)
+        return block
+
+    def release(self, block: shared_memory.SharedMemory) -> None:
+        with self._lock:
+            if not self._closed and self._free_count < self._max_free_blocks:
+                self._free.setdefault(block.size, []).append(block)
+                self._free_count += 1
+                return
+        _destroy(block)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            blocks = [b for size_blocks in self._free.values() for b in size_blocks]
+            self._free.clear()
+            self._free_count = 0
+        for block in blocks:
+            _destroy(block)
+
+
+def _destroy(block: shared_memory.SharedMemory) -> None:
+    SHARED_MEMORY_BYTES.dec(block.size)
+    block.close()
+    try:
+        block.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _walk(value: Any, fn) -> Any:
+    """
+    Apply fn to every leaf of a JSON-like tree of dicts, lists and tuples
+    """
+    if isinstance(value, dict):
+        return {k: _walk(v, fn) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_walk(v, fn) for v in value)
+    return fn(value)
+
+
+class SharedMemoryTransport:
+    """
+    Moves large buffer payloads (NumPy arrays, bytes, array.array, ...)
+    between the API process and worker processes through shared memory
+    instead of pickling them.
+
+    Buffers may sit anywhere inside dicts, lists and tuples (e.g. batches).
+    Anything else, or anything below min_bytes, is passed through as-is.
+    """
+
+    def __init__(self, min_bytes: int = 64 * 1024, pool: Optional[SharedMemoryPool] = None):
+        self._min_bytes = min_bytes
+        self._pool = pool or SharedMemoryPool()
+
+    # API process side
+
+    def pack(self, payload: Any) -> Tuple[Any, list]:
+        """
+        Return (picklable payload, leased blocks to release when the worker is done)
+        """
+        leases: list = []
+        packed = _walk(payload, lambda value: self._pack_one(value, leases))
+        return packed, leases
+
+    def _pack_one(self, value: Any, leases: list) -> Any:
+        view = _as_buffer(value)
+        if view is None or view.nbytes < self._min_bytes:
+            return value
+
+        block = self._pool.lease(view.nbytes)
+        block.buf[:view.nbytes] = view.cast("B")
+        leases.append(block)
+        SHARED_MEMORY_TRANSFERS.labels("payload").inc()
+
+        return SharedBuffer(
+            name=block.name,
+            nbytes=view.nbytes,
+            format=view.format,
+            shape=tuple(view.shape),
+            dtype=str(value.dtype) if _is_ndarray(value) else None,
+        )
+
+    def release(self, leases: list) -> None:
+        for block in leases:
+            self._pool.release(block)
+
+    def unpack_result(self, result: Any) -> Any:
+        """
+        Copy worker-produced shared buffers out and free their blocks
+        """
+        return _walk(result, self._unpack_result_one)
+
+    @staticmethod
+    def _unpack_result_one(value: Any) -> Any:
+        if not isinstance(value, SharedBuffer):
+            return value
+        SHARED_MEMORY_TRANSFERS.labels("result").inc()
+        block = shared_memory.SharedMemory(name=value.name)
+        try:
+            data = bytes(block.buf[:value.nbytes])
+        finally:
+            block.close()
+            block.unlink()
+        if value.dtype is not None:
+            import numpy
+            return numpy.frombuffer(data, dtype=value.dtype).reshape(value.shape)
+        if value.format == "B" and len(value.shape) == 1:
+            return data
+        return memoryview(data).cast(value.format, value.shape)
+
+    def close(self) -> None:
+        self._pool.close()
+
+
+class WorkerBuffers:
+    """
+    Worker process side of SharedMemoryTransport.
+
+    Pool blocks are reused by the API process, so mappings are kept open
+    (up to max_attached) and later requests on the same block attach for free.
+    Large results are written into fresh blocks that the API process
+    frees after reading.
+    """
+
+    def __init__(self, min_bytes: int, max_attached: int = 64):
+        self._min_bytes = min_bytes
+        self._max_attached = max_attached
+        self._attached: Dict[str, shared_memory.SharedMemory] = {}
+
+    def open(self, payload: Any) -> Any:
+        return _walk(payload, self._open_one)
+
+    def _attach(self, name: str) -> shared_memory.SharedMemory:
+        block = self._attached.pop(name, None)
+        if block is None:
+            block = shared_memory.SharedMemory(name=name)
+            if len(self._attached) >= self._max_attached:
+                oldest = next(iter(self._attached))
+                try:
+                    self._attached.pop(oldest).close()
+                except BufferError:
+                    pass  # a model still holds a view; the mapping goes with it
+        self._attached[name] = block
+        return block
+
+    def _open_one(self, value: Any) -> Any:
+        if not isinstance(value, SharedBuffer):
+            return value
+        view = self._attach(value.name).buf[:value.nbytes].toreadonly()
+        if value.dtype is not None:
+            import numpy
+            return numpy.frombuffer(view, dtype=value.dtype).reshape(value.shape)
+        return view.cast(value.format, value.shape)
+
+    def pack_result(self, result: Any) -> Any:
+        return _walk(result, self._pack_result_one)
+
+    def _pack_result_one(self, value: Any) -> Any:
+        view = _as_buffer(value)
+        if view is None:
+            return value
+        if view.nbytes < self._min_bytes:
+            # memoryviews (e.g. echoed inputs) cannot be pickled
+            return view.tobytes() if isinstance(value, memoryview) else value
+        block = shared_memory.SharedMemory(create=True, size=view.nbytes)
+        block.buf[:view.nbytes] = view.cast("B")
+        handle = SharedBuffer(
+            name=block.name,
+            nbytes=view.nbytes,
+            format=view.format,
+            shape=tuple(view.shape),
+            dtype=str(value.dtype) if _is_ndarray(value) else None,
+        )
+        block.close()
+        return handle
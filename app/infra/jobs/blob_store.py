@@ -0,0 +1,93 @@
+import hashlib
+import mmap
+import os
+import tempfile
+import time
+from typing import Any, Callable, Iterable
+
+from app.core.metrics import JOB_BLOBS_WRITTEN, JOB_BLOB_LOADS, JOB_BLOBS_SWEPT
+
+
+class BlobStore:
+    """
+    Content-addressed files for job payloads and results too large to
+    keep in the job row: <root>/<sha256[:2]>/<sha256>.
+
+    Identical content is stored once. Files are only removed by sweep(),
+    which keeps anything referenced or touched within grace_s.
+
+    load() decodes straight from the memory-mapped file, so a large blob
+    is never copied into memory whole.
+    """
+
+    def __init__(self, root: str = "app/instance/blobs", min_bytes: int = 64 * 1024, grace_s: float = 3600.0):
+        self.root = root
+        self.min_bytes = min_bytes
+        self._grace_s = grace_s
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def put(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        if os.path.exists(path):
+            # Already stored; refresh mtime so a concurrent sweep keeps it
+            os.utime(path)
+            return digest
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            # Atomic: readers see the whole blob or none of it
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        JOB_BLOBS_WRITTEN.inc()
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        JOB_BLOB_LOADS.inc()
+        with open(self._path(digest), "rb") as f:
+            return f.read()
+
+    def load(self, digest: str, decode: Callable[[memoryview], Any]) -> Any:
+        """
+        decode(view) over the mapped blob; view is only valid during the call
+        """
+        JOB_BLOB_LOADS.inc()
+        with open(self._path(digest), "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                # Released before the mapping closes, or close() fails
+                with memoryview(mapped) as view:
+                    return decode(view)
+
+    def sweep(self, referenced: Iterable[str]) -> int:
+        """
+        Delete blobs no job references any more; returns the number removed
+        """
+        referenced = set(referenced)
+        cutoff = time.time() - self._grace_s
+        removed = 0
+        for prefix in os.listdir(self.root):
+            directory = os.path.join(self.root, prefix)
+            if not os.path.isdir(directory):
+                continue
+            for name in os.listdir(directory):
+                path = os.path.join(directory, name)
+                if name in referenced:
+                    continue
+                try:
+                    # Grace period: the row referencing a fresh blob may not be committed yet
+                    if os.path.getmtime(path) > cutoff:
+                        continue
+                    os.unlink(path)
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+        JOB_BLOBS_SWEPT.inc(removed)
+        return removed
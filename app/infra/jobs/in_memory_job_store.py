@@ -0,0 +1,129 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from uuid import UUID
+from typing import Any, Iterable, Optional, Tuple
+
+from app.core.metrics import EPHEMERAL_JOBS, EPHEMERAL_JOB_EVICTIONS
+from app.domain.jobs import Job, JobStatus, JobStore
+
+# Only finished jobs are ever dropped: later updates to a dropped job are
+# lost, and a running job's updates are what the caller is waiting on
+_FINISHED = frozenset((
+    JobStatus.SUCCEEDED,
+    JobStatus.FAILED,
+    JobStatus.CANCELLED,
+    JobStatus.TIMEOUT,
+))
+
+
+class InMemoryJobStore(JobStore):
+    """
+    Process-local, non-durable job store for jobs nobody is expected to
+    look up later (sync predictions whose result went back inline).
+
+    Holds at most max_jobs finished jobs beyond those still pending or
+    running; the least recently written finished job is dropped first, and
+    finished jobs not written for ttl_s are dropped on the next access.
+    Unfinished jobs are never dropped. Updates to dropped jobs are ignored,
+    like updates to missing rows in SQL.
+    """
+
+    def __init__(self, max_jobs: int = 10_000, ttl_s: float = 300.0):
+        self._max_jobs = max_jobs
+        self._ttl_s = ttl_s
+        # job_id -> (job, last write time), oldest write first
+        self._jobs: "OrderedDict[UUID, Tuple[Job, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, job_id: UUID) -> bool:
+        with self._lock:
+            self._expire(time.monotonic())
+            return job_id in self._jobs
+
+    def create(self, job: Job) -> None:
+        with self._lock:
+            self._put(job)
+
+    def save_many(self, jobs: Iterable[Job]) -> None:
+        with self._lock:
+            for job in jobs:
+                self._put(job)
+
+    def get(self, job_id: UUID) -> Job:
+        with self._lock:
+            self._expire(time.monotonic())
+            entry = self._jobs.get(job_id)
+        if entry is None:
+            raise KeyError(f"Job {job_id} not found")
+        return entry[0]
+
+    def update_status(self, job_id: UUID, status: JobStatus, started_at: Optional[datetime] = None, finished_at: Optional[datetime] = None) -> None:
+        changes: dict = {"status": status}
+        if started_at is not None:
+            changes["started_at"] = started_at
+        if finished_at is not None:
+            changes["finished_at"] = finished_at
+        self._update(job_id, **changes)
+
+    def update_result(self, job_id: UUID, result: Any, finished_at: datetime) -> None:
+        self._update(job_id, result=result, finished_at=finished_at, status=JobStatus.SUCCEEDED)
+
+    def update_error(self, job_id: UUID, error_types: str, error_message: str, finished_at: datetime) -> None:
+        self._update(
+            job_id,
+            error_types=error_types,
+            error_message=error_message,
+            finished_at=finished_at,
+            status=JobStatus.FAILED,
+        )
+
+    def update_retry_metadata(self, job_id: UUID, attempt_count: int, latest_attempt_at: datetime, last_retry_reason: Optional[str]) -> None:
+        self._update(
+            job_id,
+            attempt_count=attempt_count,
+            last_attempt_at=latest_attempt_at,
+            last_retry_reason=last_retry_reason,
+        )
+
+    def _update(self, job_id: UUID, **changes) -> None:
+        with self._lock:
+            entry = self._jobs.get(job_id)
+            if entry is not None:
+                # Replace, don't mutate: jobs already handed out stay unchanged
+                self._put(entry[0].evolve(**changes))
+
+    def _put(self, job: Job) -> None:
+        # Caller holds self._lock
+        now = time.monotonic()
+        self._jobs[job.id] = (job, now)
+        self._jobs.move_to_end(job.id)
+        self._expire(now)
+        excess = len(self._jobs) - self._max_jobs
+        if excess > 0:
+            # Unfinished jobs are few (bounded by executor concurrency), so
+            # skipping over them to the oldest finished ones stays cheap
+            evict = []
+            for job_id, (held, _) in self._jobs.items():
+                if len(evict) == excess:
+                    break
+                if held.status in _FINISHED:
+                    evict.append(job_id)
+            for job_id in evict:
+                del self._jobs[job_id]
+                EPHEMERAL_JOB_EVICTIONS.labels("capacity").inc()
+        EPHEMERAL_JOBS.set(len(self._jobs))
+
+    def _expire(self, now: float) -> None:
+        # Caller holds self._lock; oldest writes are at the front
+        expired = []
+        for job_id, (job, written_at) in self._jobs.items():
+            if now - written_at <= self._ttl_s:
+                break
+            if job.status in _FINISHED:
+                expired.append(job_id)
+        for job_id in expired:
+            del self._jobs[job_id]
+            EPHEMERAL_JOB_EVICTIONS.labels("ttl").inc()
+        EPHEMERAL_JOBS.set(len(self._jobs))
@@ -0,0 +1,41 @@
+import argparse
+import logging
+import time
+
+from app.config.jobs import JOB_STORE
+from app.core.logging import setup_logging
+from app.infra.jobs.sqlite_job_store import SQLiteJobStore
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    One-off job store migrations; run while the server is stopped
+    """
+    parser = argparse.ArgumentParser(description="Migrate the SQLite job store")
+    parser.add_argument("--db-path", default=JOB_STORE["db_path"])
+    parser.add_argument(
+        "--incremental-vacuum",
+        action="store_true",
+        help="enable incremental vacuum on an existing database (full VACUUM, blocks writers)",
+    )
+    args = parser.parse_args(argv)
+    if not args.incremental_vacuum:
+        parser.error("nothing to do: pass --incremental-vacuum")
+
+    setup_logging()
+    store = SQLiteJobStore(args.db_path, **JOB_STORE.get("sqlite", {}))
+    try:
+        start = time.time()
+        migrated = store.enable_incremental_vacuum()
+        logger.info(
+            "job_store_migrated" if migrated else "job_store_already_migrated",
+            extra={"db_path": args.db_path, "latency_ms": (time.time() - start) * 1000},
+        )
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,146 @@
-import json
+import logging
 import sqlite3
+import threading
 from datetime import datetime
+from functools import partial
 from uuid import UUID
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
+
+from app.core.codecs import Codec, JsonCodec, MsgpackCodec, get_codec
+from app.domain.jobs import Deferred, Job, JobStatus, JobStore
+from app.infra.jobs.blob_store import BlobStore
+
+logger = logging.getLogger(__name__)
+
+# Fixed SQL text so each connection's statement cache reuses the prepared statements
+_INSERT = "INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+# Several processes may write the same job: an upsert only touches the columns
+# that change over a job's life, and never moves a finished job back. The one
+# change allowed on a finished job is the job service's own failed -> cancelled
+# / timeout, which update_error followed by update_status produces
+_UPSERT = """
+    INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (id) DO UPDATE SET
+        status = excluded.status,
+        started_at = excluded.started_at,
+        finished_at = excluded.finished_at,
+        result = excluded.result,
+        error_type = excluded.error_type,
+        error_message = excluded.error_message,
+        attempt_count = excluded.attempt_count,
+        last_attempt_at = excluded.last_attempt_at,
+        last_retry_reason = excluded.last_retry_reason
+    WHERE jobs.status NOT IN ('succeeded', 'failed', 'cancelled', 'timeout')
+        OR (jobs.status = 'failed' AND excluded.status IN ('cancelled', 'timeout'))
+"""
+_SELECT = "SELECT * FROM jobs WHERE id = ?"
+_UPDATE_STATUS = "UPDATE jobs SET status = ?, started_at = COALESCE(?, started_at), finished_at = COALESCE(?, finished_at) WHERE id = ?"
+_UPDATE_RESULT = "UPDATE jobs SET result = ?, finished_at = ?, status = ? WHERE id = ?"
+_UPDATE_ERROR = "UPDATE jobs SET error_type = ?, error_message = ?, finished_at = ?, status = ? WHERE id = ?"
+_UPDATE_RETRY = "UPDATE jobs SET attempt_count = ?, last_attempt_at = ?, last_retry_reason = ? WHERE id = ?"
+_DELETE_EXPIRED = """
+    DELETE FROM jobs WHERE id IN (
+        SELECT id FROM jobs WHERE status = ? AND created_at < ? AND sync = ? LIMIT ?
+    )
+"""
+
+_SELECT_BLOB_REFS = """
+    SELECT payload FROM jobs WHERE payload LIKE 'blob:%'
+    UNION
+    SELECT result FROM jobs WHERE result LIKE 'blob:%'
+"""
+
+# JSON text never starts with this, so inline values can't be mistaken for references
+_BLOB_PREFIX = "blob:"
+
+_INDEXES = (
+    # Retention scans and status listings
+    "CREATE INDEX IF NOT EXISTS idx_jobs_status_created_at ON jobs (status, created_at)",
+    # Per-model queries
+    "CREATE INDEX IF NOT EXISTS idx_jobs_model ON jobs (model_name, model_version)",
+    # Blob sweeps (_SELECT_BLOB_REFS) read only the rows that reference a blob
+    "CREATE INDEX IF NOT EXISTS idx_jobs_payload_blob ON jobs (payload) WHERE payload LIKE 'blob:%'",
+    "CREATE INDEX IF NOT EXISTS idx_jobs_result_blob ON jobs (result) WHERE result LIKE 'blob:%'",
+)
 
-from app.domain.jobs import Job, JobStatus, JobStore
 
 class SQLiteJobStore(JobStore):
-    def __init__(self, db_path: str = "app/instance/jobs.db"):
-        self._conn = sqlite3.connect(db_path, check_same_thread=False)
-        self._conn.row_factory = sqlite3.Row
+    """
+    One connection per thread, so readers never wait on a shared handle.
+    In WAL mode readers don't block the writer and vice versa;
+    concurrent writers wait up to busy_timeout_ms for the write lock.
+
+    Payloads and results are serialized with codec (stdlib json by default).
+    With a blob_store, payloads and results whose JSON is at least
+    blob_store.min_bytes are kept out of row and only read when accessed.
+    """
+    def __init__(
+        self,
+        db_path: str = "app/instance/jobs.db",
+        journal_mode: str = "wal",
+        synchronous: str = "normal",
+        busy_timeout_ms: int = 5000,
+        cached_statements: int = 64,
+        blob_store: Optional[BlobStore] = None,
+        codec: Optional[Codec] = None,
+    ):
+        self._db_path = db_path
+        self._journal_mode = journal_mode
+        self._synchronous = synchronous
+        self._busy_timeout_ms = busy_timeout_ms
+        self._cached_statements = cached_statements
+        self._blobs = blob_store
+        self._codec = codec or JsonCodec()
+        self._text_codec = self._codec if not self._codec.binary else get_codec("auto")
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
         self._init_schema()
     
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._db_path,
+            timeout=self._busy_timeout_ms / 1000.0,
+            cached_statements=self._cached_statements,
+            check_same_thread=False,   # close() runs on another thread
+        )
+        conn.row_factory = sqlite3.Row
+        # Incremental: freed pages can be returned in small steps by the compactor.
+        # Only applies to a new database, and must come before WAL writes its header
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute(f"PRAGMA journal_mode = {self._journal_mode}")
+        conn.execute(f"PRAGMA synchronous = {self._synchronous}")
+        conn.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout_ms)}")
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+    
+    def close(self) -> None:
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+    
     def _init_schema(self):
-        self._conn.execute(
+        conn = self._conn
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            # Existing databases need a full VACUUM, which blocks every writer:
+            # never at startup, only through enable_incremental_vacuum()
+            logger.warning(
+                "job_store_incremental_vacuum_disabled",
+                extra={"db_path": self._db_path, "migrate": "python -m app.infra.jobs.migrate --incremental-vacuum"},
+            )
+        
+        conn.execute(
             """
             CREATE TABLE IF NOT EXISTS jobs (
                 id TEXT PRIMARY KEY,
@@ -34,45 +161,95 @@ class SQLiteJobStore(JobStore):
                 last_retry_reason TEXT,
                 max_runtime_s REAL,
                 max_total_runtime_s REAL,
-                cancellable INTEGER NOT NULL DEFAULT 1
+                cancellable INTEGER NOT NULL DEFAULT 1,
+                sync INTEGER NOT NULL DEFAULT 0
             )
             """
         )
-        self._conn.commit()
+        
+        # Databases created before the sync column existed
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+        if "sync" not in columns:
+            conn.execute("ALTER TABLE jobs ADD COLUMN sync INTEGER NOT NULL DEFAULT 0")
+        
+        for statement in _INDEXES:
+            conn.execute(statement)
+        conn.commit()
     
-    def create(self, job: Job) -> None:
-        self._conn.execute(
-            """
-            INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                str(job.id),
-                job.model_name,
-                job.model_version,
-                json.dumps(job.payload),
-                job.status.value,
-                job.device,
-                job.created_at.isoformat(),
-                job.started_at.isoformat() if job.started_at else None,
-                job.finished_at.isoformat() if job.finished_at else None,
-                json.dumps(job.result) if job.result is not None else None,
-                job.error_types if job.error_types is not None else None,
-                job.error_message if job.error_message is not None else None,
-                job.attempt_count,
-                job.max_attempts,
-                job.last_attempt_at.isoformat() if job.last_attempt_at else None,
-                job.last_retry_reason,
-                job.max_runtime_s,
-                job.max_total_runtime_s,
-                1 if job.cancellable else 0,
-            ),
+    def _encode(self, value: Any) -> str | bytes:
+        data = self._codec.encode(value)
+        if self._blobs is not None and len(data) >= self._blobs.min_bytes:
+            return f"{_BLOB_PREFIX}{self._codec.name}:{self._blobs.put(data)}"
+        return data if self._codec.binary else data.decode()
+    
+    def _encode_field(self, job: Job, name: str) -> str | bytes | None:
+        value = job.raw(name)
+        if isinstance(value, Deferred) and value.ref.startswith(_BLOB_PREFIX):
+            return value.ref  # never loaded: write the reference back as-is
+        if value is None and name == "result":
+            return None
+        return self._encode(value)
+    
+    def _decode(self, value: str | bytes | None) -> Any:
+        if not value:
+            return None
+        if isinstance(value, bytes):
+            # Only binary codecs write bytes
+            return self._binary_codec().decode(value)
+        if value.startswith(_BLOB_PREFIX):
+            codec_name, _, digest = value[len(_BLOB_PREFIX):].rpartition(":")
+            return Deferred(partial(self._load_blob, codec_name or "json", digest), ref=value)
+        # Text codecs all write JSON, whichever one wrote the row
+        return self._text_codec.decode(value)
+    
+    def _binary_codec(self) -> Codec:
+        return self._codec if self._codec.binary else get_codec(MsgpackCodec.name)
+    
+    def _codec_for(self, name: str) -> Codec:
+        return self._binary_codec() if name == MsgpackCodec.name else self._text_codec
+    
+    def _load_blob(self, codec_name: str, digest: str) -> Any:
+        return self._blobs.load(digest, self._codec_for(codec_name).decode)
+    
+    def _row(self, job: Job) -> tuple:
+        return (
+            str(job.id),
+            job.model_name,
+            job.model_version,
+            self._encode_field(job, "payload"),
+            job.status.value,
+            job.device,
+            job.created_at.isoformat(),
+            job.started_at.isoformat() if job.started_at else None,
+            job.finished_at.isoformat() if job.finished_at else None,
+            self._encode_field(job, "result"),
+            job.error_types if job.error_types is not None else None,
+            job.error_message if job.error_message is not None else None,
+            job.attempt_count,
+            job.max_attempts,
+            job.last_attempt_at.isoformat() if job.last_attempt_at else None,
+            job.last_retry_reason,
+            job.max_runtime_s,
+            job.max_total_runtime_s,
+            1 if job.cancellable else 0,
+            1 if job.sync else 0,
         )
-        self._conn.commit()
+    
+    def create(self, job: Job) -> None:
+        conn = self._conn
+        conn.execute(_INSERT, self._row(job))
+        conn.commit()
+    
+    def save_many(self, jobs: Iterable[Job]) -> None:
+        """
+        Insert or update jobs in one transaction; finished jobs keep their outcome
+        """
+        conn = self._conn
+        with conn:
+            conn.executemany(_UPSERT, [self._row(job) for job in jobs])
     
     def get(self, job_id: UUID) -> Job:
-        row = self._conn.execute(
-            "SELECT * FROM jobs WHERE id = ?", (str(job_id),)
-        ).fetchone()
+        row = self._conn.execute(_SELECT, (str(job_id),)).fetchone()
         
         if not row:
             raise KeyError(f"Job {job_id} not found")
@@ -81,13 +258,13 @@ class SQLiteJobStore(JobStore):
             id=UUID(row["id"]),
             model_name=row["model_name"],
             model_version=row["model_version"],
-            payload=json.loads(row["payload"]),
+            payload=self._decode(row["payload"]),
             status=JobStatus(row["status"]),
             device=row["device"],
             created_at=datetime.fromisoformat(row["created_at"]),
             started_at=datetime.fromisoformat(row["started_at"]) if row["started_at"] else None,
             finished_at=datetime.fromisoformat(row["finished_at"]) if row["finished_at"] else None,
-            result=json.loads(row["result"]) if row["result"] else None,
+            result=self._decode(row["result"]),
             error_types=row["error_type"],
             error_message=row["error_message"],
             attempt_count=row["attempt_count"],
@@ -97,41 +274,37 @@ class SQLiteJobStore(JobStore):
             max_runtime_s=row["max_runtime_s"],
             max_total_runtime_s=row["max_total_runtime_s"],
             cancellable=bool(row["cancellable"]),
+            sync=bool(row["sync"]),
         )
     
     def update_status(self, job_id: UUID, status: JobStatus, started_at: Optional[datetime]=None, finished_at:Optional[datetime]=None) -> None:
-        self._conn.execute(
-            "UPDATE jobs SET status = ?, started_at = COALESCE(?, started_at), finished_at = COALESCE(?, finished_at) WHERE id = ?",
+        conn = self._conn
+        conn.execute(
+            _UPDATE_STATUS,
             (status.value,
             started_at.isoformat() if started_at else None,
             finished_at.isoformat() if finished_at else None,
             str(job_id)),
         )
-        self._conn.commit()
+        conn.commit()
     
     def update_result(self, job_id:UUID, result:Any, finished_at: datetime):
-        self._conn.execute(
-            """
-                UPDATE jobs 
-                SET result = ?, finished_at = ?, status=?
-                WHERE id = ?
-            """,
+        conn = self._conn
+        conn.execute(
+            _UPDATE_RESULT,
             (
-                json.dumps(result),
+                self._encode(result),
                 finished_at.isoformat(),
                 JobStatus.SUCCEEDED.value,
                 str(job_id),
             ),
         )
-        self._conn.commit()
+        conn.commit()
     
     def update_error(self, job_id:UUID, error_types:str, error_message:str, finished_at:datetime):
-        self._conn.execute(
-            """
-            UPDATE jobs
-            SET error_type =?, error_message = ?, finished_at = ?, status = ?
-            WHERE id = ?
-            """,
+        conn = self._conn
+        conn.execute(
+            _UPDATE_ERROR,
             (
                 error_types,
                 error_message,
@@ -140,7 +313,7 @@ class SQLiteJobStore(JobStore):
                 str(job_id)
             ),
         )
-        self._conn.commit()
+        conn.commit()
     
     def update_retry_metadata(
         self,
@@ -149,18 +322,70 @@ class SQLiteJobStore(JobStore):
         latest_attempt_at: datetime,
         last_retry_reason: Optional[str]
     ) -> None:
-        self._conn.execute(
-            """
-            UPDATE jobs
-            SET attempt_count = ?, last_attempt_at = ?, last_retry_reason = ?
-            WHERE id = ?
-            """,
+        conn = self._conn
+        conn.execute(
+            _UPDATE_RETRY,
             (
                 attempt_count,
-                latest_attempt_at,
+                latest_attempt_at.isoformat(),
                 last_retry_reason,
                 str(job_id),
             ),
         )
-        self._conn.commit()
-    
\ No newline at end of file
+        conn.commit()
+    
+    def delete_expired(self, status: JobStatus, sync: bool, created_before: datetime, limit: int) -> int:
+        """
+        Delete up to limit jobs of this status and kind created before the cutoff.
+        Returns the number of rows deleted.
+        """
+        conn = self._conn
+        with conn:
+            cursor = conn.execute(
+                _DELETE_EXPIRED,
+                (status.value, created_before.isoformat(), 1 if sync else 0, limit),
+            )
+        return cursor.rowcount
+    
+    def enable_incremental_vacuum(self) -> bool:
+        """
+        One-off migration of a database created without incremental vacuum.
+        Rewrites the whole file (full VACUUM) and needs the database to
+        itself: run it with no other process attached.
+        Returns False if it was already enabled.
+        """
+        conn = self._conn
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+            return False
+        # VACUUM can't change auto_vacuum in WAL mode
+        conn.execute("PRAGMA journal_mode = delete")
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+        conn.execute(f"PRAGMA journal_mode = {self._journal_mode}")
+        return True
+    
+    def incremental_vacuum(self, max_pages: int) -> None:
+        """
+        Return up to max_pages free pages to the file system
+        """
+        conn = self._conn
+        conn.execute(f"PRAGMA incremental_vacuum({int(max_pages)})").fetchall()
+        conn.commit()
+    
+    def size_bytes(self) -> int:
+        conn = self._conn
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        return page_count * page_size
+    
+    def sweep_blobs(self) -> int:
+        """
+        Delete blobs no longer referenced by any job
+        """
+        if self._blobs is None:
+            return 0
+        referenced = {
+            row[0].rpartition(":")[2]
+            for row in self._conn.execute(_SELECT_BLOB_REFS)
+        }
+        return self._blobs.sweep(referenced)
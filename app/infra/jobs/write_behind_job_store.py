@@ -0,0 +1,207 @@
+import logging
+import threading
+import time
+from datetime import datetime
+from uuid import UUID
+from typing import Any, Dict, Iterable, Optional, Set
+
+from app.core.metrics import (
+    JOB_STORE_FLUSH_SIZE,
+    JOB_STORE_FLUSH_LATENCY,
+    JOB_STORE_FLUSH_ERRORS,
+    JOB_STORE_DIRTY,
+    JOB_STORE_UNWRITABLE,
+)
+from app.domain.jobs import Job, JobStatus, JobStore
+
+logger = logging.getLogger(__name__)
+
+# A job whose payload or result the codec can't encode: retrying never helps
+_UNWRITABLE = (TypeError, ValueError)
+
+
+class WriteBehindJobStore(JobStore):
+    """
+    Buffers job state transitions in memory and writes them to the
+    backing store in grouped transactions.
+
+    A flush runs every flush_interval_ms, or as soon as max_batch_size
+    jobs are dirty. Reads see buffered state; after a crash, at most
+    one flush interval of transitions is lost. With several processes
+    on one database, a job another process already finished keeps its
+    outcome (see the backing store's save_many). A job whose state can't
+    be encoded is stored as failed rather than holding back the others.
+    """
+
+    def __init__(
+        self,
+        backing: JobStore,
+        flush_interval_ms: float = 5.0,
+        max_batch_size: int = 256,
+    ):
+        self._backing = backing
+        self._flush_interval_s = flush_interval_ms / 1000.0
+        self._max_batch_size = max_batch_size
+
+        # Latest state of every job not yet confirmed written; Job objects are
+        # replaced, never mutated, so callers never see later transitions
+        self._jobs: Dict[UUID, Job] = {}
+        self._dirty: Set[UUID] = set()
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._closed = False
+
+        self._thread = threading.Thread(
+            target=self._flush_loop,
+            name="job-store-write-behind",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def create(self, job: Job) -> None:
+        with self._cond:
+            self._put(job)
+
+    def get(self, job_id: UUID) -> Job:
+        with self._cond:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+        return self._backing.get(job_id)
+
+    def update_status(self, job_id: UUID, status: JobStatus, started_at: Optional[datetime] = None, finished_at: Optional[datetime] = None) -> None:
+        changes: Dict[str, Any] = {"status": status}
+        if started_at is not None:
+            changes["started_at"] = started_at
+        if finished_at is not None:
+            changes["finished_at"] = finished_at
+        self._update(job_id, **changes)
+
+    def update_result(self, job_id: UUID, result: Any, finished_at: datetime) -> None:
+        self._update(job_id, result=result, finished_at=finished_at, status=JobStatus.SUCCEEDED)
+
+    def update_error(self, job_id: UUID, error_types: str, error_message: str, finished_at: datetime) -> None:
+        self._update(
+            job_id,
+            error_types=error_types,
+            error_message=error_message,
+            finished_at=finished_at,
+            status=JobStatus.FAILED,
+        )
+
+    def update_retry_metadata(self, job_id: UUID, attempt_count: int, latest_attempt_at: datetime, last_retry_reason: Optional[str]) -> None:
+        self._update(
+            job_id,
+            attempt_count=attempt_count,
+            last_attempt_at=latest_attempt_at,
+            last_retry_reason=last_retry_reason,
+        )
+
+    def save_many(self, jobs: Iterable[Job]) -> None:
+        with self._cond:
+            for job in jobs:
+                self._put(job)
+
+    def _update(self, job_id: UUID, **changes) -> None:
+        with self._cond:
+            job = self._jobs.get(job_id)
+        if job is None:
+            # Not buffered: start from the persisted row (raises KeyError if unknown)
+            job = self._backing.get(job_id)
+        with self._cond:
+            # Re-read: another transition may have been buffered meanwhile
+            job = self._jobs.get(job_id, job)
+            self._put(job.evolve(**changes))
+
+    def _put(self, job: Job) -> None:
+        # Caller holds self._cond
+        self._jobs[job.id] = job
+        self._dirty.add(job.id)
+        JOB_STORE_DIRTY.set(len(self._dirty))
+        if len(self._dirty) >= self._max_batch_size:
+            self._cond.notify()
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._cond:
+                if not self._closed and len(self._dirty) < self._max_batch_size:
+                    self._cond.wait(timeout=self._flush_interval_s)
+                closed = self._closed
+            self.flush()
+            if closed:
+                return
+
+    def flush(self) -> None:
+        """
+        Write all buffered transitions to the backing store now
+        """
+        with self._flush_lock:
+            with self._cond:
+                if not self._dirty:
+                    return
+                batch = [self._jobs[job_id] for job_id in self._dirty]
+                self._dirty.clear()
+
+            start = time.time()
+            try:
+                self._backing.save_many(batch)
+            except Exception:
+                JOB_STORE_FLUSH_ERRORS.inc()
+                logger.exception("job_store_flush_failed", extra={"jobs": len(batch)})
+                # One bad job must not hold back the rest: write them one by one
+                failed = [job for job in batch if not self._save_one(job)]
+                with self._cond:
+                    # Retry on the next flush, keeping any newer state
+                    self._dirty.update(job.id for job in failed)
+                    JOB_STORE_DIRTY.set(len(self._dirty))
+
+            JOB_STORE_FLUSH_LATENCY.observe(time.time() - start)
+            JOB_STORE_FLUSH_SIZE.observe(len(batch))
+
+            with self._cond:
+                # Written and not changed since: reads can go to the backing store
+                for job in batch:
+                    if job.id not in self._dirty and self._jobs.get(job.id) is job:
+                        del self._jobs[job.id]
+                JOB_STORE_DIRTY.set(len(self._dirty))
+
+    def _save_one(self, job: Job) -> bool:
+        """
+        Write one job; False if it should be retried later.
+        A job the backing store can't encode is stored as failed without
+        its result, or dropped if even that can't be written.
+        """
+        try:
+            self._backing.save_many([job])
+            return True
+        except _UNWRITABLE as e:
+            error = e
+        except Exception:
+            return False  # e.g. database busy: transient
+        try:
+            self._backing.save_many([job.evolve(
+                status=JobStatus.FAILED,
+                result=None,
+                error_types=type(error).__name__,
+                error_message=f"Job state could not be stored: {error}",
+                finished_at=job.finished_at or datetime.utcnow(),
+            )])
+            outcome = "marked_failed"
+        except _UNWRITABLE:
+            outcome = "dropped"
+        except Exception:
+            return False
+        JOB_STORE_UNWRITABLE.labels(outcome).inc()
+        logger.error("job_store_unwritable_job", extra={"job_id": str(job.id), "outcome": outcome, "error": str(error)})
+        return True
+
+    def close(self) -> None:
+        """
+        Stop the flusher after writing everything still buffered
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
@@ -1,4 +1,4 @@
-from .prediction_service import PredictionError, InferenceExecutionError, PredictionService
+from .prediction_service import PredictionError, InferenceExecutionError, ServiceOverloadedError, PredictionService
 from .async_inference_service import AsyncInferenceService
 
-__all__ = ['PredictionError', 'PredictionService', 'InferenceExecutionError', 'AsyncInferenceService']
\ No newline at end of file
+__all__ = ['PredictionError', 'PredictionService', 'InferenceExecutionError', 'ServiceOverloadedError', 'AsyncInferenceService']
\ No newline at end of file
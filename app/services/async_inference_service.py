@@ -1,7 +1,9 @@
+from functools import partial
 from typing import Any
 from uuid import UUID
 
-from app.services.prediction_service import PredictionService
+from app.services.prediction_service import PredictionService, ServiceOverloadedError
+from app.execution.executor import ExecutorSaturatedError
 from app.services.job_service import JobService
 from app.domain.jobs.job import Job
 
@@ -59,7 +61,7 @@ class AsyncInferenceService:
                 request_id=None,
             )
 
-        executor.submit_background(run)
+        self._submit_background(executor, job_id, run)
         return job_id
 
     def submit_batch(
@@ -92,9 +94,24 @@ class AsyncInferenceService:
                 request_id=None,
             )
 
-        executor.submit_background(run)
+        self._submit_background(executor, job_id, run)
         return job_id
 
+    def _submit_background(self, executor, job_id: UUID, run) -> None:
+        try:
+            # Dropped after waiting too long in the queue: fail the job, don't leave it pending
+            executor.submit_background(run, on_reject=partial(self._rejected, job_id))
+        except ExecutorSaturatedError as e:
+            self._rejected(job_id, e)
+            raise ServiceOverloadedError(str(e), retry_after_s=e.retry_after_s) from e
+
+    def _rejected(self, job_id: UUID, e: ExecutorSaturatedError) -> None:
+        self._job_service.mark_failed(
+            job_id,
+            error_types=type(e).__name__,
+            error_message=str(e),
+        )
+
     def get(self, job_id: UUID) -> Job:
         """
         Read job state from persistent store.
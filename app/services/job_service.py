@@ -1,13 +1,30 @@
+import threading
 from datetime import datetime
 from uuid import UUID, uuid4
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, Optional
 
+from app.core.cancellation import CancellationToken
 from app.domain.jobs import Job, JobStatus, JobStore
 
 
 class JobService:
-    def __init__(self, store: JobStore):
-        self._store = store
+    """
+    Sync jobs (result returned inline) go to ephemeral_store when one is
+    set, unless their model:version is listed in persist_sync;
+    everything else goes to the durable store.
+    """
+    def __init__(
+        self,
+        store: JobStore,
+        ephemeral_store: JobStore | None = None,
+        persist_sync: Iterable[str] = (),
+    ):
+        self._durable_store = store
+        self._ephemeral_store = ephemeral_store
+        self._persist_sync = set(persist_sync)
+        # Tokens of attempts currently executing, so cancel_job can stop the work
+        self._tokens: Dict[UUID, CancellationToken] = {}
+        self._tokens_lock = threading.Lock()
         
     def create_job(
         self,
@@ -19,6 +36,7 @@ class JobService:
         max_runtime_s: float | None = None,
         max_total_runtime_s: float | None = None,
         cancellable: bool = True,
+        sync: bool = False,
     ) -> UUID:
         job = Job(
             id =uuid4(),
@@ -33,31 +51,53 @@ class JobService:
             max_runtime_s=max_runtime_s,
             max_total_runtime_s=max_total_runtime_s,
             cancellable=cancellable,
+            sync=sync,
         )
         
-        self._store.create(job)
-        self._store.update_status(job.id, JobStatus.PENDING)
+        job.status = JobStatus.PENDING
+        if sync and self._ephemeral_store is not None and f"{model_name}:{model_version}" not in self._persist_sync:
+            self._ephemeral_store.create(job)
+        else:
+            self._durable_store.create(job)
         return job.id
     
+    def record_completed(self, model_name: str, model_version: str, payload, result: Any, sync: bool = True) -> UUID:
+        """
+        Job for a request answered without running inference (e.g. a cache hit)
+        """
+        job_id = self.create_job(
+            model_name=model_name,
+            model_version=model_version,
+            payload=payload,
+            sync=sync,
+        )
+        self.mark_succeeded(job_id, result)
+        return job_id
+    
+    def _store(self, job_id: UUID) -> JobStore:
+        if self._ephemeral_store is not None and job_id in self._ephemeral_store:
+            return self._ephemeral_store
+        return self._durable_store
+    
     def get_job(self, job_id: UUID) -> Job:
-        return self._store.get(job_id)
+        return self._store(job_id).get(job_id)
     
     def mark_running(self, job_id: UUID) -> None:
-        self._store.update_status(
+        self._store(job_id).update_status(
             job_id=job_id,
             status=JobStatus.RUNNING,
             started_at=datetime.utcnow(),
         )
     
     def mark_succeeded(self, job_id: UUID, result: Any) -> None:
-        self._store.update_result(
+        self._store(job_id).update_result(
             job_id=job_id,
             result=result,
             finished_at=datetime.utcnow(),
         )
     
     def mark_failed(self, job_id: UUID, error_types: str, error_message: str) -> None:
-        self._store.update_error(
+        self._store(job_id).update_error(
             job_id=job_id,
             error_types=error_types,
             error_message=error_message,
@@ -72,7 +112,7 @@ class JobService:
         new_attempt_count = job.attempt_count + 1
         now = datetime.utcnow()
         
-        self._store.update_retry_metadata(
+        self._store(job_id).update_retry_metadata(
             job_id=job_id,
             attempt_count=new_attempt_count,
             latest_attempt_at=now,
@@ -107,14 +147,33 @@ class JobService:
         if reason:
             message += f": {reason}"
             
-        self._store.update_error(
+        self._store(job_id).update_error(
             job_id=job_id,
             error_types="JobCancelled",
             error_message=message,
             finished_at=datetime.utcnow(),
         )
         
-        self._store.update_status(job_id=job_id, status=JobStatus.CANCELLED, finished_at=datetime.utcnow())
+        self._store(job_id).update_status(job_id=job_id, status=JobStatus.CANCELLED, finished_at=datetime.utcnow())
+        
+        with self._tokens_lock:
+            token = self._tokens.get(job_id)
+        if token is not None:
+            token.cancel("job cancelled")
+        
+    def open_attempt(self, job_id: UUID) -> CancellationToken:
+        """
+        Token for one execution attempt; cancelled by cancel_job
+        """
+        token = CancellationToken()
+        with self._tokens_lock:
+            self._tokens[job_id] = token
+        return token
+    
+    def close_attempt(self, job_id: UUID, token: CancellationToken) -> None:
+        with self._tokens_lock:
+            if self._tokens.get(job_id) is token:
+                del self._tokens[job_id]
         
     def is_cancelled(self, job: Job) -> bool:
         return job.status == JobStatus.CANCELLED
@@ -123,16 +182,16 @@ class JobService:
         now = datetime.utcnow()
         
         if hasattr(JobStatus, "TIMEOUT"):
-            self._store.update_error(
+            self._store(job_id).update_error(
                 job_id=job_id,
                 error_types="TimeoutError",
                 error_message=message,
                 finished_at=now,
             )
-            self._store.update_status(job_id, JobStatus.TIMEOUT, finished_at=now)
+            self._store(job_id).update_status(job_id, JobStatus.TIMEOUT, finished_at=now)
         else:
             # Fallback: model TIMEOUT as FAILED + TimeoutError
-            self._store.update_error(
+            self._store(job_id).update_error(
                 job_id=job_id,
                 error_types="TimeoutError",
                 error_message=message,
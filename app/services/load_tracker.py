@@ -0,0 +1,64 @@
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Tuple
+
+
+class LoadTracker:
+    """
+    Live load per (model, version): requests in flight and a rolling p95
+    of end-to-end latency (queueing included) over the last window_s seconds,
+    capped at max_samples. Read by load-aware routing.
+    """
+
+    def __init__(self, window_s: float = 30.0, max_samples: int = 512):
+        self._window_s = window_s
+        self._max_samples = max_samples
+        self._inflight: Dict[Tuple[str, str], int] = {}
+        self._samples: Dict[Tuple[str, str], Deque[Tuple[float, float]]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def track(self, model_name: str, version: str):
+        """
+        Count the block as in flight; its duration is sampled if it succeeds
+        """
+        key = (model_name, version)
+        with self._lock:
+            self._inflight[key] = self._inflight.get(key, 0) + 1
+        start = time.time()
+        try:
+            yield
+            self._record(key, start)
+        finally:
+            with self._lock:
+                self._inflight[key] -= 1
+
+    def _record(self, key: Tuple[str, str], start: float) -> None:
+        now = time.time()
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self._max_samples)
+            samples.append((now, now - start))
+
+    def inflight(self, model_name: str, version: str) -> int:
+        return self._inflight.get((model_name, version), 0)
+
+    def latency_p95(self, model_name: str, version: str) -> float | None:
+        """
+        Seconds, or None without recent samples
+        """
+        cutoff = time.time() - self._window_s
+        with self._lock:
+            samples = self._samples.get((model_name, version))
+            if not samples:
+                return None
+            while samples and samples[0][0] < cutoff:
+                samples.popleft()
+            latencies = sorted(latency for _, latency in samples)
+        if not latencies:
+            return None
+        return latencies[math.ceil(0.95 * len(latencies)) - 1]
@@ -0,0 +1,111 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+from app.core.lifecycle import Readiness
+from app.core.metrics import MODEL_WARMUP_LATENCY, MODEL_READY
+from app.domain.registry.registry import ModelRegistry, ModelLoadError
+from app.execution.execution_policy import ExecutionPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class ModelPreloader:
+    """
+    Loads and warms the configured models in parallel at startup so the
+    first requests don't pay for model.load(). Required models gate readiness.
+    Failed loads are retried once the registry's backoff passes.
+
+    in_process_only is for a pre-fork parent: only models served in this
+    process are loaded, once each; process executors and retries are left
+    to the workers.
+    """
+
+    def __init__(
+        self,
+        registry: ModelRegistry,
+        execution_policy: ExecutionPolicy,
+        models: Dict[str, dict],
+        readiness: Readiness,
+        max_parallel: int = 4,
+        in_process_only: bool = False,
+    ):
+        self._registry = registry
+        self._execution_policy = execution_policy
+        self._models = models
+        self._readiness = readiness
+        self._max_parallel = max_parallel
+        self._in_process_only = in_process_only
+        self._stopped = threading.Event()
+        for key, spec in models.items():
+            if spec.get("required", False):
+                readiness.require(key)
+
+    def start(self) -> threading.Thread:
+        """
+        Preload in the background; the app serves /health (and a failing
+        /ready) meanwhile
+        """
+        thread = threading.Thread(target=self.run, name="model-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        """
+        Give up on loads still waiting for a retry
+        """
+        self._stopped.set()
+
+    def run(self) -> None:
+        if not self._models:
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_parallel, len(self._models)),
+            thread_name_prefix="model-preload",
+        ) as pool:
+            for key, spec in self._models.items():
+                pool.submit(self._preload, key, spec)
+
+    def _preload(self, key: str, spec: dict) -> None:
+        model_name, version = key.split(":", 1)
+        if self._in_process_only and self._execution_policy.resolve(model_name, version).isolated:
+            return  # Built by that executor's own worker processes
+        while True:
+            try:
+                self._load_and_warm(model_name, version, spec.get("warmup", ()))
+                break
+            except ModelLoadError as e:
+                # Reported as failed meanwhile; ready again once a retry succeeds
+                MODEL_READY.labels(model_name, version).set(0)
+                self._readiness.mark_failed(key, str(e))
+                if self._in_process_only or self._stopped.wait(e.retry_after_s):
+                    return
+            except Exception as e:
+                logger.exception("model_preload_failed", extra={"model": model_name, "version": version})
+                MODEL_READY.labels(model_name, version).set(0)
+                self._readiness.mark_failed(key, f"{type(e).__name__}: {e}")
+                return
+        MODEL_READY.labels(model_name, version).set(1)
+        self._readiness.mark_ready(key)
+        logger.info("model_preloaded", extra={"model": model_name, "version": version})
+
+    def _load_and_warm(self, model_name: str, version: str, warmup: Any) -> None:
+        executor = self._execution_policy.resolve(model_name, version)
+        if executor.isolated:
+            # Pipelines live in the worker processes: every worker is started
+            # and builds the model, even with no warmup samples
+            self._registry.ensure_exists(model_name, version)
+            start = time.time()
+            executor.warm(
+                models=[(model_name, version)],
+                warmup=[(model_name, version, sample) for sample in warmup],
+            )
+        else:
+            with self._registry.lease(model_name, version) as pipeline:
+                start = time.time()
+                for sample in warmup:
+                    pipeline.run(sample)
+        if warmup:
+            MODEL_WARMUP_LATENCY.labels(model_name, version).observe(time.time() - start)
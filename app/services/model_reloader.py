@@ -0,0 +1,132 @@
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+from app.core.metrics import MODEL_RELOADS, MODEL_RELOAD_LATENCY
+from app.domain.registry.registry import ModelRegistry
+from app.execution.execution_policy import ExecutionPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class ReloadInProgressError(Exception):
+    pass
+
+
+class ReloadUnsupportedError(Exception):
+    pass
+
+
+class ModelReloader:
+    """
+    Replaces a model version without a restart: the new pipeline is built
+    and warmed in the background while the old one keeps serving, then
+    swapped in atomically. The old pipeline is unloaded once the requests
+    already running on it have finished.
+
+    With a target ("module[:builder]") this also registers a new version
+    or points an existing one at a new definition.
+
+    Disabled (enabled=False) in pre-forked workers: each has its own copy
+    of the registry, so a reload would reach only the worker handling it.
+    """
+
+    def __init__(
+        self,
+        registry: ModelRegistry,
+        execution_policy: ExecutionPolicy,
+        warmup: Dict[str, list],
+        enabled: bool = True,
+    ):
+        self._registry = registry
+        self._execution_policy = execution_policy
+        self._warmup = warmup  # "model:version" -> warmup inputs
+        self._enabled = enabled
+        self._status: Dict[Tuple[str, str], dict] = {}
+        self._lock = threading.Lock()
+
+    def reload(self, model_name: str, version: str, target: str | None = None) -> dict:
+        """
+        Start a reload in the background; returns its initial status.
+        Raises ModelNotFoundError (unknown model, no target), ReloadInProgressError
+        or ReloadUnsupportedError.
+        """
+        if not self._enabled:
+            raise ReloadUnsupportedError(
+                "Models can't be reloaded or registered at runtime with pre-forked workers: "
+                "each worker has its own registry. Update the definitions and restart the server"
+            )
+        key = (model_name, version)
+        if target is None:
+            self._registry.ensure_exists(model_name, version)
+        with self._lock:
+            current = self._status.get(key)
+            if current is not None and current["state"] == "loading":
+                raise ReloadInProgressError(f"Model '{model_name}:{version}' is already being reloaded")
+            status = self._status[key] = {
+                "model": model_name,
+                "version": version,
+                "target": target,
+                "state": "loading",
+                "started_at": datetime.utcnow(),
+                "finished_at": None,
+                "error": None,
+            }
+            initial = dict(status)
+        threading.Thread(
+            target=self._run,
+            args=(model_name, version, target),
+            name=f"model-reload-{model_name}-{version}",
+            daemon=True,
+        ).start()
+        return initial
+
+    def status(self, model_name: str, version: str) -> dict | None:
+        with self._lock:
+            status = self._status.get((model_name, version))
+            return dict(status) if status is not None else None
+
+    def _run(self, model_name: str, version: str, target: str | None) -> None:
+        start = time.time()
+        try:
+            self._load_warm_and_swap(model_name, version, target, self._warmup.get(f"{model_name}:{version}", ()))
+        except Exception as e:
+            logger.exception("model_reload_failed", extra={"model": model_name, "version": version})
+            MODEL_RELOADS.labels(model_name, version, "failed").inc()
+            self._finish(model_name, version, "failed", f"{type(e).__name__}: {e}")
+            return
+        MODEL_RELOADS.labels(model_name, version, "swapped").inc()
+        logger.info(
+            "model_reloaded",
+            extra={"model": model_name, "version": version, "latency_ms": (time.time() - start) * 1000},
+        )
+        self._finish(model_name, version, "swapped", None)
+
+    def _load_warm_and_swap(self, model_name: str, version: str, target: str | None, warmup: Any) -> None:
+        executor = self._execution_policy.resolve(model_name, version)
+        start = time.time()
+        if executor.isolated:
+            # Pipelines live in the workers: start a warmed pool, then retire the old one
+            if target is not None:
+                self._registry.register(model_name, version, target)
+            executor.recycle(
+                definitions={f"{model_name}:{version}": target} if target is not None else None,
+                warmup=[(model_name, version, sample) for sample in warmup],
+            )
+            # No swap() here, so tell the listeners (result cache) ourselves
+            self._registry.notify_loaded(model_name, version)
+            MODEL_RELOAD_LATENCY.labels(model_name, version).observe(time.time() - start)
+            return
+
+        pipeline = self._registry.build(model_name, version, target=target)
+        for sample in warmup:
+            pipeline.run(sample)
+        MODEL_RELOAD_LATENCY.labels(model_name, version).observe(time.time() - start)
+        self._registry.swap(model_name, version, pipeline, target=target)
+
+    def _finish(self, model_name: str, version: str, state: str, error: str | None) -> None:
+        with self._lock:
+            status = self._status[(model_name, version)]
+            status.update(state=state, finished_at=datetime.utcnow(), error=error)
@@ -1,12 +1,22 @@
+import asyncio
 import logging
 import time
+from contextlib import nullcontext
+from functools import partial
 from typing import Any
 
-from app.domain.registry.registry import ModelRegistry, ModelNotFoundError
-from app.execution.executor import ExecutionTimeoutError, InferenceExecutor
+from app.core.cancellation import CancellationToken, ExecutionCancelledError
+from app.domain.registry.registry import ModelRegistry, ModelNotFoundError, ModelLoadError
+from app.execution.executor import ExecutionTimeoutError, ExecutorSaturatedError, InferenceExecutor
 from app.services.routing_service import RoutingService
 from app.services.job_service import JobService
 from app.execution.execution_policy import ExecutionPolicy
+from app.execution.batching import BatchingPolicy
+from app.services.result_cache import MISS, ResultCache
+from app.services.single_flight import SingleFlight
+from app.services.load_tracker import LoadTracker
+from app.services.shadow_traffic import ShadowMirror
+from app.core.hashing import canonical_hash
 from app.domain.jobs.job_state import JobStatus
 from app.core.metrics import (
     INFERENCE_REQUESTS,
@@ -27,6 +37,15 @@ class InferenceExecutionError(PredictionError):
     pass
 
 
+class ServiceOverloadedError(PredictionError):
+    """
+    Executor refused the work; the caller should back off and retry
+    """
+    def __init__(self, message: str, retry_after_s: float = 1.0):
+        super().__init__(message)
+        self.retry_after_s = retry_after_s
+
+
 class PredictionService:
     def __init__(
         self,
@@ -35,11 +54,23 @@ class PredictionService:
         routing_service: RoutingService,
         execution_policy: ExecutionPolicy,
         job_service: JobService,
+        batching_policy: BatchingPolicy | None = None,
+        result_cache: ResultCache | None = None,
+        cache_hits_create_jobs: bool = False,
+        single_flight: SingleFlight | None = None,
+        load_tracker: LoadTracker | None = None,
+        shadow_mirror: ShadowMirror | None = None,
     ):
         self._registry = registry
         self._router = routing_service
         self._execution_policy = execution_policy
         self._job_service = job_service
+        self._batching_policy = batching_policy
+        self._result_cache = result_cache
+        self._cache_hits_create_jobs = cache_hits_create_jobs
+        self._single_flight = single_flight
+        self._load_tracker = load_tracker
+        self._shadow_mirror = shadow_mirror
     
     def _run_inference_with_existing_job(
         self,
@@ -49,126 +80,488 @@ class PredictionService:
         payload: Any,
         timeout_s: float | None,
         request_id: str | None,
+        micro_batch: bool = False,
     ) -> Any:
+        with self._tracked(model_name, version):
+            return self._run_with_existing_job(
+                job_id=job_id,
+                model_name=model_name,
+                version=version,
+                payload=payload,
+                timeout_s=timeout_s,
+                request_id=request_id,
+                batch=False,
+                micro_batch=micro_batch,
+            )
+    
+    def _tracked(self, model_name: str, version: str):
+        # Inflight count and latency sample for load-aware routing
+        if self._load_tracker is None:
+            return nullcontext()
+        return self._load_tracker.track(model_name, version)
+    
+    def _call_pipeline(self, model_name: str, version: str, method: str, payload: Any) -> Any:
+        """
+        Run a pipeline method wherever the model's executor keeps its pipelines
+        """
+        executor = self._execution_policy.resolve(model_name, version)
+        if executor.isolated:
+            return executor.submit_pipeline(model_name, version, method, payload)
+        with self._registry.lease(model_name, version) as pipeline:
+            return getattr(pipeline, method)(payload)
+    
+    def _prepare(self, model_name: str, version: str, batch: bool, micro_batch: bool):
+        """
+        Resolve (executor, batcher) for one request.
+        Raises ModelNotFoundError for unknown models.
+        """
         executor = self._execution_policy.resolve(model_name, version)
+        if executor.isolated:
+            # Pipelines live in the worker processes, only validate the key here
+            self._registry.ensure_exists(model_name, version)
+        else:
+            # Load now, on the caller; workers lease it when they run
+            self._registry.get(model_name, version)
+        
+        # Only callers that block outside the executor may join a micro-batch,
+        # otherwise background jobs could wait on work queued behind themselves
+        batcher = None
+        if micro_batch and not batch and self._batching_policy is not None:
+            batcher = self._batching_policy.resolve(
+                model_name,
+                version,
+                run_batch=partial(self._call_pipeline, model_name, version, "run_batch"),
+            )
+        return executor, batcher
+    
+    def _run_once_fn(self, job_id, model_name: str, version: str, method: str, payload: Any):
+        """
+        Attempt body for thread executors; job transitions happen on the worker
+        """
+        def run_once(token: CancellationToken):
+            # May have been dropped (timeout, cancel) while still queued
+            token.raise_if_cancelled()
+            self._job_service.mark_running(job_id=job_id)
+            try:
+                # Leased: the registry won't unload it while this attempt runs
+                with self._registry.lease(model_name, version) as pipeline:
+                    result = getattr(pipeline, method)(payload, cancel_token=token)
+                # Don't record results of an attempt the caller abandoned
+                token.raise_if_cancelled()
+                self._job_service.mark_succeeded(job_id, result)
+                return result
+            except ExecutionCancelledError:
+                raise
+            except Exception as e:
+                self._job_service.mark_failed(
+                    job_id,
+                    error_types=type(e).__name__,
+                    error_message=str(e),
+                )
+                raise
+        return run_once
+    
+    def _begin_attempt(
+        self,
+        job_id,
+        model_name: str,
+        version: str,
+        timeout_s: float | None,
+        last_error: Exception | None,
+    ) -> tuple[bool, float | None]:
+        """
+        Record the next attempt if the job has budget left.
+        Returns (proceed, effective timeout).
+        """
+        job = self._job_service.get_job(job_id=job_id)
+        
+        if self._job_service.is_cancelled(job):
+            raise InferenceExecutionError(f"Job {job_id} was cancelled")
+        
+        if not self._job_service.should_retry(job) and job.attempt_count > 0:
+            return False, None
+        
+        self._job_service.record_attempt(
+            job_id=job_id, 
+            reason=(type(last_error).__name__ if last_error else "initial")
+        )
+        
+        INFERENCE_RETRIES.labels(
+            model_name,
+            version,
+            type(last_error).__name__ if last_error else "initial",
+        ).inc()
+        
+        effective_timeout = timeout_s
+        if job.max_runtime_s is not None:
+            effective_timeout = (
+                min(timeout_s, job.max_runtime_s)
+                if timeout_s is not None
+                else job.max_runtime_s
+            )
+        return True, effective_timeout
+    
+    def _succeeded(self, job_id, model_name: str, version: str, start: float, request_id: str | None, batch: bool) -> None:
+        latency = time.time() - start
+        INFERENCE_LATENCY.labels(model_name, version).observe(latency)
+        
+        logger.info(
+            "batch_inference_success" if batch else "inference_success",
+            extra={
+                "request_id": request_id,
+                "job_id": str(job_id),
+                "model": model_name,
+                "version": version,
+                "latency_ms": latency * 1000,
+            },
+        )
+    
+    def _should_retry_timeout(self, job_id, model_name: str, version: str, e: ExecutionTimeoutError) -> bool:
+        INFERENCE_ERRORS.labels(model_name, version, "timeout").inc() #transient failure candidate
+        job = self._job_service.get_job(job_id=job_id)
+        
+        if self._job_service.has_exceeded_total_budget(job):
+            # Out of total budget: mark timeout and stop
+            self._job_service.mark_timeout(job_id, message=str(e))
+            INFERENCE_RETRY_EXHAUSTED.labels(
+                model_name,
+                version,
+                type(e).__name__,
+            ).inc()
+            return False
+        
+        if not self._job_service.should_retry(job):
+            INFERENCE_RETRY_EXHAUSTED.labels(
+                model_name,
+                version,
+                type(e).__name__,
+            ).inc()
+            return False
+        return True
+    
+    def _cancelled(self, job_id, model_name: str, version: str, e: ExecutionCancelledError) -> InferenceExecutionError:
+        INFERENCE_ERRORS.labels(model_name, version, "cancelled").inc()
+        return InferenceExecutionError(f"Job {job_id} was cancelled")
+    
+    def _overloaded(self, job_id, model_name: str, version: str, e: ExecutorSaturatedError) -> ServiceOverloadedError:
+        # Shed load instead of queueing or retrying into a full executor
+        INFERENCE_ERRORS.labels(model_name, version, "saturated").inc()
+        self._job_service.mark_failed(
+            job_id,
+            error_types=type(e).__name__,
+            error_message=str(e),
+        )
+        return ServiceOverloadedError(str(e), retry_after_s=e.retry_after_s)
+    
+    def _exhausted(self, model_name: str, version: str, label: str, last_error: Exception | None) -> InferenceExecutionError:
+        #If we reach here, we are out of attempts or we are chosing not to retry
+        if isinstance(last_error, ExecutionTimeoutError):
+            return InferenceExecutionError(str(last_error))
+        elif last_error is not None:
+            return InferenceExecutionError(
+                f"{label} failed for model '{model_name}:{version}'"
+            )
+        else:
+            # Defensive fallback; should not normally happen
+            return InferenceExecutionError(
+                f"{label} failed for model '{model_name}:{version}' with unknown error"
+            )
+    
+    def _model_not_found(self, job_id, model_name: str, version: str, e: ModelNotFoundError) -> PredictionError:
+        INFERENCE_ERRORS.labels(model_name, version, "model_not_found").inc()
+        self._job_service.mark_failed(
+            job_id,
+            error_types=type(e).__name__,
+            error_message=str(e),
+        )
+        return PredictionError(str(e))
+    
+    def _model_unavailable(self, job_id, model_name: str, version: str, e: ModelLoadError) -> ServiceOverloadedError:
+        # Load failed (now or recently): come back once the registry retries it
+        INFERENCE_ERRORS.labels(model_name, version, "model_load_failed").inc()
+        self._job_service.mark_failed(
+            job_id,
+            error_types=type(e).__name__,
+            error_message=str(e),
+        )
+        return ServiceOverloadedError(str(e), retry_after_s=e.retry_after_s)
+    
+    def _run_with_existing_job(
+        self,
+        job_id,
+        model_name: str,
+        version: str,
+        payload: Any,
+        timeout_s: float | None,
+        request_id: str | None,
+        batch: bool,
+        micro_batch: bool = False,
+    ) -> Any:
         INFERENCE_REQUESTS.labels(model_name, version).inc()
         start = time.time()
         
+        method = "run_batch" if batch else "run"
+        label = "Batch inference" if batch else "Inference"
+        
         try:
-            pipeline = self._registry.get(model_name, version)
-
-            def run_once():
-                self._job_service.mark_running(job_id=job_id)
-                try:
-                    result = pipeline.run(payload)
-                    self._job_service.mark_succeeded(job_id, result)
-                    return result
-                except Exception as e:
-                    self._job_service.mark_failed(
-                        job_id,
-                        error_types=type(e).__name__,
-                        error_message=str(e),
+            executor, batcher = self._prepare(model_name, version, batch, micro_batch)
+        except ModelNotFoundError as e:
+            raise self._model_not_found(job_id, model_name, version, e) from e
+        except ModelLoadError as e:
+            raise self._model_unavailable(job_id, model_name, version, e) from e
+        
+        run_once = self._run_once_fn(job_id, model_name, version, method, payload)
+        
+        def run_from_caller(timeout: float | None, token: CancellationToken):
+            # Job transitions stay in this thread, only inference is handed off
+            self._job_service.mark_running(job_id=job_id)
+            try:
+                if batcher is not None:
+                    result = batcher.submit(payload, timeout_s=timeout, cancel_token=token)
+                else:
+                    result = executor.submit_pipeline(
+                        model_name, version, method, payload,
+                        timeout_s=timeout, cancel_token=token,
                     )
-                    raise
-            
-            last_error: Exception | None = None
-            while True:
-                job = self._job_service.get_job(job_id=job_id)
-                
-                if self._job_service.is_cancelled(job):
-                    raise InferenceExecutionError(f"Job {job_id} was cancelled")
-                
-                if not self._job_service.should_retry(job) and job.attempt_count > 0:
-                    break
-                
-                self._job_service.record_attempt(
-                    job_id=job_id, 
-                    reason=(type(last_error).__name__ if last_error else "initial")
+            except (ExecutionTimeoutError, ExecutorSaturatedError, ExecutionCancelledError):
+                raise
+            except Exception as e:
+                self._job_service.mark_failed(
+                    job_id,
+                    error_types=type(e).__name__,
+                    error_message=str(e),
                 )
-                
-                INFERENCE_RETRIES.labels(
-                    model_name,
-                    version,
-                    type(last_error).__name__ if last_error else "initial",
-                ).inc()
-                
-                effective_timeout = timeout_s
-                if job.max_runtime_s is not None:
-                    effective_timeout = (
-                        min(timeout_s, job.max_runtime_s)
-                        if timeout_s is not None
-                        else job.max_runtime_s
+                raise
+            self._job_service.mark_succeeded(job_id, result)
+            return result
+        
+        last_error: Exception | None = None
+        while True:
+            proceed, effective_timeout = self._begin_attempt(job_id, model_name, version, timeout_s, last_error)
+            if not proceed:
+                break
+            
+            # Timeouts and cancel_job cancel this token, stopping the attempt's work
+            token = self._job_service.open_attempt(job_id)
+            try:
+                if batcher is not None or executor.isolated:
+                    result = run_from_caller(effective_timeout, token)
+                elif batch:
+                    result = executor.submit_batch(
+                        partial(run_once, token),
+                        timeout_s=effective_timeout,
+                        cancel_token=token,
                     )
+                else:
+                    result = executor.submit(run_once, token, timeout_s=effective_timeout, cancel_token=token)
                 
-                try:
-                    result = executor.submit(run_once, timeout_s=effective_timeout)
-                    
-                    latency = time.time() - start
-                    INFERENCE_LATENCY.labels(model_name, version).observe(latency)
-                    
-                    logger.info(
-                        "inference_success",
-                        extra={
-                            "request_id": request_id,
-                            "job_id": str(job_id),
-                            "model": model_name,
-                            "version": version,
-                            "latency_ms": latency * 1000,
-                        },
+                self._succeeded(job_id, model_name, version, start, request_id, batch)
+                return result
+            
+            except ExecutionTimeoutError as e:
+                last_error = e
+                if not self._should_retry_timeout(job_id, model_name, version, e):
+                    break
+            
+            except ExecutionCancelledError as e:
+                raise self._cancelled(job_id, model_name, version, e) from e
+            
+            except ExecutorSaturatedError as e:
+                raise self._overloaded(job_id, model_name, version, e) from e
+            
+            except Exception as e:
+                INFERENCE_ERRORS.labels(model_name, version, "inference_error").inc()
+                last_error = e
+                break #Non-Transient / Model errors: Do not retry
+            
+            finally:
+                self._job_service.close_attempt(job_id, token)
+        
+        raise self._exhausted(model_name, version, label, last_error) from last_error
+    
+    async def _run_with_existing_job_async(
+        self,
+        job_id,
+        model_name: str,
+        version: str,
+        payload: Any,
+        timeout_s: float | None,
+        request_id: str | None,
+        batch: bool,
+        micro_batch: bool = False,
+    ) -> Any:
+        """
+        Coroutine twin of _run_with_existing_job: executor futures are awaited
+        and job store calls run off the event loop
+        """
+        INFERENCE_REQUESTS.labels(model_name, version).inc()
+        start = time.time()
+        
+        method = "run_batch" if batch else "run"
+        label = "Batch inference" if batch else "Inference"
+        
+        try:
+            # May load the model on first use
+            executor, batcher = await asyncio.to_thread(
+                self._prepare, model_name, version, batch, micro_batch,
+            )
+        except ModelNotFoundError as e:
+            raise await asyncio.to_thread(self._model_not_found, job_id, model_name, version, e) from e
+        except ModelLoadError as e:
+            raise await asyncio.to_thread(self._model_unavailable, job_id, model_name, version, e) from e
+        
+        run_once = self._run_once_fn(job_id, model_name, version, method, payload)
+        
+        async def run_from_caller(timeout: float | None, token: CancellationToken):
+            await asyncio.to_thread(self._job_service.mark_running, job_id=job_id)
+            try:
+                if batcher is not None:
+                    result = await batcher.submit_async(payload, timeout_s=timeout, cancel_token=token)
+                else:
+                    result = await executor.submit_pipeline_async(
+                        model_name, version, method, payload,
+                        timeout_s=timeout, cancel_token=token,
                     )
-                    
-                    return result
-                
-                except ExecutionTimeoutError as e:
-                    INFERENCE_ERRORS.labels(model_name, version, "timeout").inc() #transient failure candidate
-                    last_error = e
-                    job = self._job_service.get_job(job_id=job_id)
-                    
-                    if self._job_service.has_exceeded_total_budget(job):
-                        # Out of total budget: mark timeout and stop
-                        self._job_service.mark_timeout(job_id, message=str(e))
-                        INFERENCE_RETRY_EXHAUSTED.labels(
-                            model_name,
-                            version,
-                            type(e).__name__,
-                        ).inc()
-                        break
-                    
-                    if not self._job_service.should_retry(job):
-                        INFERENCE_RETRY_EXHAUSTED.labels(
-                            model_name,
-                            version,
-                            type(e).__name__,
-                        ).inc()
-                        break
-                
-                except Exception as e:
-                    INFERENCE_ERRORS.labels(model_name, version, "inference_error").inc()
-                    last_error = e
-                    break #Non-Transient / Model errors: Do not retry
-                
-            #If we reach here, we are out of attempts or we are chosing not to retry
-            if isinstance(last_error, ExecutionTimeoutError):
-                raise InferenceExecutionError(str(last_error)) from last_error
-            elif last_error is not None:
-                raise InferenceExecutionError(
-                    f"Inference failed for model '{model_name}:{version}'"
-                ) from last_error
-            else:
-                # Defensive fallback; should not normally happen
-                raise InferenceExecutionError(
-                    f"Inference failed for model '{model_name}:{version}' with unknown error"
+            except (ExecutionTimeoutError, ExecutorSaturatedError, ExecutionCancelledError):
+                raise
+            except Exception as e:
+                await asyncio.to_thread(
+                    self._job_service.mark_failed,
+                    job_id,
+                    error_types=type(e).__name__,
+                    error_message=str(e),
                 )
-                
-        except ModelNotFoundError as e:
-            INFERENCE_ERRORS.labels(model_name, version, "model_not_found").inc()
-            self._job_service.mark_failed(
-                job_id,
-                error_types=type(e).__name__,
-                error_message=str(e),
+                raise
+            await asyncio.to_thread(self._job_service.mark_succeeded, job_id, result)
+            return result
+        
+        last_error: Exception | None = None
+        while True:
+            proceed, effective_timeout = await asyncio.to_thread(
+                self._begin_attempt, job_id, model_name, version, timeout_s, last_error,
             )
-            raise PredictionError(str(e)) from e
+            if not proceed:
+                break
+            
+            token = self._job_service.open_attempt(job_id)
+            try:
+                if batcher is not None or executor.isolated:
+                    result = await run_from_caller(effective_timeout, token)
+                elif batch:
+                    result = await executor.submit_batch_async(
+                        partial(run_once, token),
+                        timeout_s=effective_timeout,
+                        cancel_token=token,
+                    )
+                else:
+                    result = await executor.submit_async(run_once, token, timeout_s=effective_timeout, cancel_token=token)
+                
+                self._succeeded(job_id, model_name, version, start, request_id, batch)
+                return result
+            
+            except ExecutionTimeoutError as e:
+                last_error = e
+                if not await asyncio.to_thread(self._should_retry_timeout, job_id, model_name, version, e):
+                    break
+            
+            except ExecutionCancelledError as e:
+                raise self._cancelled(job_id, model_name, version, e) from e
+            
+            except ExecutorSaturatedError as e:
+                raise await asyncio.to_thread(self._overloaded, job_id, model_name, version, e) from e
+            
+            except Exception as e:
+                INFERENCE_ERRORS.labels(model_name, version, "inference_error").inc()
+                last_error = e
+                break #Non-Transient / Model errors: Do not retry
+            
+            finally:
+                self._job_service.close_attempt(job_id, token)
+        
+        raise self._exhausted(model_name, version, label, last_error) from last_error
+
+    def _keyed(self, model_name: str, version: str) -> bool:
+        # Result caching and single flight are opt-in per model
+        return (
+            self._result_cache is not None and self._result_cache.caches(model_name, version)
+        ) or (
+            self._single_flight is not None and self._single_flight.coalesces(model_name, version)
+        )
+
+    def _request_key(self, model_name: str, version: str, method: str, payload: Any):
+        """
+        Identity of a request for result caching and single flight;
+        None if neither applies or the payload has no canonical form
+        """
+        if not self._keyed(model_name, version):
+            return None
+        try:
+            return (model_name, version, method, canonical_hash(payload))
+        except (TypeError, ValueError):
+            return None
 
+    async def _request_key_async(self, model_name: str, version: str, method: str, payload: Any):
+        # Hashing a large payload must not stall the event loop
+        if not self._keyed(model_name, version):
+            return None
+        return await asyncio.to_thread(self._request_key, model_name, version, method, payload)
+
+    def _cache_lookup(self, key, bypass_cache: bool) -> Any:
+        """
+        Cached result or MISS. Bypassing skips the lookup but still refreshes the entry.
+        """
+        if key is None or self._result_cache is None or not self._result_cache.caches(key[0], key[1]):
+            return MISS
+        if bypass_cache:
+            self._result_cache.record_bypass(key[0], key[1])
+            return MISS
+        return self._result_cache.get(key)
+    
+    def _cache_generation(self, key) -> int | None:
+        # Read before running, so a result from a pipeline replaced meanwhile isn't stored
+        if key is None or self._result_cache is None or not self._result_cache.caches(key[0], key[1]):
+            return None
+        return self._result_cache.generation(key[0], key[1])
+
+    def _cache_store(self, key, result: Any, generation: int | None) -> None:
+        if key is not None and self._result_cache is not None and self._result_cache.caches(key[0], key[1]):
+            self._result_cache.put(key, result, generation)
+    
+    def _cache_hit(self, model_name: str, version: str, payload: Any, result: Any) -> Any:
+        # Never reaches the executor; a job is only recorded if configured
+        if self._cache_hits_create_jobs:
+            self._job_service.record_completed(model_name, version, payload, result)
+        return result
+    
+    def _mirror(self, model_name: str, version: str, shadow_version: str | None, method: str, payload: Any, result: Any, start: float) -> None:
+        # Fire-and-forget replay on the shadow version; the response doesn't wait for it
+        if shadow_version is None or self._shadow_mirror is None:
+            return
+        self._shadow_mirror.mirror(model_name, version, shadow_version, method, payload, result, time.time() - start)
+    
+    def _coalesce(self, key, fn, timeout_s: float | None):
+        # Identical requests in flight share one job and one execution;
+        # a waiter stops waiting at its own deadline
+        if key is None or self._single_flight is None or not self._single_flight.coalesces(key[0], key[1]):
+            return fn()
+        try:
+            return self._single_flight.do(key, fn, timeout_s=timeout_s)
+        except ExecutionTimeoutError as e:
+            raise self._coalesce_timeout(key, e) from e
+    
+    async def _coalesce_async(self, key, fn, timeout_s: float | None):
+        if key is None or self._single_flight is None or not self._single_flight.coalesces(key[0], key[1]):
+            return await fn()
+        try:
+            return await self._single_flight.do_async(key, fn, timeout_s=timeout_s)
+        except ExecutionTimeoutError as e:
+            raise self._coalesce_timeout(key, e) from e
+    
+    def _coalesce_timeout(self, key, e: ExecutionTimeoutError) -> InferenceExecutionError:
+        # Only waiters see this: the leader's own timeouts are already wrapped
+        INFERENCE_ERRORS.labels(key[0], key[1], "timeout").inc()
+        return InferenceExecutionError(str(e))
+    
     def predict(
         self,
         model_name: str,
@@ -179,32 +572,49 @@ class PredictionService:
         max_attempts: int | None = None,
         max_runtime_s: float | None = None,
         max_total_runtime_s: float | None = None,
+        bypass_cache: bool = False,
     ) -> Any:
         # Resolve routing
+        shadow_version = self._router.shadow_version(model_name, version)
         model_name, version = self._router.resolve(
             model_name,
             version,
             identity_key=request_id,
         )
 
-        # Create job (Phase 9A)
-        job_id = self._job_service.create_job(
-            model_name=model_name,
-            model_version=version,
-            payload=payload,
-            max_attempts=max_attempts or 3,
-            max_runtime_s=max_runtime_s,
-            max_total_runtime_s=max_total_runtime_s,
-        )
+        key = self._request_key(model_name, version, "run", payload)
+        cached = self._cache_lookup(key, bypass_cache)
+        if cached is not MISS:
+            return self._cache_hit(model_name, version, payload, cached)
 
-        return self._run_inference_with_existing_job(
-            job_id=job_id,
-            model_name=model_name,
-            version=version,
-            payload=payload,
-            timeout_s=timeout_s,
-            request_id=request_id,
-        )
+        def run():
+            start = time.time()
+            generation = self._cache_generation(key)
+            # Create job (Phase 9A)
+            job_id = self._job_service.create_job(
+                model_name=model_name,
+                model_version=version,
+                payload=payload,
+                max_attempts=max_attempts or 3,
+                max_runtime_s=max_runtime_s,
+                max_total_runtime_s=max_total_runtime_s,
+                sync=True,
+            )
+
+            result = self._run_inference_with_existing_job(
+                job_id=job_id,
+                model_name=model_name,
+                version=version,
+                payload=payload,
+                timeout_s=timeout_s,
+                request_id=request_id,
+                micro_batch=True,
+            )
+            self._cache_store(key, result, generation)
+            self._mirror(model_name, version, shadow_version, "run", payload, result, start)
+            return result
+
+        return self._coalesce(key, run, max_total_runtime_s or timeout_s)
     
     def _run_batch_with_existing_job(
         self,
@@ -215,127 +625,131 @@ class PredictionService:
         timeout_s: float | None,
         request_id: str | None,
     ) -> list:
-        executor = self._execution_policy.resolve(model_name, version)
-        INFERENCE_REQUESTS.labels(model_name, version).inc()
-        
-        try:
-            pipeline = self._registry.get(model_name, version)
-            
-            def run_batch_once():
-                self._job_service.mark_running(job_id)
-
-                try:
-                    result = pipeline.run_batch(payloads)
-                    self._job_service.mark_succeeded(job_id, result)
-                    return result
-                except Exception as e:
-                    self._job_service.mark_failed(
-                        job_id,
-                        error_types=type(e).__name__,
-                        error_message=str(e),
-                    )
-                    raise
-            
-            last_error: Exception | None = None
+        with self._tracked(model_name, version):
+            return self._run_with_existing_job(
+                job_id=job_id,
+                model_name=model_name,
+                version=version,
+                payload=payloads,
+                timeout_s=timeout_s,
+                request_id=request_id,
+                batch=True,
+            )
+
+    def predict_batch(
+        self,
+        model_name: str,
+        version: str,
+        payloads: list,
+        timeout_s: float | None = None,
+        request_id: str | None = None,
+        max_attempts: int | None = None,
+        max_runtime_s: float | None = None,
+        max_total_runtime_s: float | None = None,
+        bypass_cache: bool = False,
+    ) -> list:
+        # Resolve routing
+        shadow_version = self._router.shadow_version(model_name, version)
+        model_name, version = self._router.resolve(
+            model_name,
+            version,
+            identity_key=request_id,
+        )
+
+        key = self._request_key(model_name, version, "run_batch", payloads)
+        cached = self._cache_lookup(key, bypass_cache)
+        if cached is not MISS:
+            return self._cache_hit(model_name, version, payloads, cached)
+
+        def run():
             start = time.time()
-            
-            while True:
-                job = self._job_service.get_job(job_id=job_id)
-                
-                if self._job_service.is_cancelled(job):
-                    raise InferenceExecutionError(f"Job {job_id} was cancelled")
+            generation = self._cache_generation(key)
+            # One job per batch (Phase 9A)
+            job_id = self._job_service.create_job(
+                model_name=model_name,
+                model_version=version,
+                payload=payloads,
+                max_attempts=max_attempts or 3,
+                max_runtime_s=max_runtime_s,
+                max_total_runtime_s=max_total_runtime_s,
+                sync=True,
+            )
 
-                if not self._job_service.should_retry(job) and job.attempt_count > 0:
-                    break
+            results = self._run_batch_with_existing_job(
+                job_id=job_id,
+                model_name=model_name,
+                version=version,
+                payloads=payloads,
+                timeout_s=timeout_s,
+                request_id=request_id,
+            )
+            self._cache_store(key, results, generation)
+            self._mirror(model_name, version, shadow_version, "run_batch", payloads, results, start)
+            return results
 
-                self._job_service.record_attempt(
-                    job_id=job_id,
-                    reason=(type(last_error).__name__ if last_error else "initial"),
-                )
-                
-                INFERENCE_RETRIES.labels(
-                    model_name,
-                    version,
-                    type(last_error).__name__ if last_error else "initial",
-                ).inc()
-                
-                effective_timeout = timeout_s
-                if job.max_runtime_s is not None:
-                    effective_timeout = (
-                        min(timeout_s, job.max_runtime_s)
-                        if timeout_s is not None
-                        else job.max_runtime_s
-                    )
-                
-                try:
-                    result = executor.submit_batch(run_batch_once, timeout_s=effective_timeout)
-
-                    latency = time.time() - start
-                    INFERENCE_LATENCY.labels(model_name, version).observe(latency)
-
-                    logger.info(
-                        "batch_inference_success",
-                        extra={
-                            "request_id": request_id,
-                            "job_id": str(job_id),
-                            "model": model_name,
-                            "version": version,
-                            "latency_ms": latency * 1000,
-                        },
-                    )
+        return self._coalesce(key, run, max_total_runtime_s or timeout_s)
+    
+    async def predict_async(
+        self,
+        model_name: str,
+        version: str,
+        payload: Any,
+        timeout_s: float | None = None,
+        request_id: str | None = None,
+        max_attempts: int | None = None,
+        max_runtime_s: float | None = None,
+        max_total_runtime_s: float | None = None,
+        bypass_cache: bool = False,
+    ) -> Any:
+        """
+        predict() for event-loop callers: waiting costs a coroutine, not a thread
+        """
+        shadow_version = self._router.shadow_version(model_name, version)
+        model_name, version = self._router.resolve(
+            model_name,
+            version,
+            identity_key=request_id,
+        )
 
-                    return result
-                
-                except ExecutionTimeoutError as e:
-                    INFERENCE_ERRORS.labels(model_name, version, "timeout").inc()
-                    last_error = e
-                    job = self._job_service.get_job(job_id=job_id)
-                    
-                    if self._job_service.has_exceeded_total_budget(job):
-                        # Out of total budget: mark timeout and stop
-                        self._job_service.mark_timeout(job_id, message=str(e))
-                        INFERENCE_RETRY_EXHAUSTED.labels(
-                            model_name,
-                            version,
-                            type(e).__name__,
-                        ).inc()
-                        break
-                    
-                    if not self._job_service.should_retry(job):
-                        INFERENCE_RETRY_EXHAUSTED.labels(
-                            model_name,
-                            version,
-                            type(e).__name__,
-                        ).inc()
-                        break
-
-                except Exception as e:
-                    INFERENCE_ERRORS.labels(model_name, version, "inference_error").inc()
-                    last_error = e
-                    break  # Non-transient / model errors: do not retry
-            
-            # Out of attempts or chose not to retry
-            if isinstance(last_error, ExecutionTimeoutError):
-                raise InferenceExecutionError(str(last_error)) from last_error
-            elif last_error is not None:
-                raise InferenceExecutionError(
-                    f"Batch inference failed for model '{model_name}:{version}'"
-                ) from last_error
-            else:
-                raise InferenceExecutionError(
-                    f"Batch inference failed for model '{model_name}:{version}' with unknown error"
-                )
-        
-        except ModelNotFoundError as e:
-            INFERENCE_ERRORS.labels(model_name, version, "model_not_found").inc()
-            self._job_service.mark_failed(
-                job_id,
-                error_types=type(e).__name__,
-                error_message=str(e),
+        key = await self._request_key_async(model_name, version, "run", payload)
+        cached = self._cache_lookup(key, bypass_cache)
+        if cached is not MISS:
+            if not self._cache_hits_create_jobs:
+                return cached
+            return await asyncio.to_thread(self._cache_hit, model_name, version, payload, cached)
+
+        async def run():
+            start = time.time()
+            generation = self._cache_generation(key)
+            job_id = await asyncio.to_thread(
+                self._job_service.create_job,
+                model_name=model_name,
+                model_version=version,
+                payload=payload,
+                max_attempts=max_attempts or 3,
+                max_runtime_s=max_runtime_s,
+                max_total_runtime_s=max_total_runtime_s,
+                sync=True,
             )
-            raise PredictionError(str(e)) from e
 
-    def predict_batch(
+            with self._tracked(model_name, version):
+                result = await self._run_with_existing_job_async(
+                    job_id=job_id,
+                    model_name=model_name,
+                    version=version,
+                    payload=payload,
+                    timeout_s=timeout_s,
+                    request_id=request_id,
+                    batch=False,
+                    micro_batch=True,
+                )
+            self._cache_store(key, result, generation)
+            self._mirror(model_name, version, shadow_version, "run", payload, result, start)
+            return result
+
+        return await self._coalesce_async(key, run, max_total_runtime_s or timeout_s)
+    
+    async def predict_batch_async(
         self,
         model_name: str,
         version: str,
@@ -345,29 +759,48 @@ class PredictionService:
         max_attempts: int | None = None,
         max_runtime_s: float | None = None,
         max_total_runtime_s: float | None = None,
+        bypass_cache: bool = False,
     ) -> list:
-        # Resolve routing
+        shadow_version = self._router.shadow_version(model_name, version)
         model_name, version = self._router.resolve(
             model_name,
             version,
             identity_key=request_id,
         )
 
-        # One job per batch (Phase 9A)
-        job_id = self._job_service.create_job(
-            model_name=model_name,
-            model_version=version,
-            payload=payloads,
-            max_attempts=max_attempts or 3,
-            max_runtime_s=max_runtime_s,
-            max_total_runtime_s=max_total_runtime_s,
-        )
+        key = await self._request_key_async(model_name, version, "run_batch", payloads)
+        cached = self._cache_lookup(key, bypass_cache)
+        if cached is not MISS:
+            if not self._cache_hits_create_jobs:
+                return cached
+            return await asyncio.to_thread(self._cache_hit, model_name, version, payloads, cached)
+
+        async def run():
+            start = time.time()
+            generation = self._cache_generation(key)
+            job_id = await asyncio.to_thread(
+                self._job_service.create_job,
+                model_name=model_name,
+                model_version=version,
+                payload=payloads,
+                max_attempts=max_attempts or 3,
+                max_runtime_s=max_runtime_s,
+                max_total_runtime_s=max_total_runtime_s,
+                sync=True,
+            )
+
+            with self._tracked(model_name, version):
+                results = await self._run_with_existing_job_async(
+                    job_id=job_id,
+                    model_name=model_name,
+                    version=version,
+                    payload=payloads,
+                    timeout_s=timeout_s,
+                    request_id=request_id,
+                    batch=True,
+                )
+            self._cache_store(key, results, generation)
+            self._mirror(model_name, version, shadow_version, "run_batch", payloads, results, start)
+            return results
 
-        return self._run_batch_with_existing_job(
-            job_id=job_id,
-            model_name=model_name,
-            version=version,
-            payloads=payloads,
-            timeout_s=timeout_s,
-            request_id=request_id,
-        )
\ No newline at end of file
+        return await self._coalesce_async(key, run, max_total_runtime_s or timeout_s)
@@ -0,0 +1,103 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from app.core.codecs import get_codec
+from app.core.metrics import RESULT_CACHE_REQUESTS, RESULT_CACHE_EVICTIONS, RESULT_CACHE_BYTES
+
+# Marks a lookup that found nothing (None is a valid cached result)
+MISS = object()
+
+
+class ResultCache:
+    """
+    LRU cache of inference results keyed by (model, version, method, payload hash),
+    bounded by the total encoded size of the results.
+
+    Only models listed in policy ("model:version" -> {"ttl_s": ...}) are cached.
+    Cached results are shared between callers and must not be mutated.
+
+    invalidate() starts a new generation of a model version; a result put
+    with the generation read before it ran is dropped if the version was
+    invalidated meanwhile (computed by the replaced pipeline).
+    """
+
+    def __init__(
+        self,
+        policy: Dict[str, dict],
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entry_bytes: Optional[int] = None,
+    ):
+        self._policy = policy
+        self._max_bytes = max_bytes
+        self._max_entry_bytes = max_entry_bytes if max_entry_bytes is not None else max_bytes // 16
+        self._codec = get_codec("auto")
+        # key -> (result, size, expires_at)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._generations: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def caches(self, model_name: str, version: str) -> bool:
+        return f"{model_name}:{version}" in self._policy
+
+    def get(self, key: Hashable) -> Any:
+        model_name, version = key[0], key[1]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] <= time.monotonic():
+                self._remove(key, "ttl")
+                entry = None
+            if entry is None:
+                RESULT_CACHE_REQUESTS.labels(model_name, version, "miss").inc()
+                return MISS
+            self._entries.move_to_end(key)
+        RESULT_CACHE_REQUESTS.labels(model_name, version, "hit").inc()
+        return entry[0]
+
+    def generation(self, model_name: str, version: str) -> int:
+        with self._lock:
+            return self._generations.get((model_name, version), 0)
+
+    def put(self, key: Hashable, result: Any, generation: Optional[int] = None) -> None:
+        try:
+            size = len(self._codec.encode(result))
+        except (TypeError, ValueError):
+            return  # not serializable, can't be sized
+        if size > self._max_entry_bytes:
+            return
+
+        ttl_s = self._policy[f"{key[0]}:{key[1]}"].get("ttl_s", 300)
+        with self._lock:
+            if generation is not None and generation != self._generations.get((key[0], key[1]), 0):
+                return  # invalidated while it ran
+            if key in self._entries:
+                self._remove(key, None)
+            self._entries[key] = (result, size, time.monotonic() + ttl_s)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest, "capacity")
+            RESULT_CACHE_BYTES.set(self._bytes)
+
+    def invalidate(self, model_name: str, version: str) -> None:
+        """
+        Drop every entry of one model version (e.g. after it was reloaded)
+        """
+        with self._lock:
+            self._generations[(model_name, version)] = self._generations.get((model_name, version), 0) + 1
+            stale = [k for k in self._entries if k[0] == model_name and k[1] == version]
+            for key in stale:
+                self._remove(key, "invalidated")
+            RESULT_CACHE_BYTES.set(self._bytes)
+
+    def record_bypass(self, model_name: str, version: str) -> None:
+        RESULT_CACHE_REQUESTS.labels(model_name, version, "bypass").inc()
+
+    def _remove(self, key: Hashable, reason: Optional[str]) -> None:
+        # Caller holds self._lock
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+        if reason is not None:
+            RESULT_CACHE_EVICTIONS.labels(reason).inc()
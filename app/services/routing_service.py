@@ -1,11 +1,33 @@
 import random
 import hashlib
-from typing import Tuple
+import threading
+from typing import Dict, Tuple
+
+from app.core.metrics import ROUTE_LOAD_SCORE, ROUTE_SATURATED_SKIPS, ROUTE_SWITCHES
+from app.execution.execution_policy import ExecutionPolicy
+from app.services.load_tracker import LoadTracker
+
+# Score = sum(weight * signal); lower wins
+DEFAULT_LOAD_WEIGHTS = {
+    "least_loaded": {"queue_depth": 1.0, "inflight": 1.0, "p95_ms": 0.0},
+    "latency_aware": {"queue_depth": 0.5, "inflight": 0.5, "p95_ms": 0.1},
+}
 
 class RoutingService:
-    def __init__(self, routes: dict):
+    def __init__(
+        self,
+        routes: dict,
+        execution_policy: ExecutionPolicy | None = None,
+        load_tracker: LoadTracker | None = None,
+    ):
         self._routes = routes
-    
+        self._execution_policy = execution_policy
+        self._load_tracker = load_tracker
+
+        # Load-aware routes: model -> version currently receiving traffic
+        self._current: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
     def resolve(
         self,
         model: str,
@@ -48,4 +70,76 @@ class RoutingService:
                 if bucket < acc:
                     return model, version
         
-        raise ValueError(f"Invalid routing strategy for model '{model}'")
\ No newline at end of file
+        if strategy == "shadow":
+            # Shadow only ever receives mirrored copies, see shadow_version
+            return model, route["primary"]
+        
+        if strategy in DEFAULT_LOAD_WEIGHTS:
+            return model, self._least_loaded(model, route, strategy)
+        
+        raise ValueError(f"Invalid routing strategy for model '{model}'")
+
+    def shadow_version(self, model: str, requested_version: str | None) -> str | None:
+        """
+        Version to mirror this request to, or None. Sampled per call;
+        requests pinned to an explicit version are never mirrored.
+        """
+        if requested_version:
+            return None
+        route = self._routes.get(model)
+        if not route or route["strategy"] != "shadow":
+            return None
+        if random.random() * 100 < route.get("shadow_percent", 100):
+            return route["shadow"]
+        return None
+
+    def _load_score(self, model: str, version: str, weights: dict) -> float:
+        executor = self._execution_policy.resolve(model, version)
+        p95 = self._load_tracker.latency_p95(model, version) if self._load_tracker is not None else None
+        inflight = self._load_tracker.inflight(model, version) if self._load_tracker is not None else 0
+        score = (
+            weights.get("queue_depth", 0.0) * executor.queue_depth
+            + weights.get("inflight", 0.0) * inflight
+            + weights.get("p95_ms", 0.0) * (p95 or 0.0) * 1000
+        )
+        ROUTE_LOAD_SCORE.labels(model, version).set(score)
+        return score
+
+    def _least_loaded(self, model: str, route: dict, strategy: str) -> str:
+        """
+        Pick among equivalent versions by live load, skipping versions whose
+        executor is saturated. Traffic stays on the current version until
+        another one scores better by more than the hysteresis margin.
+        """
+        versions = route["versions"]
+        if self._execution_policy is None:
+            raise ValueError(f"Routing strategy '{strategy}' for model '{model}' needs an execution policy")
+        weights = {**DEFAULT_LOAD_WEIGHTS[strategy], **route.get("weights", {})}
+
+        scores = {}
+        for version in versions:
+            if self._execution_policy.resolve(model, version).saturated:
+                ROUTE_SATURATED_SKIPS.labels(model, version).inc()
+                continue
+            scores[version] = self._load_score(model, version, weights)
+
+        with self._lock:
+            current = self._current.get(model)
+            if not scores:
+                # Everything is full: stay put and let admission control shed the load
+                return current or versions[0]
+
+            best = min(scores, key=scores.get)
+            if current in scores:
+                margin = max(
+                    route.get("hysteresis", 0.2) * scores[current],
+                    route.get("min_switch_margin", 1.0),
+                )
+                if scores[current] - scores[best] <= margin:
+                    return current
+
+            # No current version yet, its executor is saturated, or it lost by enough
+            if current is not None and current != best:
+                ROUTE_SWITCHES.labels(model, current, best).inc()
+            self._current[model] = best
+            return best
@@ -0,0 +1,220 @@
+import logging
+import math
+import threading
+import time
+from collections import deque
+from functools import partial
+from typing import Any, Deque, Dict, Tuple
+
+from app.core.cancellation import CancellationToken, ExecutionCancelledError
+from app.core.hashing import canonical_hash
+from app.core.metrics import SHADOW_DROPPED, SHADOW_LATENCY, SHADOW_REQUESTS
+from app.domain.registry.registry import ModelRegistry
+from app.execution.execution_policy import ExecutionPolicy
+from app.execution.executor import ExecutionTimeoutError, ExecutorSaturatedError, InferenceExecutor
+
+logger = logging.getLogger(__name__)
+
+
+def _percentile(samples, pct: float) -> float | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[math.ceil(pct * len(ordered)) - 1]
+
+
+class ShadowMirror:
+    """
+    Replays sampled live requests against a shadow version, fire-and-forget,
+    on its own small executor. The caller already has its response; shadow
+    runs never create jobs, touch the result cache or affect retries.
+
+    Shadow pipelines always run on that executor, never on the executor
+    serving the model: in its worker processes if it is a process executor,
+    otherwise in this process (isolated models included).
+
+    Mirroring is skipped (dropped) when shadow work is already queued, the
+    shadow executor's queue is full or the executor serving the primary
+    version is saturated: shadow work is the first thing to go under load.
+
+    In this process a run past timeout_s is stopped at its next pipeline
+    stage; a stage that hangs keeps its thread, but not the mirroring
+    behind it, which is dropped while the workers are all taken.
+    """
+
+    def __init__(
+        self,
+        registry: ModelRegistry,
+        execution_policy: ExecutionPolicy,
+        executor: InferenceExecutor,
+        timeout_s: float | None = None,
+        report_samples: int = 512,
+    ):
+        self._registry = registry
+        self._execution_policy = execution_policy
+        self._executor = executor
+        self._timeout_s = timeout_s
+        self._report_samples = report_samples
+
+        # (model, primary, shadow) -> running comparison
+        self._report: Dict[Tuple[str, str, str], dict] = {}
+        self._lock = threading.Lock()
+
+    def mirror(
+        self,
+        model_name: str,
+        primary_version: str,
+        shadow_version: str,
+        method: str,
+        payload: Any,
+        primary_result: Any,
+        primary_latency_s: float,
+    ) -> None:
+        """
+        Queue a shadow run; never blocks on or raises from the shadow side
+        """
+        if self._execution_policy.resolve(model_name, primary_version).saturated:
+            SHADOW_DROPPED.labels(model_name, shadow_version, "saturated").inc()
+            return
+        if self._executor.queue_depth:
+            # Every shadow worker is taken; don't queue behind a slow shadow run
+            SHADOW_DROPPED.labels(model_name, shadow_version, "busy").inc()
+            return
+        try:
+            self._executor.submit_background(
+                self._run,
+                model_name, primary_version, shadow_version,
+                method, payload, primary_result, primary_latency_s,
+                on_reject=partial(self._dropped, model_name, shadow_version),
+            )
+        except ExecutorSaturatedError:
+            SHADOW_DROPPED.labels(model_name, shadow_version, "queue_full").inc()
+
+    def _dropped(self, model_name: str, shadow_version: str, _error: ExecutorSaturatedError) -> None:
+        # Waited in the shadow queue past max_queue_wait_s
+        SHADOW_DROPPED.labels(model_name, shadow_version, "queue_wait").inc()
+
+    def _call(self, model_name: str, version: str, method: str, payload: Any) -> Any:
+        # Runs on a shadow executor thread
+        if self._executor.isolated:
+            return self._executor.submit_pipeline(model_name, version, method, payload, timeout_s=self._timeout_s)
+        token = CancellationToken()
+        timer = None
+        if self._timeout_s is not None:
+            timer = threading.Timer(self._timeout_s, token.cancel, ("timeout",))
+            timer.daemon = True
+            timer.start()
+        try:
+            with self._registry.lease(model_name, version) as pipeline:
+                result = getattr(pipeline, method)(payload, cancel_token=token)
+        except ExecutionCancelledError as e:
+            raise ExecutionTimeoutError("Shadow execution timed out") from e
+        finally:
+            if timer is not None:
+                timer.cancel()
+        if token.cancelled:
+            # Finished without reaching a checkpoint, but still too late
+            raise ExecutionTimeoutError("Shadow execution timed out")
+        return result
+
+    def _run(
+        self,
+        model_name: str,
+        primary_version: str,
+        shadow_version: str,
+        method: str,
+        payload: Any,
+        primary_result: Any,
+        primary_latency_s: float,
+    ) -> None:
+        start = time.time()
+        try:
+            result = self._call(model_name, shadow_version, method, payload)
+        except Exception as e:
+            latency = time.time() - start
+            SHADOW_REQUESTS.labels(model_name, shadow_version, "error").inc()
+            self._record(model_name, primary_version, shadow_version, "error", primary_latency_s, latency)
+            logger.warning(
+                "shadow_comparison",
+                extra={
+                    "model": model_name,
+                    "version": primary_version,
+                    "shadow_version": shadow_version,
+                    "outcome": "error",
+                    "error": f"{type(e).__name__}: {e}",
+                    "latency_ms": primary_latency_s * 1000,
+                    "shadow_latency_ms": latency * 1000,
+                },
+            )
+            return
+        latency = time.time() - start
+        SHADOW_LATENCY.labels(model_name, shadow_version).observe(latency)
+
+        try:
+            outcome = "match" if canonical_hash(result) == canonical_hash(primary_result) else "mismatch"
+        except (TypeError, ValueError):
+            outcome = "incomparable"
+        SHADOW_REQUESTS.labels(model_name, shadow_version, outcome).inc()
+        self._record(model_name, primary_version, shadow_version, outcome, primary_latency_s, latency)
+        logger.info(
+            "shadow_comparison",
+            extra={
+                "model": model_name,
+                "version": primary_version,
+                "shadow_version": shadow_version,
+                "outcome": outcome,
+                "latency_ms": primary_latency_s * 1000,
+                "shadow_latency_ms": latency * 1000,
+            },
+        )
+
+    def _record(
+        self,
+        model_name: str,
+        primary_version: str,
+        shadow_version: str,
+        outcome: str,
+        primary_latency_s: float,
+        shadow_latency_s: float,
+    ) -> None:
+        key = (model_name, primary_version, shadow_version)
+        with self._lock:
+            entry = self._report.get(key)
+            if entry is None:
+                entry = self._report[key] = {
+                    "outcomes": {},
+                    "primary_latency": deque(maxlen=self._report_samples),
+                    "shadow_latency": deque(maxlen=self._report_samples),
+                }
+            entry["outcomes"][outcome] = entry["outcomes"].get(outcome, 0) + 1
+            entry["primary_latency"].append(primary_latency_s)
+            if outcome != "error":
+                entry["shadow_latency"].append(shadow_latency_s)
+
+    def report(self) -> list:
+        """
+        Per (model, primary, shadow): outcome counts and latency
+        percentiles (ms) over the most recent comparisons
+        """
+        with self._lock:
+            entries = [
+                (key, dict(entry["outcomes"]), list(entry["primary_latency"]), list(entry["shadow_latency"]))
+                for key, entry in self._report.items()
+            ]
+        report = []
+        for (model_name, primary_version, shadow_version), outcomes, primary, shadow in entries:
+            total = sum(outcomes.values())
+            row = {
+                "model": model_name,
+                "version": primary_version,
+                "shadow_version": shadow_version,
+                "requests": total,
+                "outcomes": outcomes,
+                "error_rate": outcomes.get("error", 0) / total,
+            }
+            for name, samples in (("primary", primary), ("shadow", shadow)):
+                for pct in (0.5, 0.95):
+                    value = _percentile(samples, pct)
+                    row[f"{name}_p{int(pct * 100)}_ms"] = value * 1000 if value is not None else None
+            report.append(row)
+        return report
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+from concurrent.futures import CancelledError, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Tuple
+
+from app.core.metrics import SINGLE_FLIGHT_COALESCED, SINGLE_FLIGHT_INFLIGHT
+from app.execution.executor import ExecutionTimeoutError
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time. Callers arriving while a call
+    for their key is in flight wait for it and share its result or error.
+
+    Keys are (model, version, ...) tuples. Nothing is kept once a call
+    finishes; that's the result cache's job. If the leading caller goes
+    away (cancelled), one of the waiters takes over and runs the call.
+    A waiter gives up with ExecutionTimeoutError after its own timeout_s.
+    """
+
+    def __init__(self, models: Iterable[str] = ()):
+        self._models = set(models)
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def coalesces(self, model_name: str, version: str) -> bool:
+        return f"{model_name}:{version}" in self._models
+
+    def _join(self, key: Hashable) -> Tuple[Future, bool]:
+        # Returns (the call's future, whether this caller must run it)
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                return future, False
+            future = self._calls[key] = Future()
+            SINGLE_FLIGHT_INFLIGHT.set(len(self._calls))
+            return future, True
+
+    def _finish(self, key: Hashable, future: Future, result: Any = None, error: BaseException | None = None) -> None:
+        with self._lock:
+            del self._calls[key]
+            SINGLE_FLIGHT_INFLIGHT.set(len(self._calls))
+        if error is None:
+            future.set_result(result)
+        elif isinstance(error, Exception):
+            future.set_exception(error)
+        else:
+            # Leader was cancelled / interrupted: waiters retry instead of failing
+            future.cancel()
+
+    def do(self, key: Hashable, fn: Callable[[], Any], timeout_s: float | None = None) -> Any:
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                try:
+                    result = fn()
+                except BaseException as e:
+                    self._finish(key, future, error=e)
+                    raise
+                self._finish(key, future, result)
+                return result
+            try:
+                result = future.result(timeout=timeout_s)
+            except CancelledError:
+                continue
+            except FutureTimeoutError:
+                raise ExecutionTimeoutError("Inference execution timed out") from None
+            except Exception:
+                SINGLE_FLIGHT_COALESCED.labels(key[0], key[1]).inc()
+                raise
+            SINGLE_FLIGHT_COALESCED.labels(key[0], key[1]).inc()
+            return result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]], timeout_s: float | None = None) -> Any:
+        """
+        do() for event-loop callers; shares calls with do() under the same key
+        """
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                try:
+                    result = await fn()
+                except BaseException as e:
+                    self._finish(key, future, error=e)
+                    raise
+                self._finish(key, future, result)
+                return result
+            # asyncio.wait, not await: our own cancellation must not cancel the shared call
+            waiter = asyncio.wrap_future(future)
+            done, _ = await asyncio.wait({waiter}, timeout=timeout_s)
+            if not done:
+                raise ExecutionTimeoutError("Inference execution timed out")
+            if future.cancelled():
+                continue
+            SINGLE_FLIGHT_COALESCED.labels(key[0], key[1]).inc()
+            return waiter.result()
@@ -1,4 +1,4 @@
-from app.domain.models import EchoModel
+from app.domain.models import BaseModel, EchoModel
 from app.domain.processing import IdentityPreprocessor, IdentityPostprocessor
 from app.domain.pipelines import InferencePipeline
 
@@ -18,6 +18,22 @@ def main():
     output = pipeline.run({"x": 42})
     print(output)
 
+    # Models that don't call BaseModel.__init__ can still be unloaded
+    class BareModel(BaseModel):
+        def __init__(self):
+            self.weights = None
+
+        def load(self):
+            self.weights = 1
+
+        def predict(self, x):
+            return x
+
+    bare = BareModel()
+    bare.load()
+    bare.unload()
+    print("Model without BaseModel.__init__ unloaded")
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,42 @@
+import tempfile
+
+from app.adapters.http.responses import FastJSONResponse
+from app.core.codecs import CodecUnavailableError, JsonCodec, MsgpackCodec, OrjsonCodec
+from app.infra.jobs.blob_store import BlobStore
+
+# Run from the repository root: python -m tests.run_codecs
+
+# Model outputs often key scores by class index
+RESULT = {"scores": {0: 0.1, 1: 0.9}, "label": 1}
+JSON_RESULT = {"scores": {"0": 0.1, "1": 0.9}, "label": 1}
+
+
+def main():
+    ok = True
+    for codec_class, expected in ((JsonCodec, JSON_RESULT), (OrjsonCodec, JSON_RESULT), (MsgpackCodec, RESULT)):
+        try:
+            codec = codec_class()
+        except CodecUnavailableError:
+            print(f"{codec_class.name}: not installed, skipped")
+            continue
+        decoded = codec.decode(codec.encode(RESULT))
+        print(f"{codec.name}: non-str keys round-trip as {decoded}")
+        ok &= decoded == expected
+
+        # Blobs are decoded from the memory-mapped file
+        with tempfile.TemporaryDirectory() as tmp:
+            blobs = BlobStore(tmp)
+            large = {"items": list(range(50_000))}
+            loaded = blobs.load(blobs.put(codec.encode(large)), codec.decode)
+            print(f"{codec.name}: decoded from mapped blob: {loaded == large}")
+            ok &= loaded == large
+
+    body = FastJSONResponse(RESULT).body
+    print(f"HTTP response body: {body.decode()}")
+    ok &= JsonCodec().decode(body) == JSON_RESULT
+
+    print("Codecs encode non-str keys like json" if ok else "FAILED")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import os
+import tempfile
+import threading
+
+from app.infra.jobs.in_memory_job_store import InMemoryJobStore
+from app.infra.jobs.sqlite_job_store import SQLiteJobStore
+from app.infra.jobs.write_behind_job_store import WriteBehindJobStore
+from app.services.job_service import JobService
+
+# Run from the repository root: python -m tests.run_ephemeral_job_store
+
+CONCURRENT = 8
+
+
+def run_requests(jobs: JobService, count: int):
+    # Like concurrent sync predictions: every job is running at once
+    barrier = threading.Barrier(count)
+    outcomes = []
+
+    def request(i: int):
+        job_id = jobs.create_job("echo", "v1", {"x": i}, sync=True)
+        try:
+            jobs.mark_running(job_id)
+            barrier.wait(5)
+            # Finished jobs may be dropped right away; only the updates must land
+            jobs.mark_succeeded(job_id, {"echo": i})
+            outcomes.append("succeeded")
+        except KeyError as e:
+            outcomes.append(f"lost: {e}")
+
+    threads = [threading.Thread(target=request, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    return outcomes
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        backing = SQLiteJobStore(os.path.join(tmp, "jobs.db"))
+        durable = WriteBehindJobStore(backing, flush_interval_ms=60_000)
+
+        # More requests in flight than the store holds: none is dropped mid-run
+        ephemeral = InMemoryJobStore(max_jobs=2, ttl_s=300)
+        outcomes = run_requests(JobService(durable, ephemeral_store=ephemeral), CONCURRENT)
+        print(f"{CONCURRENT} concurrent requests, max_jobs=2: {outcomes}")
+        ok = outcomes == ["succeeded"] * CONCURRENT
+
+        # Once finished they count against max_jobs again
+        held = len(ephemeral._jobs)
+        print(f"jobs held once finished: {held}")
+        ok &= held == 2
+
+        # Running jobs outlive the TTL too
+        ephemeral = InMemoryJobStore(max_jobs=100, ttl_s=0)
+        outcomes = run_requests(JobService(durable, ephemeral_store=ephemeral), CONCURRENT)
+        print(f"{CONCURRENT} concurrent requests, ttl_s=0: {outcomes}")
+        ok &= outcomes == ["succeeded"] * CONCURRENT
+
+        durable.close()
+        backing.close()
+
+    print("Ephemeral job store keeps running jobs" if ok else "FAILED")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import os
+import tempfile
+import threading
+import time
+
+from app.config.jobs import JOB_STORE
+from app.execution import ExecutorSaturatedError, InferenceExecutor, MicroBatcher
+
+# Run from the repository root: python -m tests.run_executor_admission
+
+HEADERS = {"X-API-Key": "admin-key"}
+
+
+def fill(executor, release: threading.Event, workers: int, queued: int) -> None:
+    # Occupy every worker, then queue work behind them
+    for _ in range(workers + queued):
+        executor.submit_background(release.wait)
+
+
+def drain(executor, release: threading.Event) -> None:
+    release.set()
+    while executor.queue_depth or executor.busy_workers:
+        time.sleep(0.01)
+
+
+def batcher_outcome(batcher: MicroBatcher):
+    # No timeout: must still return once its batch is dropped
+    try:
+        return batcher.submit({"x": 1})
+    except ExecutorSaturatedError as e:
+        return e
+
+
+def main():
+    # A full queue rejects new work right away
+    release = threading.Event()
+    executor = InferenceExecutor(device="admission_test", max_workers=1, max_queue_depth=2, retry_after_s=3)
+    fill(executor, release, workers=1, queued=2)
+    try:
+        executor.submit(lambda: "too many")
+        rejected = None
+    except ExecutorSaturatedError as e:
+        rejected = e
+    print(f"queue depth {executor.queue_depth}, rejected: {rejected}")
+    ok = rejected is not None and rejected.retry_after_s == 3
+
+    drain(executor, release)
+    served = executor.submit(lambda: "served", timeout_s=5) == "served"
+    print(f"served once drained: {served}")
+    ok &= served
+    executor.shutdown(wait=True)
+
+    # Work dropped for waiting too long in the queue is reported, not lost
+    release = threading.Event()
+    executor = InferenceExecutor(device="admission_test", max_workers=1, max_queue_wait_s=0.05)
+    executor.submit_background(release.wait)
+    rejections = []
+    executor.submit_background(lambda: "stale", on_reject=rejections.append)
+    batcher = MicroBatcher("echo", "v1", run_batch=lambda payloads: payloads, executor=executor, max_wait_ms=1)
+    waiter = threading.Thread(target=lambda: rejections.append(batcher_outcome(batcher)))
+    waiter.start()
+    time.sleep(0.2)
+    release.set()
+    waiter.join(5)
+    print(f"queue wait rejections: {[type(r).__name__ if isinstance(r, Exception) else r for r in rejections]}")
+    ok &= len(rejections) == 2 and all(isinstance(r, ExecutorSaturatedError) for r in rejections)
+    executor.shutdown(wait=True)
+
+    # Over HTTP a saturated executor means 503 with Retry-After
+    with tempfile.TemporaryDirectory() as tmp:
+        JOB_STORE["db_path"] = os.path.join(tmp, "jobs.db")
+        JOB_STORE["blobs"] = None
+
+        from fastapi.testclient import TestClient
+        from app.adapters.http import deps
+        from app.adapters.http.app import app
+
+        with TestClient(app) as client:
+            executor = deps.get_execution_policy().resolve("echo", "v1")
+            release = threading.Event()
+            fill(executor, release, workers=executor._max_workers, queued=executor._max_queue_depth)
+            response = client.post("/predict", headers=HEADERS, json={"model": "echo", "version": "v1", "data": {"x": 1}})
+            print(f"saturated: {response.status_code}, Retry-After: {response.headers.get('Retry-After')}")
+            ok &= response.status_code == 503 and response.headers.get("Retry-After") is not None
+
+            drain(executor, release)
+            response = client.post("/predict", headers=HEADERS, json={"model": "echo", "version": "v1", "data": {"x": 1}})
+            print(f"drained: {response.status_code}")
+            ok &= response.status_code == 200
+
+    print("Admission control rejects overload with 503" if ok else "FAILED")
+
+
+if __name__ == "__main__":
+    main()
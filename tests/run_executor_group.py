@@ -0,0 +1,51 @@
+import threading
+import time
+
+from app.execution import ExecutorGroup, ExecutorSaturatedError, InferenceExecutor
+
+# Run from the repository root: python -m tests.run_executor_group
+
+
+def main():
+    preferred = InferenceExecutor(device="group_test_gpu", max_workers=1, max_queue_depth=2)
+    overflow = InferenceExecutor(device="group_test_cpu", max_workers=2, max_queue_depth=2)
+    group = ExecutorGroup("group_test", [preferred, overflow], spill_queue_depth=1)
+
+    # Idle: the preferred pool takes the work
+    ok = group._pick() is preferred
+    print(f"idle group picks the preferred pool: {ok}")
+
+    # Preferred pool busy with work queued behind it: new work spills over
+    release = threading.Event()
+    for _ in range(2):
+        preferred.submit_background(release.wait)
+    spilled = group._pick() is overflow
+    print(f"preferred queue {preferred.queue_depth}, work spills to the other pool: {spilled}")
+    ok &= spilled
+
+    # Every pool saturated: the group rejects like a single executor would
+    for _ in range(4):
+        overflow.submit_background(release.wait)
+    preferred.submit_background(release.wait)
+    try:
+        group.submit(lambda: "too many")
+        rejected = False
+    except ExecutorSaturatedError:
+        rejected = True
+    print(f"all pools saturated, rejected: {rejected and group.saturated}")
+    ok &= rejected
+
+    release.set()
+    while any(pool.queue_depth or pool.busy_workers for pool in group.pools):
+        time.sleep(0.01)
+    back = group._pick() is preferred
+    print(f"drained, back on the preferred pool: {back}")
+    ok &= back
+
+    preferred.shutdown(wait=True)
+    overflow.shutdown(wait=True)
+    print("Executor group spills over and sheds load" if ok else "FAILED")
+
+
+if __name__ == "__main__":
+    main()
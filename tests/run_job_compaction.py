@@ -0,0 +1,76 @@
+import os
+import tempfile
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from app.domain.jobs import Job, JobStatus
+from app.infra.jobs.blob_store import BlobStore
+from app.infra.jobs.compaction import JobCompactor
+from app.infra.jobs.sqlite_job_store import SQLiteJobStore, _SELECT_BLOB_REFS
+
+# Run from the repository root: python -m tests.run_job_compaction
+
+
+def new_job(age_s: float, payload) -> Job:
+    return Job(
+        id=uuid4(),
+        model_name="echo",
+        model_version="v1",
+        payload=payload,
+        status=JobStatus.CREATED,
+        device="cpu",
+        created_at=datetime.utcnow() - timedelta(seconds=age_s),
+        sync=True,
+    )
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        # grace_s=0: orphaned blobs can go on the first sweep
+        blobs = BlobStore(root=os.path.join(tmp, "blobs"), min_bytes=1024, grace_s=0)
+        store = SQLiteJobStore(os.path.join(tmp, "jobs.db"), blob_store=blobs)
+
+        incremental = store._conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        print(f"new database uses incremental vacuum: {incremental}")
+        ok = incremental
+
+        plan = " ".join(row[3] for row in store._conn.execute(f"EXPLAIN QUERY PLAN {_SELECT_BLOB_REFS}"))
+        indexed = "idx_jobs_payload_blob" in plan and "idx_jobs_result_blob" in plan
+        print(f"blob sweep reads the blob indexes: {indexed}")
+        ok &= indexed
+
+        old, fresh = [], []
+        for i in range(20):
+            big = {"i": i, "data": "x" * 4096}  # stored as a blob
+            for age_s, jobs in ((7200, old), (0, fresh)):
+                job = new_job(age_s, big if i % 2 else {"i": i})
+                store.create(job)
+                store.update_result(job.id, {"echo": job.payload}, finished_at=datetime.utcnow())
+                jobs.append(job.id)
+        store.create(new_job(7200, {"i": "still running"}))
+
+        compactor = JobCompactor(store, max_age_s={"sync:*": 3600}, chunk_size=7)
+        deleted = compactor.run_once()
+        print(f"expired jobs deleted: {deleted}/{len(old)}")
+        ok &= deleted == len(old)
+
+        # Fresh jobs share their blobs with the deleted ones: all must still load
+        readable = all(store.get(job_id).payload["i"] == i for i, job_id in enumerate(fresh))
+        print(f"fresh jobs still readable: {readable}")
+        ok &= readable
+
+        for job_id in fresh:
+            store.update_result(job_id, {"echo": "small"}, finished_at=datetime.utcnow())
+        store.delete_expired(JobStatus.SUCCEEDED, True, datetime.utcnow() + timedelta(seconds=1), 100)
+        swept = store.sweep_blobs()
+        left = sum(len(files) for _, _, files in os.walk(os.path.join(tmp, "blobs")))
+        print(f"orphaned blobs swept: {swept}, left: {left}")
+        ok &= swept > 0 and left == 0
+
+        store.close()
+
+    print("Compaction deletes expired jobs and their blobs" if ok else "FAILED")
+
+
+if __name__ == "__main__":
+    main()
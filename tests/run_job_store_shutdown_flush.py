@@ -0,0 +1,58 @@
+import asyncio
+import os
+import tempfile
+from datetime import datetime
+from uuid import uuid4
+
+from app.config.jobs import JOB_STORE
+from app.domain.jobs import Job, JobStatus
+from app.infra.jobs.sqlite_job_store import SQLiteJobStore
+
+# Run from the repository root: python -m tests.run_job_store_shutdown_flush
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "jobs.db")
+        JOB_STORE["db_path"] = db_path
+        JOB_STORE["blobs"] = None
+        # Nothing is flushed on its own: only shutdown can write these jobs
+        JOB_STORE["write_behind"] = {"flush_interval_ms": 60_000, "max_batch_size": 10_000}
+
+        from app.adapters.http import deps
+        from app.adapters.http.app import app
+
+        jobs = []
+
+        async def serve():
+            async with app.router.lifespan_context(app):
+                store = deps.get_job_store()
+                for _ in range(50):
+                    job = Job(
+                        id=uuid4(),
+                        model_name="echo",
+                        model_version="v1",
+                        payload={"x": 1},
+                        status=JobStatus.CREATED,
+                        device="cpu",
+                        created_at=datetime.utcnow(),
+                    )
+                    store.create(job)
+                    store.update_status(job.id, JobStatus.RUNNING, started_at=datetime.utcnow())
+                    store.update_result(job.id, {"echo": {"x": 1}}, finished_at=datetime.utcnow())
+                    jobs.append(job.id)
+
+        asyncio.run(serve())
+
+        # A fresh connection sees what reached the file
+        reader = SQLiteJobStore(db_path)
+        statuses = [reader.get(job_id).status for job_id in jobs]
+        reader.close()
+
+    flushed = sum(status == JobStatus.SUCCEEDED for status in statuses)
+    print(f"jobs flushed on shutdown: {flushed}/{len(jobs)}")
+    print("Job store flushed on shutdown" if flushed == len(jobs) else "FAILED")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import threading
+from contextlib import ExitStack
+
+from app.execution import InferenceExecutor
+from app.execution.execution_policy import ExecutionPolicy
+from app.services.load_tracker import LoadTracker
+from app.services.routing_service import RoutingService
+
+# Run from the repository root: python -m tests.run_load_aware_routing
+
+ROUTE = {
+    "strategy": "least_loaded",
+    "versions": ["v1", "v2"],
+    "hysteresis": 0.2,
+    "min_switch_margin": 1.0,
+}
+
+
+def main():
+    first = InferenceExecutor(device="route_test_a", max_workers=1, max_queue_depth=2)
+    second = InferenceExecutor(device="route_test_b", max_workers=1, max_queue_depth=2)
+    policy = ExecutionPolicy(
+        executors={"a": first, "b": second},
+        policy={"embedder:v1": "a", "embedder:v2": "b"},
+        default="a",
+    )
+    tracker = LoadTracker()
+    router = RoutingService({"embedder": ROUTE}, execution_policy=policy, load_tracker=tracker)
+
+    def route() -> str:
+        return router.resolve("embedder", None, identity_key=None)[1]
+
+    ok = route() == "v1"
+    print(f"idle: {route()}")
+
+    with ExitStack() as stack:
+        # One request in flight on v1 is within the switch margin: no flapping
+        stack.enter_context(tracker.track("embedder", "v1"))
+        stays = route() == "v1"
+        print(f"v1 slightly busier, stays on: {route()}")
+        ok &= stays
+
+        # Clearly busier: traffic moves to v2
+        for _ in range(3):
+            stack.enter_context(tracker.track("embedder", "v1"))
+        switched = route() == "v2"
+        print(f"v1 much busier, switched to: {route()}")
+        ok &= switched
+
+    # v2's executor is saturated: it is skipped whatever its score
+    release = threading.Event()
+    for _ in range(3):
+        second.submit_background(release.wait)
+    skipped = second.saturated and route() == "v1"
+    print(f"v2 saturated, routed to: {route()}")
+    ok &= skipped
+    release.set()
+
+    first.shutdown(wait=True)
+    second.shutdown(wait=True)
+    print("Load-aware routing follows load with hysteresis" if ok else "FAILED")
+
+
+if __name__ == "__main__":
+    main()
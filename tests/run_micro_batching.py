@@ -0,0 +1,79 @@
+import threading
+import time
+
+from app.core.cancellation import CancellationToken, ExecutionCancelledError
+from app.execution import ExecutionTimeoutError, InferenceExecutor, MicroBatcher
+
+def main():
+    batch_sizes = []
+
+    def run_batch(payloads):
+        batch_sizes.append(len(payloads))
+        if "bad" in payloads:
+            raise ValueError("Bad input")
+        return [{"echo": p} for p in payloads]
+
+    batcher = MicroBatcher(
+        model_name="echo",
+        version="v1",
+        run_batch=run_batch,
+        executor=InferenceExecutor(device="cpu", max_workers=2),
+        max_batch_size=8,
+        max_wait_ms=20,
+    )
+
+    results = {}
+
+    def call(payload):
+        try:
+            results[payload] = batcher.submit(payload, timeout_s=2.0)
+        except ValueError as e:
+            results[payload] = f"error: {e}"
+
+    payloads = [f"x{i}" for i in range(7)] + ["bad"]
+    threads = [threading.Thread(target=call, args=(p,)) for p in payloads]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    print(results)
+    print(f"Batch sizes: {batch_sizes}")
+
+    if results["bad"] == "error: Bad input" and results["x0"] == {"echo": "x0"}:
+        print("Per-caller results and errors isolated successfully")
+
+    def slow_batch(payloads):
+        time.sleep(0.3)
+        return [{"echo": p} for p in payloads]
+
+    slow = MicroBatcher(
+        model_name="echo",
+        version="v1",
+        run_batch=slow_batch,
+        executor=InferenceExecutor(device="cpu", max_workers=2),
+        max_wait_ms=1,
+    )
+
+    # Cancelled while its batch is already running: the result is dropped
+    token = CancellationToken()
+    threading.Timer(0.1, token.cancel, args=("job cancelled",)).start()
+    try:
+        outcome = slow.submit("late", timeout_s=2.0, cancel_token=token)
+    except ExecutionCancelledError as e:
+        outcome = f"cancelled: {e}"
+    print(f"Cancelled while running: {outcome}")
+
+    # No token: a timeout still surfaces as a timeout
+    try:
+        timeout_outcome = slow.submit("no-token", timeout_s=0.05)
+    except ExecutionTimeoutError:
+        timeout_outcome = "timed out"
+    print(f"Without a token: {timeout_outcome}")
+
+    if outcome.startswith("cancelled") and timeout_outcome == "timed out":
+        print("Cancellation drops results of running batches")
+
+
+if __name__ == "__main__":
+    main()
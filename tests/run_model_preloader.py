@@ -0,0 +1,38 @@
+from app.core.lifecycle import Readiness
+from app.domain.registry import ModelRegistry
+from app.execution.execution_policy import ExecutionPolicy
+from app.execution.process_executor import ProcessInferenceExecutor
+from app.services.model_preloader import ModelPreloader
+
+# Run from the repository root: python -m tests.run_model_preloader
+
+
+def main():
+    executor = ProcessInferenceExecutor(device="cpu_process_test", max_workers=2)
+    policy = ExecutionPolicy(executors={"process": executor}, policy={}, default="process")
+    readiness = Readiness()
+    preloader = ModelPreloader(
+        ModelRegistry(),
+        policy,
+        # No warmup samples: the workers must still be started and build the model
+        models={"echo:v1": {"required": True}},
+        readiness=readiness,
+    )
+    ok = not readiness.ready
+    print(f"not ready before preload: {ok}")
+
+    preloader.run()
+    ready = readiness.ready
+    print(f"ready after preload: {ready}")
+    ok &= ready
+
+    workers = [p for p in executor._workers[executor._pool].processes if p.is_alive()]
+    print(f"workers started: {len(workers)}/2")
+    ok &= len(workers) == 2
+
+    executor.shutdown(wait=True)
+    print("Preloader starts every worker before reporting ready" if ok else "FAILED")
+
+
+if __name__ == "__main__":
+    main()
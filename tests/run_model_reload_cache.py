@@ -0,0 +1,54 @@
+import time
+
+from app.domain.registry import ModelRegistry
+from app.execution.execution_policy import ExecutionPolicy
+from app.execution.process_executor import ProcessInferenceExecutor
+from app.services.model_reloader import ModelReloader
+from app.services.result_cache import MISS, ResultCache
+
+# Run from the repository root: python -m tests.run_model_reload_cache
+
+KEY = ("echo", "v1", "run", "payload-hash")
+
+
+def wait_reloaded(reloader: ModelReloader) -> str:
+    while reloader.status("echo", "v1")["state"] == "loading":
+        time.sleep(0.05)
+    return reloader.status("echo", "v1")["state"]
+
+
+def main():
+    cache = ResultCache({"echo:v1": {"ttl_s": 300}})
+    registry = ModelRegistry()
+    registry.add_load_listener(cache.invalidate)
+
+    # A result computed before a reload must not be served after it
+    executor = ProcessInferenceExecutor(device="cpu_reload_test", max_workers=1)
+    policy = ExecutionPolicy(executors={"process": executor}, policy={}, default="process")
+    reloader = ModelReloader(registry, policy, warmup={})
+    cache.put(KEY, {"echo": "old"})
+    reloader.reload("echo", "v1")
+    state = wait_reloaded(reloader)
+    dropped = cache.get(KEY) is MISS
+    print(f"isolated reload {state}, cached result dropped: {dropped}")
+    ok = state == "swapped" and dropped
+    executor.shutdown(wait=True)
+
+    # A result from the old pipeline finishing after the invalidation isn't stored
+    generation = cache.generation("echo", "v1")
+    cache.invalidate("echo", "v1")
+    cache.put(KEY, {"echo": "old"}, generation)
+    stale_dropped = cache.get(KEY) is MISS
+    print(f"result computed across the reload stored: {not stale_dropped}")
+    ok &= stale_dropped
+
+    cache.put(KEY, {"echo": "new"}, cache.generation("echo", "v1"))
+    stored = cache.get(KEY) == {"echo": "new"}
+    print(f"result of the new pipeline stored: {stored}")
+    ok &= stored
+
+    print("Reloads invalidate cached results" if ok else "FAILED")
+
+
+if __name__ == "__main__":
+    main()
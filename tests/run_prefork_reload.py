@@ -0,0 +1,37 @@
+import os
+import tempfile
+
+from app.config.jobs import JOB_STORE
+
+# Run from the repository root: python -m tests.run_prefork_reload
+
+HEADERS = {"X-API-Key": "admin-key"}
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        JOB_STORE["db_path"] = os.path.join(tmp, "jobs.db")
+        JOB_STORE["blobs"] = None
+
+        from fastapi.testclient import TestClient
+        from app.adapters.http import deps
+        from app.adapters.http.app import app
+
+        # Single process: reloads are applied
+        with TestClient(app) as client:
+            response = client.post("/admin/models/echo/v1/reload", headers=HEADERS)
+            print(f"single process reload: {response.status_code}")
+            ok = response.status_code == 202
+
+        # As in a pre-forked worker: refused, it would reach only this worker
+        deps.reset_after_fork(run_singletons=False)
+        with TestClient(app) as client:
+            response = client.post("/admin/models/echo/v1/reload", headers=HEADERS)
+            print(f"pre-forked worker reload: {response.status_code} {response.json()['detail']}")
+            ok &= response.status_code == 501
+
+    print("Runtime reloads are refused in pre-forked workers" if ok else "FAILED")
+
+
+if __name__ == "__main__":
+    main()
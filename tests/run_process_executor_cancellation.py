@@ -0,0 +1,80 @@
+import os
+import threading
+import time
+
+from app.domain.models import EchoModel
+from app.domain.pipelines import InferencePipeline
+from app.domain.processing import IdentityPreprocessor, BasePostprocessor
+from app.execution import ExecutionTimeoutError
+from app.execution.process_executor import ProcessInferenceExecutor
+
+# Run from the repository root: python -m tests.run_process_executor_cancellation
+
+
+class SleepPostprocessor(BasePostprocessor):
+    def transform(self, model_output):
+        time.sleep(model_output["echo"].get("sleep", 0))
+        return {"pid": os.getpid(), **model_output}
+
+
+def build_slow_pipeline() -> InferencePipeline:
+    model = EchoModel()
+    model.load()
+    return InferencePipeline(
+        preprocessor=IdentityPreprocessor(),
+        model=model,
+        postprocessor=SleepPostprocessor(),
+    )
+
+
+def call_with_deadline(fn, deadline_s: float):
+    # Returns (finished, result or exception); a hang shows up as finished=False
+    outcome = {}
+
+    def run():
+        try:
+            outcome["result"] = fn()
+        except Exception as e:
+            outcome["result"] = e
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(deadline_s)
+    return not thread.is_alive(), outcome.get("result")
+
+
+def main():
+    executor = ProcessInferenceExecutor(device="cpu_process_test", max_workers=2, retire_grace_s=5.0)
+    executor.recycle(definitions={"slow:v1": "tests.run_process_executor_cancellation:build_slow_pipeline"})
+
+    ok = True
+    for attempt in range(3):
+        finished, result = call_with_deadline(
+            lambda: executor.submit_pipeline("slow", "v1", "run", {"sleep": 2}, timeout_s=0.5),
+            deadline_s=5,
+        )
+        timed_out = finished and isinstance(result, ExecutionTimeoutError)
+        print(f"attempt {attempt}: timed out as expected: {timed_out}")
+        ok &= timed_out
+
+        # The executor must keep serving right after a timeout
+        finished, result = call_with_deadline(
+            lambda: executor.submit_pipeline("slow", "v1", "run", {"sleep": 0}, timeout_s=5),
+            deadline_s=10,
+        )
+        served = finished and isinstance(result, dict)
+        print(f"attempt {attempt}: next request served: {served} {result!r}")
+        ok &= served
+
+    # Old pools are retired, never more than max_retiring_pools + the live one
+    time.sleep(1)
+    pools = len(executor._workers)
+    print(f"pools alive: {pools}")
+    ok &= pools <= 2
+
+    executor.shutdown(wait=True)
+    print("Process executor survives timeouts without deadlocking" if ok else "FAILED")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from app.core.metrics import SHADOW_DROPPED
+from app.domain.registry import ModelRegistry
+from app.execution import InferenceExecutor
+from app.execution.execution_policy import ExecutionPolicy
+from app.execution.process_executor import ProcessInferenceExecutor
+from app.services.shadow_traffic import ShadowMirror
+
+# Run from the repository root: python -m tests.run_shadow_traffic
+
+
+def wait_for_report(mirror: ShadowMirror, requests: int, deadline_s: float = 10.0) -> list:
+    deadline = time.time() + deadline_s
+    while time.time() < deadline:
+        report = mirror.report()
+        if report and report[0]["requests"] >= requests:
+            return report
+        time.sleep(0.05)
+    return mirror.report()
+
+
+class HangingPipeline:
+    """
+    Stands in for a shadow model stuck until released; checks for
+    cancellation like pipeline stages do
+    """
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def run(self, payload, cancel_token=None):
+        while not self.release.wait(0.01):
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+        return payload
+
+
+class HangingRegistry:
+    def __init__(self, pipeline: HangingPipeline):
+        self._pipeline = pipeline
+
+    @contextmanager
+    def lease(self, model_name: str, version: str):
+        yield self._pipeline
+
+
+def dropped(reason: str) -> float:
+    return SHADOW_DROPPED.labels("hang", "v2", reason)._value.get()
+
+
+def main():
+    registry = ModelRegistry()
+    # echo is served by an isolated (process) executor; shadow runs have their own
+    serving = ProcessInferenceExecutor(device="cpu_process_test", max_workers=1)
+    shadow = InferenceExecutor(device="shadow_test", max_workers=1, max_queue_depth=4)
+    policy = ExecutionPolicy(executors={"process": serving}, policy={}, default="process")
+    mirror = ShadowMirror(registry, policy, shadow, timeout_s=5.0)
+
+    payload = {"x": 1}
+    with registry.lease("echo", "v1") as pipeline:
+        primary_result = pipeline.run(payload)
+    for i in range(3):
+        mirror.mirror("echo", "v1", "v2", "run", payload, primary_result, 0.001)
+        report = wait_for_report(mirror, i + 1)
+    print(f"shadow report: {report}")
+    ok = bool(report) and report[0]["requests"] == 3 and "error" not in report[0]["outcomes"]
+
+    # Shadow runs never started the serving executor's workers
+    spawned = len(serving._workers[serving._pool].processes)
+    print(f"serving executor workers started by shadow traffic: {spawned}")
+    ok &= spawned == 0
+
+    shadow.shutdown(wait=True)
+    serving.shutdown(wait=True)
+
+    # A shadow run past its timeout is stopped and counted as an error
+    hanging = HangingPipeline()
+    shadow = InferenceExecutor(device="shadow_hang_test", max_workers=1, max_queue_depth=4)
+    local = InferenceExecutor(device="local_test", max_workers=1)
+    policy = ExecutionPolicy(executors={"local": local}, policy={}, default="local")
+    mirror = ShadowMirror(HangingRegistry(hanging), policy, shadow, timeout_s=0.2)
+    start = time.time()
+    mirror.mirror("hang", "v1", "v2", "run", payload, payload, 0.001)
+    report = wait_for_report(mirror, 1)
+    timed_out = bool(report) and report[0]["outcomes"] == {"error": 1}
+    print(f"hung shadow run stopped after {time.time() - start:.1f}s: {timed_out}")
+    ok &= timed_out
+
+    # While the shadow worker is taken, mirrors are dropped instead of queued
+    mirror = ShadowMirror(HangingRegistry(hanging), policy, shadow, timeout_s=None)
+    before = dropped("busy")
+    for _ in range(5):
+        mirror.mirror("hang", "v1", "v2", "run", payload, payload, 0.001)
+    time.sleep(0.1)
+    queued = shadow.queue_depth
+    print(f"shadow worker stuck: {dropped('busy') - before:.0f} of 5 mirrors dropped, {queued} queued")
+    ok &= queued <= 1 and dropped("busy") - before >= 3
+
+    hanging.release.set()
+    shadow.shutdown(wait=True)
+    local.shutdown(wait=True)
+
+    print("Shadow traffic runs on the shadow executor only" if ok else "FAILED")
+
+
+if __name__ == "__main__":
+    main()
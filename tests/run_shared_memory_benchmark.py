@@ -0,0 +1,79 @@
+"""
+Pickle vs shared-memory transport for buffer payloads sent to a worker process.
+Each round trip sends one payload and gets its size back.
+"""
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from app.execution.shared_memory import SharedMemoryTransport, WorkerBuffers
+
+SIZES = [1_000, 100_000, 1_000_000, 10_000_000, 100_000_000]
+ROUNDS = 10
+
+_buffers = None
+
+
+def _init(min_bytes):
+    global _buffers
+    _buffers = WorkerBuffers(min_bytes=min_bytes)
+
+
+def _touch(payload):
+    view = memoryview(payload)
+    return view.nbytes
+
+
+def _touch_shared(payload):
+    return _touch(_buffers.open(payload))
+
+
+def _make_payload(nbytes):
+    try:
+        import numpy
+        return numpy.ones(nbytes // 4, dtype=numpy.float32)
+    except ImportError:
+        return bytes(nbytes)
+
+
+def _bench(fn):
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn()
+    return (time.perf_counter() - start) / ROUNDS * 1000
+
+
+def main():
+    min_bytes = 1
+    transport = SharedMemoryTransport(min_bytes=min_bytes)
+    pool = ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init,
+        initargs=(min_bytes,),
+    )
+
+    def via_pickle(payload):
+        return pool.submit(_touch, payload).result()
+
+    def via_shared_memory(payload):
+        packed, leases = transport.pack(payload)
+        try:
+            return pool.submit(_touch_shared, packed).result()
+        finally:
+            transport.release(leases)
+
+    print(f"{'payload':>10} {'pickle ms':>10} {'shm ms':>10} {'speedup':>8}")
+    for size in SIZES:
+        payload = _make_payload(size)
+        pickle_ms = _bench(lambda: via_pickle(payload))
+        shm_ms = _bench(lambda: via_shared_memory(payload))
+        print(f"{size:>10} {pickle_ms:>10.3f} {shm_ms:>10.3f} {pickle_ms / shm_ms:>7.1f}x")
+
+    pool.shutdown()
+    transport.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import asyncio
+import threading
+import time
+
+from app.execution import ExecutionTimeoutError
+from app.services.single_flight import SingleFlight
+
+# Run from the repository root: python -m tests.run_single_flight
+
+KEY = ("echo", "v1", "run", "payload-hash")
+
+
+def slow_call(calls: list, delay_s: float = 1.0):
+    def fn():
+        calls.append(1)
+        time.sleep(delay_s)
+        return {"echo": 1}
+    return fn
+
+
+def main():
+    flight = SingleFlight(models=["echo:v1"])
+    ok = flight.coalesces("echo", "v1") and not flight.coalesces("echo", "v2")
+    print(f"only opted-in models coalesce: {ok}")
+
+    # Followers share the leader's single execution
+    calls, results = [], []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do(KEY, slow_call(calls))))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    shared = len(calls) == 1 and results == [{"echo": 1}] * 5
+    print(f"5 callers, executions: {len(calls)}, all got the result: {shared}")
+    ok &= shared
+
+    # A follower stops waiting at its own deadline; the leader carries on
+    calls, outcome = [], {}
+    leader = threading.Thread(target=lambda: outcome.setdefault("leader", flight.do(KEY, slow_call(calls))))
+    leader.start()
+    time.sleep(0.1)
+    start = time.time()
+    try:
+        flight.do(KEY, slow_call(calls), timeout_s=0.2)
+        outcome["follower"] = "served"
+    except ExecutionTimeoutError:
+        outcome["follower"] = "timed out"
+    waited = time.time() - start
+    leader.join()
+    bounded = outcome == {"leader": {"echo": 1}, "follower": "timed out"} and waited < 0.5
+    print(f"sync follower {outcome['follower']} after {waited:.2f}s, leader served: {bounded}")
+    ok &= bounded
+
+    async def async_follower():
+        leader = asyncio.create_task(asyncio.to_thread(flight.do, KEY, slow_call(calls)))
+        await asyncio.sleep(0.1)
+        start = time.time()
+        try:
+            await flight.do_async(KEY, lambda: asyncio.sleep(0), timeout_s=0.2)
+            timed_out = False
+        except ExecutionTimeoutError:
+            timed_out = True
+        waited = time.time() - start
+        return timed_out and waited < 0.5 and await leader == {"echo": 1}
+
+    bounded = asyncio.run(async_follower())
+    print(f"async follower timed out, leader served: {bounded}")
+    ok &= bounded
+
+    print("Single flight coalesces and bounds waiters" if ok else "FAILED")
+
+
+if __name__ == "__main__":
+    main()
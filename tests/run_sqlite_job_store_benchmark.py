@@ -0,0 +1,67 @@
+"""
+Job throughput of SQLiteJobStore with 1, 8 and 64 concurrent writer threads.
+Each job is created, marked running and marked succeeded, like a sync /predict.
+"""
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+from uuid import uuid4
+
+from app.domain.jobs import Job, JobStatus
+from app.infra.jobs.sqlite_job_store import SQLiteJobStore
+
+WRITERS = [1, 8, 64]
+JOBS_PER_RUN = 2000
+
+MODES = {
+    "rollback journal, synchronous=full": {"journal_mode": "delete", "synchronous": "full"},
+    "wal, synchronous=normal": {"journal_mode": "wal", "synchronous": "normal"},
+}
+
+
+def _run_job(store):
+    job = Job(
+        id=uuid4(),
+        model_name="echo",
+        model_version="v1",
+        payload={"x": 1},
+        status=JobStatus.CREATED,
+        device="cpu",
+        created_at=datetime.utcnow(),
+    )
+    store.create(job)
+    store.update_status(job.id, JobStatus.RUNNING, started_at=datetime.utcnow())
+    store.update_result(job.id, {"echo": {"x": 1}}, finished_at=datetime.utcnow())
+
+
+def _bench(options, writers):
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteJobStore(os.path.join(tmp, "jobs.db"), **options)
+        per_writer = JOBS_PER_RUN // writers
+
+        def writer():
+            for _ in range(per_writer):
+                _run_job(store)
+
+        threads = [threading.Thread(target=writer) for _ in range(writers)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+        store.close()
+        return per_writer * writers / elapsed
+
+
+def main():
+    print(f"{'mode':<38}" + "".join(f"{f'{n} writers':>14}" for n in WRITERS))
+    for name, options in MODES.items():
+        rates = [_bench(options, n) for n in WRITERS]
+        print(f"{name:<38}" + "".join(f"{rate:>10.0f}/s  " for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
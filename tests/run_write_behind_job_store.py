@@ -0,0 +1,89 @@
+import os
+import tempfile
+from datetime import datetime
+from uuid import uuid4
+
+from app.domain.jobs import Job, JobStatus
+from app.infra.jobs.sqlite_job_store import SQLiteJobStore
+from app.infra.jobs.write_behind_job_store import WriteBehindJobStore
+
+# Run from the repository root: python -m tests.run_write_behind_job_store
+
+
+def new_job() -> Job:
+    return Job(
+        id=uuid4(),
+        model_name="echo",
+        model_version="v1",
+        payload={"x": 1},
+        status=JobStatus.CREATED,
+        device="cpu",
+        created_at=datetime.utcnow(),
+    )
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "jobs.db")
+        backing = SQLiteJobStore(db_path)
+        # Two workers' buffers over one database; flushed only when asked
+        first = WriteBehindJobStore(SQLiteJobStore(db_path), flush_interval_ms=60_000)
+        second = WriteBehindJobStore(SQLiteJobStore(db_path), flush_interval_ms=60_000)
+
+        # Transitions are buffered, then written in one go
+        job = new_job()
+        first.create(job)
+        first.update_status(job.id, JobStatus.RUNNING, started_at=datetime.utcnow())
+        first.update_result(job.id, {"echo": 1}, finished_at=datetime.utcnow())
+        buffered = backing_missing(backing, job.id)
+        first.flush()
+        written = backing.get(job.id)
+        ok = buffered and written.status == JobStatus.SUCCEEDED and written.result == {"echo": 1}
+        print(f"buffered until flush, then written: {ok}")
+
+        # One worker cancels; another still holds the job as running
+        job = new_job()
+        first.create(job)
+        first.flush()
+        second.update_status(job.id, JobStatus.RUNNING, started_at=datetime.utcnow())
+        first.update_error(job.id, "JobCancelled", "Cancelled", finished_at=datetime.utcnow())
+        first.flush()
+        first.update_status(job.id, JobStatus.CANCELLED, finished_at=datetime.utcnow())
+        first.flush()
+        second.flush()
+        status = backing.get(job.id).status
+        kept = status == JobStatus.CANCELLED
+        print(f"stale running write after cancel, stored status: {status.value}")
+        ok &= kept
+
+        # A result the codec can't encode must not hold back other jobs
+        bad, good = new_job(), new_job()
+        for job in (bad, good):
+            first.create(job)
+        first.update_result(bad.id, {"unencodable": {1, 2}}, finished_at=datetime.utcnow())
+        first.update_result(good.id, {"echo": 1}, finished_at=datetime.utcnow())
+        first.flush()
+        later = new_job()
+        first.create(later)
+        first.flush()
+        stored = [backing.get(job.id).status for job in (bad, good, later)]
+        print(f"unencodable / good / later job stored as: {[s.value for s in stored]}")
+        ok &= stored == [JobStatus.FAILED, JobStatus.SUCCEEDED, JobStatus.CREATED]
+
+        first.close()
+        second.close()
+        backing.close()
+
+    print("Write-behind store keeps finished jobs finished" if ok else "FAILED")
+
+
+def backing_missing(store: SQLiteJobStore, job_id) -> bool:
+    try:
+        store.get(job_id)
+    except KeyError:
+        return True
+    return False
+
+
+if __name__ == "__main__":
+    main()